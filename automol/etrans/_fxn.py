@@ -27,9 +27,9 @@ def troe_lj_collision_frequency(eps, sig, red_mass, temp):
     """
 
     # Convert LJ params to SI units
-    eps *= phycon.EH2J
-    sig *= phycon.BOHR2M
-    red_mass *= phycon.AMU2KG
+    eps = numpy.multiply(eps, phycon.EH2J)
+    sig = numpy.multiply(sig, phycon.BOHR2M)
+    red_mass = numpy.multiply(red_mass, phycon.AMU2KG)
 
     # Create a k_B*T constant since it is in both terms
     kbt = phycon.KB * temp
@@ -2,6 +2,7 @@
     energy transfer parameters: sigma, epsilon, and alpha
 """
 
+import functools
 import itertools
 import numpy
 from phydat import phycon
@@ -28,122 +29,157 @@ def alpha(n_eff, eps, sig, mass1, mass2, collider_set,
         :type zlj_dct: dict[float: float]
         :param empirical_factor: correction for using 1DME versus 2DM2
         :type empirical_factor: float
+        :return: the alpha and n parameters of the e-down model, or None if
+            there are no estimation coefficients for the collider set
     """
 
-    # Calculate the Lennard-Jones frequencies
-    red_mass = ((mass1 * mass2) / (mass1 + mass2))
+    edown_alphas, edown_ns = alphas(
+        (n_eff,), (eps,), (sig,), (mass1,), (mass2,), (collider_set,),
+        empirical_factor=empirical_factor)
 
-    # Calculate Zalpha(Neff) at T = 300, 1000, 2000 K
-    z_alphas_n_eff = _calculate_z_alpha_terms(n_eff, collider_set)
-
-    # Calculate alpha = Zalpha(Neff) / Z(N) at T = 300, 1000, 2000 K
-    # Empirical correction factor of (1/2) used for 1D Master Equations
-    alpha_dct = {}
-    for temp, z_alpha_n_eff in z_alphas_n_eff.items():
-        zlj = troe_lj_collision_frequency(eps, sig, red_mass, temp)
-        zlj *= 100**3  # conv. m^3/s to cm^3/ for below
-        alpha_dct[temp] = (z_alpha_n_eff / zlj) / empirical_factor
-
-    # Determine alpha and n for the e-down model
-    edown_alpha, edown_n = _calculate_energy_down_exponent(alpha_dct)
+    # Return None if there are no estimation coefficients for the colliders
+    if numpy.isnan(edown_alphas[0]):
+        edown_alpha, edown_n = None, None
+    else:
+        edown_alpha, edown_n = float(edown_alphas[0]), float(edown_ns[0])
 
     return edown_alpha, edown_n
 
 
-def _calculate_z_alpha_terms(n_eff, collider_set):
-    """ Calculate the [Z*alpha](N_eff)
+def alphas(n_effs, epss, sigs, mass1s, mass2s, collider_sets,
+           empirical_factor=2.0):
+    """ Calculate the alpha params for many species at once, using the
+        method Jasper, et al.
+
+        The arguments are broadcast together. Species with no estimation
+        coefficients for their collider set get NaN.
+
+        :param n_effs: number of effective rotors of each species
+        :type n_effs: numpy.ndarray
+        :param epss: Lennard-Jones epsilons (hartree)
+        :type epss: numpy.ndarray
+        :param sigs: Lennard-Jones sigmas (bohr)
+        :type sigs: numpy.ndarray
+        :param mass1s: masses of the targets (amu)
+        :param mass2s: masses of the baths (amu)
+        :param collider_sets: collider set of each species, or one for all
+        :type collider_sets: frozenset or tuple(frozenset)
+        :param empirical_factor: correction for using 1DME versus 2DM2
+        :type empirical_factor: float
+        :return: the alpha and n parameters of the e-down model
+        :rtype: (numpy.ndarray, numpy.ndarray)
     """
 
-    def _z_alpha(n_eff, coeffs):
-        """ calculate an effective Z*alpha parameter
-        """
-        return ((coeffs[0] * n_eff**(3) +
-                 coeffs[1] * n_eff**(2) +
-                 coeffs[2] * n_eff**(1) +
-                 coeffs[3]) / 1.0e9)
+    collider_sets = _collider_set_array(collider_sets, numpy.shape(n_effs))
+    n_effs, epss, sigs, mass1s, mass2s, collider_sets = (
+        numpy.broadcast_arrays(n_effs, epss, sigs, mass1s, mass2s,
+                               collider_sets))
+    red_masses = (mass1s * mass2s) / (mass1s + mass2s)
+
+    edown_alphas = numpy.full(n_effs.shape, numpy.nan)
+    edown_ns = numpy.full(n_effs.shape, numpy.nan)
+    for collider_set, idxs in _group_indices(collider_sets).items():
+        coeff_dct = Z_ALPHA_EST_DCT.get(collider_set, None)
+        if coeff_dct is None:
+            continue
+
+        assert 300 in coeff_dct, (
+            'Must have 300 K in alphas'
+        )
+
+        # Calculate alpha = Zalpha(Neff) / Z(N) for each species (rows) at
+        # each temperature (columns)
+        temps = numpy.array(list(coeff_dct.keys()), dtype=numpy.float64)
+        coeffs = numpy.array(list(coeff_dct.values()), dtype=numpy.float64)
+        n_eff = n_effs[idxs][:, numpy.newaxis]
+        z_alphas = ((coeffs[:, 0] * n_eff**3 + coeffs[:, 1] * n_eff**2 +
+                     coeffs[:, 2] * n_eff + coeffs[:, 3]) / 1.0e9)
+        zljs = troe_lj_collision_frequency(
+            epss[idxs][:, numpy.newaxis], sigs[idxs][:, numpy.newaxis],
+            red_masses[idxs][:, numpy.newaxis], temps)
+        zljs *= 100**3  # conv. m^3/s to cm^3/ for below
+        alpha_mat = (z_alphas / zljs) / empirical_factor
+
+        # Least-squares fit of ln(E_down/E_down_300) = [ln(T/300)] * n,
+        # which has a closed form for a single parameter
+        edown_alpha = alpha_mat[:, list(coeff_dct.keys()).index(300)]
+        n_vec = numpy.log(temps / 300.0)
+        edown_mat = numpy.log(alpha_mat / edown_alpha[:, numpy.newaxis])
+        edown_alphas[idxs] = edown_alpha
+        edown_ns[idxs] = numpy.dot(edown_mat, n_vec) / numpy.dot(n_vec, n_vec)
+
+    return edown_alphas, edown_ns
 
-    # Read the proper coefficients from the moldriver dct
-    coeff_dct = Z_ALPHA_EST_DCT.get(collider_set, None)
-    if coeff_dct is not None:
-        # Calculate the three alpha terms
-        z_alpha_dct = {}
-        for temp, coeffs in coeff_dct.items():
-            z_alpha_dct[temp] = _z_alpha(n_eff, coeffs)
 
-    return z_alpha_dct
-
-
-def _calculate_energy_down_exponent(alpha_dct):
-    """ Calculate power n, for model: E_down = E_down_300 * (T/300)**n
-
-        Does a least-squares for n to solve the linear equation
-        ln(E_down/E_down_300) = [ln(T/300)] * n
+# CALCULATE THE EFFECTIVE LENNARD-JONES SIGMA AND EPSILON
+def lennard_jones_params(n_heavy, collider_set):
+    """ Returns in angstrom and cm-1.
 
-        :param alpha_dct: temperature-dependent alpha parameters
-        :type alpha_dct: dict[float: float]
+        :param n_heavy: Number of heavy atoms for a species
+        :type n_heavy: int
     """
 
-    assert 300 in alpha_dct, (
-        'Must have 300 K in alphas'
-    )
+    sigs, epss = lennard_jones_params_array((n_heavy,), (collider_set,))
 
-    # Set the edown alpha to the value at 300 K
-    edown_alpha = alpha_dct[300]
+    # Return None for parameters missing for the collider set
+    sig = None if numpy.isnan(sigs[0]) else float(sigs[0])
+    eps = None if numpy.isnan(epss[0]) else float(epss[0])
+
+    return sig, eps
 
-    # Build vectors and matrices used for the fitting
-    temps = numpy.array(list(alpha_dct.keys()), dtype=numpy.float64)
-    alphas = numpy.array(list(alpha_dct.values()), dtype=numpy.float64)
 
-    n_vec = numpy.log(temps / 300.0)
-    coeff_mat = numpy.array([n_vec], dtype=numpy.float64)
-    coeff_mat = coeff_mat.transpose()
+def lennard_jones_params_array(n_heavys, collider_sets):
+    """ Returns the Lennard-Jones sigma and epsilon values for many species
+        at once, in bohr and hartree.
 
-    edown_vec = numpy.log(alphas / edown_alpha)
+        Species with no parameters for their collider set get NaN.
 
-    # Perform the least-squares fit
-    theta = numpy.linalg.lstsq(coeff_mat, edown_vec, rcond=None)[0]
+        :param n_heavys: Number of heavy atoms for each species
+        :type n_heavys: tuple(int)
+        :param collider_sets: collider set of each species, or one for all
+        :type collider_sets: frozenset or tuple(frozenset)
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
 
-    # Set the the edown n value to the fitting parameter
-    edown_n = theta[0]
+    n_heavys = numpy.asarray(n_heavys, dtype=float)
+    collider_sets = _collider_set_array(collider_sets, n_heavys.shape)
+    n_heavys, collider_sets = numpy.broadcast_arrays(n_heavys, collider_sets)
 
-    return edown_alpha, edown_n
+    sigs = numpy.full(n_heavys.shape, numpy.nan)
+    epss = numpy.full(n_heavys.shape, numpy.nan)
+    for collider_set, idxs in _group_indices(collider_sets).items():
+        params = LJ_DCT.get(collider_set)
+        coeffs = LJ_EST_DCT.get(collider_set, None)
+        if params is not None:
+            sigs[idxs], epss[idxs] = params
+        elif coeffs is not None:
+            sigs[idxs] = coeffs[0] * n_heavys[idxs]**coeffs[1]
+            epss[idxs] = coeffs[2] * n_heavys[idxs]**coeffs[3]
 
+    # Convert the units to what they should be internally
+    return sigs * phycon.ANG2BOHR, epss * phycon.WAVEN2EH
 
-# CALCULATE THE EFFECTIVE LENNARD-JONES SIGMA AND EPSILON
-def lennard_jones_params(n_heavy, collider_set):
-    """ Returns in angstrom and cm-1.
 
-        :param n_heavy: Number of heavy atoms for a species
-        :type n_heavy: int
+def _collider_set_array(collider_sets, shape):
+    """ An object array of collider sets, which may be given as one set for
+        all species
     """
-
-    def _lj(n_heavy, coeff1, coeff2):
-        """ calculate Lennard-Jones parameter using estimation
-            coefficents
-        """
-        return coeff1 * n_heavy**(coeff2)
-
-    # See if collider set is in dict with exact numbers
-    # If not read the estimation coefficents from EST dct and calc. params
-    params = LJ_DCT.get(collider_set)
-    if params is not None:
-        sig, eps = params
+    if collider_sets is None or isinstance(collider_sets, (set, frozenset)):
+        arr = numpy.empty(shape, dtype=object)
+        arr.fill(collider_sets)
     else:
-        coeffs = LJ_EST_DCT.get(collider_set, None)
-        if coeffs is not None:
-            # Calculate the effective sigma and epsilon values
-            sig = _lj(n_heavy, coeffs[0], coeffs[1])
-            eps = _lj(n_heavy, coeffs[2], coeffs[3])
-        else:
-            sig, eps = None, None
+        arr = numpy.empty(len(collider_sets), dtype=object)
+        arr[:] = list(collider_sets)
+    return arr
 
-    # Convert the units to what they should be internally
-    if sig is not None:
-        sig *= phycon.ANG2BOHR
-    if eps is not None:
-        eps *= phycon.WAVEN2EH
 
-    return sig, eps
+def _group_indices(keys):
+    """ The indices of each distinct key in an object array
+    """
+    idx_dct = {}
+    for idx, key in enumerate(keys):
+        idx_dct.setdefault(key, []).append(idx)
+    return {key: numpy.array(idxs) for key, idxs in idx_dct.items()}
 
 
 # DETERMINE N_EFF USED FOR ALPHA AND LJ PARAM CALCULATIONS
@@ -154,41 +190,83 @@ def effective_rotor_count(geo):
         :type geo: automol geometry data structure
         :rtype: float
     """
+    return float(effective_rotor_counts((geo,))[0])
 
-    # Conver the geo to a graph
-    gra = automol.geom.graph(geo)
-    symbs = automol.geom.symbols(geo)
-
-    # Count the rotors
-    (n_pp, n_ps, n_pt, n_pq,
-     n_ss, n_st, n_sq,
-     n_tt, n_tq,
-     n_qq,
-     n_co, n_oo,
-     n_ss_ring, n_rings) = _rotor_counts(gra, symbs)
-
-    # print('    - Rotor Counts for N_eff:')
-    # print('       N_pp:{}, N_ps:{}, N_pt:{}, N_pq:{}'.format(
-    #     n_pp, n_ps, n_pt, n_pq))
-    # print('       N_ss:{}, N_st:{}, N_sq:{}'.format(n_ss, n_st, n_sq))
-    # print('       N_tt:{}, N_tq:{}'.format(n_tt, n_tq))
-    # print('       N_qq:{}'.format(n_qq))
-    # print('       N_co:{}, N_oo:{}'.format(n_co, n_oo))
-    # print('       N_ss_ring:{}, N_rings:{}'.format(n_ss_ring, n_rings))
+
+def effective_rotor_counts(geos):
+    """ Calculate effective N parameters for many geometries at once.
+
+        Only the connectivity is needed, so no stereochemistry is perceived,
+        and the rotor counts of each geometry and graph are cached.
+
+        :param geos: geometries (Bohr)
+        :type geos: tuple(automol geometry data structure)
+        :rtype: numpy.ndarray
+    """
+    return _effective_rotor_counts(list(map(_geometry_rotor_counts, geos)))
+
+
+def graph_effective_rotor_counts(gras):
+    """ Calculate effective N parameters for many molecular graphs at once.
+
+        :param gras: molecular graphs, with explicit hydrogens
+        :type gras: tuple(automol graph data structure)
+        :rtype: numpy.ndarray
+    """
+    return _effective_rotor_counts(list(map(_graph_rotor_counts, gras)))
+
+
+def _effective_rotor_counts(counts_lst):
+    """ Calculate effective N parameters from the rotor counts of _rotor_counts
+    """
 
     # Use the rotor counts and the coefficients to calculate Neff
     c_pp_ps_ss, c_pt_st, c_pq_sq = 1.0, 2.0/3.0, 1.0/3.0
     c_tt_tq_qq, c_co_oo, c_ss_ring = 0.0, 1.0/3.0, 1.0/2.0
-    n_eff = 1.0 + (
-        c_pp_ps_ss * (n_pp + n_ps + n_ss) +
-        c_pt_st * (n_pt + n_st) +
-        c_pq_sq * (n_pq + n_sq) +
-        c_tt_tq_qq * (n_tt + n_tq + n_qq) +
-        c_co_oo * (n_co + n_oo) +
-        c_ss_ring * n_ss_ring - n_rings
-    )
+    coeffs = numpy.array([
+        c_pp_ps_ss, c_pp_ps_ss, c_pt_st, c_pq_sq,     # n_pp, ..., n_pq
+        c_pp_ps_ss, c_pt_st, c_pq_sq,                 # n_ss, n_st, n_sq
+        c_tt_tq_qq, c_tt_tq_qq,                       # n_tt, n_tq
+        c_tt_tq_qq,                                   # n_qq
+        c_co_oo, c_co_oo,                             # n_co, n_oo
+        c_ss_ring, -1.0])                             # n_ss_ring, n_rings
 
-    return n_eff
+    counts_mat = numpy.reshape(counts_lst, (-1, len(coeffs)))
+    return 1.0 + numpy.dot(counts_mat, coeffs)
+
+
+def _geometry_rotor_counts(geo):
+    """ Rotor counts for a geometry, from a cache if it is hashable
+    """
+    try:
+        counts = _cached_geometry_rotor_counts(geo)
+    except TypeError:
+        counts = _graph_rotor_counts(automol.geom.connectivity_graph(geo))
+    return counts
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_geometry_rotor_counts(geo):
+    """ Cached rotor counts of a hashable geometry
+    """
+    return _graph_rotor_counts(automol.geom.connectivity_graph(geo))
+
+
+def _graph_rotor_counts(gra):
+    """ Rotor counts for a graph, from a cache keyed by its connectivity
+    """
+    symb_dct = automol.graph.atom_symbols(gra)
+    return _cached_graph_rotor_counts(
+        frozenset(symb_dct.items()), automol.graph.bond_keys(gra))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_graph_rotor_counts(symb_items, bnd_keys):
+    """ Cached rotor counts of a connectivity graph
+    """
+    symb_dct = dict(symb_items)
+    gra = automol.graph.from_data(symb_dct, bnd_keys)
+    return _rotor_counts(gra, symb_dct)
 
 
 def _rotor_counts(gra, symbs):
@@ -196,8 +274,8 @@ def _rotor_counts(gra, symbs):
 
         :param gra: molecular graph of species
         :type gra: automol graph data structure
-        :param symbs: atomic symbols of species
-        :type symbs: tuple(str)
+        :param symbs: atomic symbols of species, by atom key
+        :type symbs: tuple(str) or dict[int: str]
         :rtype: tuple(float)
     """
 
@@ -214,23 +292,18 @@ def _rotor_counts(gra, symbs):
     ring_keys = set(itertools.chain(*automol.graph.rings_atom_keys(gra)))
     n_rings = len(rings)
 
-    # Loop over the bonds and count the number of atoms
+    # Count the heavy-atom neighbors of each atom once
     neighbors = automol.graph.atoms_neighbor_atom_keys(gra)
+    nheavy_dct = {key: sum(symbs[nkey] != 'H' for nkey in nkeys)
+                  for key, nkeys in neighbors.items()}
+
+    # Loop over the bonds and count the number of atoms
     for bnd in automol.graph.bond_keys(gra):
         key1, key2 = bnd
         spair = (symbs[key1], symbs[key2])
         if spair == ('C', 'C'):
-            # Figure out which neighbors are not hydrogen and count the number
-            atom1_neighbors = neighbors[key1]
-            numc1 = 0
-            for neighbor1 in atom1_neighbors:
-                if symbs[neighbor1] != 'H':
-                    numc1 += 1
-            atom2_neighbors = neighbors[key2]
-            numc2 = 0
-            for neighbor2 in atom2_neighbors:
-                if symbs[neighbor2] != 'H':
-                    numc2 += 1
+            numc1 = nheavy_dct[key1]
+            numc2 = nheavy_dct[key2]
             # Determine appropriate term to increment
             npair = (numc1, numc2)
             if npair == (1, 1):
@@ -291,47 +364,6 @@ def determine_collision_model_series(tgt_ich, bath_ich, collid_param):
         :param collid_param: select 'lj' or 'alpha' for parameter to assign
     """
 
-    def _identify_effective_model(tgt_ich, bath_ich):
-        """ When values cannot be assigned for a collision, try and
-            identify the best representative series to use for estimation
-        """
-        # Build the graph
-        tgt_gra = automol.geom.graph(automol.inchi.geometry(tgt_ich))
-
-        # Identify the the target model
-        if automol.graph.radical_species(tgt_gra):
-            # Determine if peroxy,hydroperoxy groups present to use RO2 series
-            # otherwise just use alkyl radical series
-            fgrp_cnt_dct = automol.graph.functional_group_count_dct(tgt_gra)
-            fgrps = set(fgrp for fgrp, count in fgrp_cnt_dct.items()
-                        if count > 0)
-            print('fgrps test', fgrps)
-            _ro2_fgrps = {FunctionalGroup.PEROXY, FunctionalGroup.HYDROPEROXY}
-            if _ro2_fgrps & fgrps:
-                tgt_model = 'peroxy'
-            else:
-                tgt_model = '1-alkyl'
-        elif automol.graph.hydrocarbon_species(tgt_gra):
-            tgt_model = 'n-alkane'
-        else:
-            # Set priority based on bond-dissociation energies
-            # Loop through D0 dct (ordered by ene) and try to find func. grp
-            tgt_model = None
-            fgrp_cnt_dct = automol.graph.functional_group_count_dct(tgt_gra)
-            fgrps = set(fgrp for fgrp, count in fgrp_cnt_dct.items()
-                        if count > 0)
-            print('fgrps test', fgrps)
-            for (fgrp, model) in D0_GRP_LST:
-                if fgrp in fgrps:
-                    tgt_model = model
-                    break
-
-            # Set target model to alkanes if nothing found
-            if tgt_model is None:
-                tgt_model = 'n-alkane'
-
-        return frozenset({tgt_model, bath_ich})
-
     # First check if one should use standard numbers instead of estimating
     collider_set = frozenset({tgt_ich, bath_ich})
 
@@ -339,7 +371,8 @@ def determine_collision_model_series(tgt_ich, bath_ich, collid_param):
     if collid_param == 'lj':
         if collider_set not in LJ_DCT:
             # try to identify a model where possible
-            collider_set = _identify_effective_model(tgt_ich, bath_ich)
+            collider_set = frozenset(
+                {_target_model_series(tgt_ich), bath_ich})
     elif collid_param == 'alpha':
         if {'InChI=1S/H2/h1H', 'InChI=1S/H'} & collider_set:
             # Model cannot be set for these common situations
@@ -347,6 +380,50 @@ def determine_collision_model_series(tgt_ich, bath_ich, collid_param):
             collider_set = None
         else:
             # Last try to identify a model where possible
-            collider_set = _identify_effective_model(tgt_ich, bath_ich)
+            collider_set = frozenset(
+                {_target_model_series(tgt_ich), bath_ich})
 
     return collider_set
+
+
+@functools.lru_cache(maxsize=4096)
+def _target_model_series(tgt_ich):
+    """ When values cannot be assigned for a collision, try and
+        identify the best representative series to use for estimation
+
+        This is cached, since it is needed for each bath gas and parameter.
+    """
+    # Build the graph; only the connectivity is needed
+    tgt_gra = automol.geom.connectivity_graph(automol.inchi.geometry(tgt_ich))
+
+    # Identify the the target model
+    if automol.graph.radical_species(tgt_gra):
+        # Determine if peroxy,hydroperoxy groups present to use RO2 series
+        # otherwise just use alkyl radical series
+        fgrp_cnt_dct = automol.graph.functional_group_count_dct(tgt_gra)
+        fgrps = set(fgrp for fgrp, count in fgrp_cnt_dct.items()
+                    if count > 0)
+        _ro2_fgrps = {FunctionalGroup.PEROXY, FunctionalGroup.HYDROPEROXY}
+        if _ro2_fgrps & fgrps:
+            tgt_model = 'peroxy'
+        else:
+            tgt_model = '1-alkyl'
+    elif automol.graph.hydrocarbon_species(tgt_gra):
+        tgt_model = 'n-alkane'
+    else:
+        # Set priority based on bond-dissociation energies
+        # Loop through D0 dct (ordered by ene) and try to find func. grp
+        tgt_model = None
+        fgrp_cnt_dct = automol.graph.functional_group_count_dct(tgt_gra)
+        fgrps = set(fgrp for fgrp, count in fgrp_cnt_dct.items()
+                    if count > 0)
+        for (fgrp, model) in D0_GRP_LST:
+            if fgrp in fgrps:
+                tgt_model = model
+                break
+
+        # Set target model to alkanes if nothing found
+        if tgt_model is None:
+            tgt_model = 'n-alkane'
+
+    return tgt_model
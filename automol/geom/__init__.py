@@ -7,7 +7,7 @@ Level 4 geometry functions belong in geom/*.py. These **do** require
 converion to other basic types (geom, graph, zmat, inchi).
 
 Import hierarchy:
-    _pyx2z      no dependencies
+    _pyx2z      dependencies: automol.geom.base
     _conv       dependencies: automol.graph, _pyx2z
     _extra      dependencies: automol.graph, _pyx2z, _conv
     ts          dependencies: automol.graph
@@ -83,12 +83,21 @@ from automol.geom.base._core import shift_atom_position
 # # properties used for comparisons
 from automol.geom.base._comp import coulomb_spectrum
 from automol.geom.base._comp import distance_matrix
+from automol.geom.base._comp import distance_matrices
+from automol.geom.base._comp import distance_spectrum
 # # comparisons
 from automol.geom.base._comp import almost_equal
 from automol.geom.base._comp import almost_equal_coulomb_spectrum
 from automol.geom.base._comp import argunique_coulomb_spectrum
+from automol.geom.base._comp import coulomb_spectra
+from automol.geom.base._comp import CoulombSpectrumIndex
 from automol.geom.base._comp import almost_equal_dist_matrix
+from automol.geom.base._comp import almost_equal_dist_matrices
+from automol.geom.base._comp import DistanceSpectrumIndex
 from automol.geom.base._comp import minimum_volume_geometry
+# point group functions
+from automol.geom.base._pgroup import symmetry_number_and_chirality
+from automol.geom.base._pgroup import symmetry_numbers_and_chiralities
 # L4
 # conversion functions:
 # # conversions
@@ -96,6 +105,7 @@ from automol.geom._conv import graph
 from automol.geom._conv import connectivity_graph
 from automol.geom._conv import zmatrix
 from automol.geom._conv import zmatrix_with_conversion_info
+from automol.geom._conv import x2z_analysis
 from automol.geom._conv import x2z_zmatrix
 from automol.geom._conv import inchi
 from automol.geom._conv import inchi_with_sort
@@ -104,6 +114,7 @@ from automol.geom._conv import smiles
 from automol.geom._conv import linear_atoms
 from automol.geom._conv import closest_unbonded_atoms
 from automol.geom._conv import external_symmetry_factor
+from automol.geom._conv import external_symmetry_factors
 from automol.geom._conv import x2z_torsion_coordinate_names
 from automol.geom._conv import x2z_atom_ordering
 # # derived operations
@@ -114,6 +125,8 @@ from automol.geom._conv import change_zmatrix_row_values
 from automol.geom._extra import components_graph
 from automol.geom._extra import connected
 from automol.geom._extra import rot_permutated_geoms
+from automol.geom._extra import rot_permutated_geoms_iter
+from automol.geom._extra import rot_permutation_count
 from automol.geom._extra import are_torsions_same2
 from automol.geom._extra import are_torsions_same
 from automol.geom._extra import is_unique
@@ -200,12 +213,21 @@ __all__ = [
     # # properties used for comparisons
     'coulomb_spectrum',
     'distance_matrix',
+    'distance_matrices',
+    'distance_spectrum',
     # # comparisons
     'almost_equal',
     'almost_equal_coulomb_spectrum',
     'argunique_coulomb_spectrum',
+    'coulomb_spectra',
+    'CoulombSpectrumIndex',
     'almost_equal_dist_matrix',
+    'almost_equal_dist_matrices',
+    'DistanceSpectrumIndex',
     'minimum_volume_geometry',
+    # point group functions
+    'symmetry_number_and_chirality',
+    'symmetry_numbers_and_chiralities',
     # L4
     # conversion functions:
     # # conversions
@@ -213,6 +235,7 @@ __all__ = [
     'connectivity_graph',
     'zmatrix',
     'zmatrix_with_conversion_info',
+    'x2z_analysis',
     'x2z_zmatrix',
     'inchi',
     'inchi_with_sort',
@@ -221,6 +244,7 @@ __all__ = [
     'linear_atoms',
     'closest_unbonded_atoms',
     'external_symmetry_factor',
+    'external_symmetry_factors',
     'x2z_torsion_coordinate_names',
     'x2z_atom_ordering',
     # # derived operations
@@ -231,6 +255,8 @@ __all__ = [
     'components_graph',
     'connected',
     'rot_permutated_geoms',
+    'rot_permutated_geoms_iter',
+    'rot_permutation_count',
     'are_torsions_same2',
     'are_torsions_same',
     'is_unique',
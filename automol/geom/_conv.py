@@ -21,6 +21,7 @@ from automol.geom.base import insert
 from automol.geom.base import move_atom
 from automol.geom.base import translate
 from automol.geom.base import rotate
+from automol.geom.base import symmetry_number_and_chirality
 
 
 # # conversions
@@ -133,6 +134,20 @@ def zmatrix_with_conversion_info(geo, ts_bnds=()):
     return zma, zma_keys, dummy_key_dct
 
 
+def x2z_analysis(geo, ts_bnds=()):
+    """ Get an object holding the results of the x2z analysis of a molecular
+        geometry: its Z-Matrix, torsion coordinate names, atom ordering, and
+        symmetry. The x2z molecule object is only built once per geometry.
+
+        :param geo: molecular geometry
+        :type geo: automol geometry data structure
+        :param ts_bnds: keys for the breaking/forming bonds in a TS
+        :type ts_bnds: tuple(frozenset(int))
+        :rtype: automol.geom._pyx2z.X2ZAnalysis
+    """
+    return _pyx2z.analysis(geo, ts_bnds=ts_bnds)
+
+
 def x2z_zmatrix(geo, ts_bnds=()):
     """ Generate a corresponding Z-Matrix for a molecular geometry
         using x2z interface.
@@ -148,10 +163,9 @@ def x2z_zmatrix(geo, ts_bnds=()):
         key_mat = [[None, None, None]]
         val_mat = [[None, None, None]]
         zma = automol.zmat.base.from_data(symbs, key_mat, val_mat)
+        zma = automol.zmat.base.standard_form(zma)
     else:
-        x2m = _pyx2z.from_geometry(geo, ts_bnds=ts_bnds)
-        zma = _pyx2z.to_zmatrix(x2m)
-    zma = automol.zmat.base.standard_form(zma)
+        zma = _pyx2z.analysis(geo, ts_bnds=ts_bnds).zmatrix
 
     return zma
 
@@ -286,9 +300,8 @@ def closest_unbonded_atoms(geo, gra=None):
 
 
 def external_symmetry_factor(geo, chiral_center=True):
-    """ Obtain the external symmetry factor for a geometry using x2z interface
-        which determines the initial symmetry factor and then divides by the
-        enantiomeric factor.
+    """ Obtain the external symmetry factor for a geometry, which is the
+        rotational symmetry number divided by the enantiomeric factor.
 
         :param geo: molecular geometry
         :type geo: automol geometry data structure
@@ -298,14 +311,25 @@ def external_symmetry_factor(geo, chiral_center=True):
     if is_atom(geo):
         ext_sym_fac = 1.
     else:
-        oriented_geom = _pyx2z.to_oriented_geometry(geo)
-        ext_sym_fac = oriented_geom.sym_num()
-        if oriented_geom.is_enantiomer() and chiral_center:
+        sym_num, is_chiral = symmetry_number_and_chirality(geo)
+        ext_sym_fac = float(sym_num)
+        if is_chiral and chiral_center:
             ext_sym_fac *= 0.5
 
     return ext_sym_fac
 
 
+def external_symmetry_factors(geos, chiral_center=True):
+    """ Obtain the external symmetry factors for several geometries.
+
+        :param geos: molecular geometries
+        :type geos: tuple(automol geometry data structure)
+        :rtype: tuple(float)
+    """
+    return tuple(external_symmetry_factor(geo, chiral_center=chiral_center)
+                 for geo in geos)
+
+
 def x2z_torsion_coordinate_names(geo, ts_bnds=()):
     """ Generate a list of torsional coordinates using x2z interface. These
         names corresond to the Z-Matrix generated using the same algorithm.
@@ -321,12 +345,8 @@ def x2z_torsion_coordinate_names(geo, ts_bnds=()):
     if len(symbs) == 1:
         names = ()
     else:
-        x2m = _pyx2z.from_geometry(geo, ts_bnds=ts_bnds)
-        names = _pyx2z.zmatrix_torsion_coordinate_names(x2m)
-
-        zma = _pyx2z.to_zmatrix(x2m)
-        name_dct = automol.zmat.base.standard_names(zma)
-        names = tuple(map(name_dct.__getitem__, names))
+        names = _pyx2z.analysis(
+            geo, ts_bnds=ts_bnds).torsion_coordinate_names
 
     return names
 
@@ -347,8 +367,7 @@ def x2z_atom_ordering(geo, ts_bnds=()):
     if len(symbs) == 1:
         idxs = {0: 0}
     else:
-        x2m = _pyx2z.from_geometry(geo, ts_bnds=ts_bnds)
-        idxs = _pyx2z.zmatrix_atom_ordering(x2m)
+        idxs = _pyx2z.analysis(geo, ts_bnds=ts_bnds).atom_ordering
 
     return idxs
 
@@ -1,5 +1,6 @@
 """ extra high-level geometry library functions
 """
+import itertools
 import numpy
 import automol.graph
 import automol.zmat.base
@@ -7,12 +8,14 @@ from automol.geom._conv import graph
 from automol.geom._conv import inchi
 from automol.geom._conv import x2z_zmatrix
 from automol.geom._conv import x2z_torsion_coordinate_names
-from automol.geom.base import swap_coordinates
 from automol.geom.base import dihedral_angle
 from automol.geom.base import central_angle
 from automol.geom.base import almost_equal_dist_matrix
+from automol.geom.base import almost_equal_dist_matrices
 from automol.geom.base import almost_equal_coulomb_spectrum
 from automol.geom.base import distance_matrix
+from automol.geom.base import distance_matrices
+from automol.geom.base import DistanceSpectrumIndex
 from automol.geom.base import count
 
 
@@ -23,8 +26,11 @@ CHECK_DEFAULT_DCT = {
     'tors': None
 }
 
+# Distance threshold used when a distance check is requested without one
+DIST_THRESH_DEFAULT = 3e-1
 
-def _similar_dist(geo, geoi, arg=3e-1):
+
+def _similar_dist(geo, geoi, arg=DIST_THRESH_DEFAULT):
     """ Compare the distance matrices of two geometries.
     """
     return almost_equal_dist_matrix(geo, geoi, thresh=arg)
@@ -94,6 +100,90 @@ def rot_permutated_geoms(geo, frm_bnd_keys=(), brk_bnd_keys=()):
         :type brk_bnd_keys: frozenset(int)
         :rtype: tuple(automol geom data structure)
     """
+    return list(rot_permutated_geoms_iter(
+        geo, frm_bnd_keys=frm_bnd_keys, brk_bnd_keys=brk_bnd_keys))
+
+
+def rot_permutated_geoms_iter(geo, frm_bnd_keys=(), brk_bnd_keys=(),
+                              prune=False):
+    """ Lazily generate the geometries corresponding to the rotational
+        permutations of all the terminal groups, in the same order as
+        `rot_permutated_geoms()`.
+
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :param frm_bnd_keys: keys denoting atoms forming bond in TS
+        :type frm_bnd_keys: frozenset(int)
+        :param brk_bnd_keys: keys denoting atoms breaking bond in TS
+        :type brk_bnd_keys: frozenset(int)
+        :param prune: skip permutations with the same distance matrix as one
+            that has already been generated?
+        :type prune: bool
+        :rtype: iterator(automol geom data structure)
+    """
+    hyds_lst = _rotational_hydrogen_groups(geo, frm_bnd_keys, brk_bnd_keys)
+    perms_lst = [_rotational_permutations(hyds) for hyds in hyds_lst]
+
+    spc_idx = DistanceSpectrumIndex() if prune else None
+    seen_geos = []
+    for perms in itertools.product(*perms_lst):
+        idxs = list(range(len(geo)))
+        for perm in perms:
+            for idx, perm_idx in perm:
+                idxs[idx] = perm_idx
+        perm_geo = tuple(geo[idx] for idx in idxs)
+
+        if prune:
+            if any(almost_equal_dist_matrix(perm_geo, seen_geos[idx])
+                   for idx in spc_idx.candidates(perm_geo)):
+                continue
+            spc_idx.add(perm_geo)
+            seen_geos.append(perm_geo)
+
+        yield perm_geo
+
+
+def rot_permutation_count(geo, frm_bnd_keys=(), brk_bnd_keys=(),
+                          prune=False):
+    """ Count the rotational permutations of all the terminal groups,
+        without generating them unless pruning is requested.
+
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :param frm_bnd_keys: keys denoting atoms forming bond in TS
+        :type frm_bnd_keys: frozenset(int)
+        :param brk_bnd_keys: keys denoting atoms breaking bond in TS
+        :type brk_bnd_keys: frozenset(int)
+        :param prune: only count permutations with distinct distance
+            matrices?
+        :type prune: bool
+        :rtype: int
+    """
+    if prune:
+        perm_geo_iter = rot_permutated_geoms_iter(
+            geo, frm_bnd_keys=frm_bnd_keys, brk_bnd_keys=brk_bnd_keys,
+            prune=True)
+        count_ = sum(1 for _ in perm_geo_iter)
+    else:
+        hyds_lst = _rotational_hydrogen_groups(
+            geo, frm_bnd_keys, brk_bnd_keys)
+        count_ = 1
+        for hyds in hyds_lst:
+            count_ *= len(_rotational_permutations(hyds))
+    return count_
+
+
+def _rotational_hydrogen_groups(geo, frm_bnd_keys=(), brk_bnd_keys=()):
+    """ Find the hydrogens of the terminal groups that can be permuted by
+        rotation.
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :param frm_bnd_keys: keys denoting atoms forming bond in TS
+        :type frm_bnd_keys: frozenset(int)
+        :param brk_bnd_keys: keys denoting atoms breaking bond in TS
+        :type brk_bnd_keys: frozenset(int)
+        :rtype: tuple(tuple(int))
+    """
 
     # Set saddle based on frm and brk keys existing
     saddle = bool(frm_bnd_keys or brk_bnd_keys)
@@ -136,42 +226,26 @@ def rot_permutated_geoms(geo, frm_bnd_keys=(), brk_bnd_keys=()):
                         nonh_neighs.append(nei)
                 if len(nonh_neighs) < 2 and len(h_neighs) > 1:
                     term_atms[atm] = h_neighs
-    geo_final_lst = [geo]
-    for hyds in term_atms.values():
-        geo_lst = []
-        for geom in geo_final_lst:
-            geo_lst.extend(_swap_for_one(geom, hyds))
-        geo_final_lst = geo_lst
-
-    return geo_final_lst
 
+    return tuple(map(tuple, term_atms.values()))
 
-def _swap_for_one(geo, hyds):
-    """ Rotational permuation for one rotational group.
-        :param geo: molecular geometry
-        :type geo: automol molecular geometry data structure
-        :param hyd: list of hydrogen atom indices
-        :type hyd: tuple(int)
-        :rtype: tuple(automol molecular geometry data structure)
-    """
 
-    geo_lst = []
-    if len(hyds) > 1:
-        new_geo = geo
-        if len(hyds) > 2:
-            geo_lst.append(new_geo)
-            new_geo = swap_coordinates(new_geo, hyds[0], hyds[1])
-            new_geo = swap_coordinates(new_geo, hyds[0], hyds[2])
-            geo_lst.append(new_geo)
-            new_geo = swap_coordinates(new_geo, hyds[0], hyds[1])
-            new_geo = swap_coordinates(new_geo, hyds[0], hyds[2])
-            geo_lst.append(new_geo)
-        else:
-            geo_lst.append(new_geo)
-            new_geo = swap_coordinates(new_geo, hyds[0], hyds[1])
-            geo_lst.append(new_geo)
+def _rotational_permutations(hyds):
+    """ Rotational permuations for one rotational group, as the
+        (position, atom index) pairs that each one changes.
 
-    return geo_lst
+        For two hydrogens, these swap them; for more, these cycle the first
+        three.
+        :param hyds: list of hydrogen atom indices
+        :type hyds: tuple(int)
+        :rtype: tuple(tuple(tuple(int, int)))
+    """
+    cyc_hyds = tuple(hyds[:3])
+    nperms = len(cyc_hyds)
+    perms = tuple(
+        tuple(zip(cyc_hyds, cyc_hyds[-shift:] + cyc_hyds[:-shift]))
+        for shift in range(nperms))
+    return perms
 
 
 def are_torsions_same2(geo, geoi, idxs_lst):
@@ -224,29 +298,51 @@ def are_torsions_same(geo, geoi, ts_bnds=()):
 
 
 # Checks
-def is_unique(geo, geo_lst, check_dct=None):
+def is_unique(geo, geo_lst, check_dct=None, dist_mats=None):
     """ Compare one of many structure features of a geometry to that of
         a list of geometries to see if it is unique.
 
         order of atoms also impacts the comparison as well
+
+        The distance check, if requested, is done against all geometries in
+        the list at once, and the remaining checks are only run for the
+        geometries that pass it.
+
+        :param dist_mats: the distance matrices of the geometries in the
+            list, as from `distance_matrices()`; if None, these will be
+            computed
+        :type dist_mats: numpy.ndarray of shape (M, N, N)
     """
 
     # Set default check values if none are provided
     if check_dct is None:
         check_dct = CHECK_DEFAULT_DCT
 
+    geo_lst = tuple(geo_lst)
+    check_dct = dict(check_dct)
+    if 'dist' in check_dct and geo_lst:
+        thresh = check_dct.pop('dist')
+        thresh = DIST_THRESH_DEFAULT if thresh is None else thresh
+        dist_mats = (distance_matrices(geo_lst) if dist_mats is None else
+                     dist_mats)
+        sim_idxs = numpy.flatnonzero(
+            almost_equal_dist_matrices(geo, dist_mats, thresh=thresh))
+    else:
+        sim_idxs = range(len(geo_lst))
+
     unique = True
     like_idx = None
-    for idx, geoi in enumerate(geo_lst):
+    for idx in sim_idxs:
         # Perform all of the desired comparison checks for similarity
-        sim_chk_results = []
-        for key, val in check_dct.items():
-            kwargs = {'arg': val} if val is not None else {}
-            sim_chk_results.append(CHECK_FXN_DCT[key](geo, geoi, **kwargs))
+        geoi = geo_lst[idx]
+        sim_chk_results = (
+            CHECK_FXN_DCT[key](geo, geoi, **(
+                {'arg': val} if val is not None else {}))
+            for key, val in check_dct.items())
         # If all checks come back as True, than geoms are the same
         if all(sim_chk_results):
             unique = False
-            like_idx = idx
+            like_idx = int(idx)
             break
 
     return unique, like_idx
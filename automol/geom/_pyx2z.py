@@ -1,10 +1,12 @@
 """ pyx2z interface
 """
 
+import functools
 import pyx2z
 import autoread as ar
 import autoparse.pattern as app
 import automol.zmat.base
+import automol.geom.base
 
 
 def to_oriented_geometry(geo):
@@ -90,3 +92,105 @@ def zmatrix_atom_ordering(x2m):
     """
     return {geo_key: zma_key
             for zma_key, geo_key in enumerate(x2m.atom_ordering())}
+
+
+class X2ZAnalysis:
+    """ The results of an x2z analysis of a geometry, from a single x2z
+        molecule object
+
+        Each result is computed on first access and then kept, so asking for
+        the Z-Matrix, torsion names, and atom ordering of a geometry only
+        builds and reads the x2z molecule object once. Use `analysis()` to
+        share these objects between callers.
+    """
+
+    def __init__(self, geo, ts_bnds=()):
+        """ constructor
+
+            :param geo: molecular geometry
+            :type geo: automol geometry data structure
+            :param ts_bnds: keys for the breaking/forming bonds in a TS
+            :type ts_bnds: tuple(frozenset(int))
+        """
+        self.geo = geo
+        self.ts_bnds = tuple(ts_bnds)
+        self._x2m = from_geometry(geo, ts_bnds=self.ts_bnds)
+        self._raw_zma = None
+        self._zma = None
+        self._tors_names = None
+        self._idx_dct = None
+        self._symm = None
+
+    @property
+    def zmatrix(self):
+        """ The Z-Matrix, in standard form
+
+            :rtype: automol Z-Matrix data structure
+        """
+        if self._zma is None:
+            self._zma = automol.zmat.base.standard_form(self._raw_zmatrix())
+        return self._zma
+
+    @property
+    def torsion_coordinate_names(self):
+        """ The torsion coordinate names, matching the standard form Z-Matrix
+
+            :rtype: tuple(str)
+        """
+        if self._tors_names is None:
+            names = zmatrix_torsion_coordinate_names(self._x2m)
+            name_dct = automol.zmat.base.standard_names(self._raw_zmatrix())
+            self._tors_names = tuple(map(name_dct.__getitem__, names))
+        return self._tors_names
+
+    @property
+    def atom_ordering(self):
+        """ A mapping from the order of atoms in the geometry to their order
+            in the Z-Matrix
+
+            :rtype: dict[int: int]
+        """
+        if self._idx_dct is None:
+            self._idx_dct = zmatrix_atom_ordering(self._x2m)
+        return dict(self._idx_dct)
+
+    @property
+    def symmetry_number_and_chirality(self):
+        """ The rotational symmetry number and whether or not the geometry is
+            chiral
+
+            :rtype: (int, bool)
+        """
+        if self._symm is None:
+            self._symm = automol.geom.base.symmetry_number_and_chirality(
+                self.geo)
+        return self._symm
+
+    def _raw_zmatrix(self):
+        """ The Z-Matrix as read from x2z, before standardization
+        """
+        if self._raw_zma is None:
+            self._raw_zma = to_zmatrix(self._x2m)
+        return self._raw_zma
+
+
+def analysis(geo, ts_bnds=()):
+    """ Get the x2z analysis of a geometry, reusing an earlier one for the
+        same geometry and TS bonds if there is one.
+
+        :param geo: molecular geometry
+        :type geo: automol geometry data structure
+        :param ts_bnds: keys for the breaking/forming bonds in a TS
+        :type ts_bnds: tuple(frozenset(int))
+        :rtype: X2ZAnalysis
+    """
+    geo = tuple((symb, tuple(xyz)) for symb, xyz in geo)
+    ts_bnds = tuple(sorted(map(tuple, map(sorted, ts_bnds))))
+    return _analysis(geo, ts_bnds)
+
+
+@functools.lru_cache(maxsize=256)
+def _analysis(geo, ts_bnds):
+    """ Cached x2z analysis, for a hashable geometry and TS bonds
+    """
+    return X2ZAnalysis(geo, ts_bnds=ts_bnds)
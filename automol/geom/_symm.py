@@ -33,6 +33,9 @@ def internal_symm_from_sampling(symm_geos, rotors, grxn=None, zma=None):
     # this will be accounted for separately as multiplicative factor
     int_sym_num = 0
     mod_symm_geos = []
+    # Bucket the kept geometries by distance spectrum, so that each new one
+    # is only checked exactly against those that could match it
+    spc_idx = automol.geom.DistanceSpectrumIndex(thresh=3e-1)
     for geo_sym_i in symm_geos:
         ret = automol.geom.end_group_symmetry_factor(
             geo_sym_i, frm_bnd_keys, brk_bnd_keys)
@@ -42,7 +45,8 @@ def internal_symm_from_sampling(symm_geos, rotors, grxn=None, zma=None):
                 tors_idxs, removed_atms, automol.zmat.dummy_keys(zma))
 
         new_geom = True
-        for mod_geo_sym_j in mod_symm_geos:
+        for idx in spc_idx.candidates(mod_geo_sym_i):
+            mod_geo_sym_j = mod_symm_geos[idx]
             if automol.geom.almost_equal_dist_matrix(
                     mod_geo_sym_i, mod_geo_sym_j, thresh=3e-1):
                 if grxn is None:
@@ -56,6 +60,7 @@ def internal_symm_from_sampling(symm_geos, rotors, grxn=None, zma=None):
                     break
         if new_geom:
             mod_symm_geos.append(mod_geo_sym_i)
+            spc_idx.add(mod_geo_sym_i)
             int_sym_num += 1
 
     int_sym_num *= end_group_factor
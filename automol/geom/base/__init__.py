@@ -3,6 +3,7 @@
 Import hierarchy:
     _core       no dependencies
     _comp       dependencies: _core
+    _pgroup     dependencies: _core
 """
 
 # core functions
@@ -74,12 +75,21 @@ from automol.geom.base._core import shift_atom_position
 # # properties used for comparisons
 from automol.geom.base._comp import coulomb_spectrum
 from automol.geom.base._comp import distance_matrix
+from automol.geom.base._comp import distance_matrices
+from automol.geom.base._comp import distance_spectrum
 # # comparisons
 from automol.geom.base._comp import almost_equal
 from automol.geom.base._comp import almost_equal_coulomb_spectrum
 from automol.geom.base._comp import argunique_coulomb_spectrum
+from automol.geom.base._comp import coulomb_spectra
+from automol.geom.base._comp import CoulombSpectrumIndex
 from automol.geom.base._comp import almost_equal_dist_matrix
+from automol.geom.base._comp import almost_equal_dist_matrices
+from automol.geom.base._comp import DistanceSpectrumIndex
 from automol.geom.base._comp import minimum_volume_geometry
+# point group functions
+from automol.geom.base._pgroup import symmetry_number_and_chirality
+from automol.geom.base._pgroup import symmetry_numbers_and_chiralities
 
 
 __all__ = [
@@ -152,10 +162,19 @@ __all__ = [
     # # properties used for comparisons
     'coulomb_spectrum',
     'distance_matrix',
+    'distance_matrices',
+    'distance_spectrum',
     # # comparisons
     'almost_equal',
     'almost_equal_coulomb_spectrum',
     'argunique_coulomb_spectrum',
+    'coulomb_spectra',
+    'CoulombSpectrumIndex',
     'almost_equal_dist_matrix',
+    'almost_equal_dist_matrices',
+    'DistanceSpectrumIndex',
     'minimum_volume_geometry',
+    # point group functions
+    'symmetry_number_and_chirality',
+    'symmetry_numbers_and_chiralities',
 ]
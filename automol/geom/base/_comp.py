@@ -2,14 +2,13 @@
   Functions used for handling and comparing multiple geometries
 """
 
+import bisect
 import functools
+import itertools
 import numpy
 from phydat import ptab
 from automol.geom.base._core import symbols
 from automol.geom.base._core import coordinates
-from automol.geom.base._core import xyz_string
-from automol.geom.base._core import from_string
-from automol.geom.base._core import distance
 
 
 # # properties used for comparisons
@@ -27,6 +26,45 @@ def coulomb_spectrum(geo):
     return vals
 
 
+def _coulomb_spectrum_array(geo):
+    """ Calculate a Coulomb matrix eigenvalue spectrum as an array,
+        sorted in ascending order.
+
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :rtype: numpy.ndarray
+    """
+    return numpy.linalg.eigvalsh(_coulomb_matrix(geo))
+
+
+def coulomb_spectra(geos):
+    """ Calculate the Coulomb matrix eigenvalue spectra of several geometries
+        at once, diagonalizing the stacked matrices of geometries with the
+        same number of atoms in a single batched call.
+
+        :param geos: molecular geometries
+        :type geos: tuple(automol molecular geometry data structure)
+        :returns: the spectra, sorted in ascending order, in the order of
+            the input geometries
+        :rtype: tuple(numpy.ndarray)
+    """
+    geos = tuple(geos)
+    idxs_dct = {}
+    for idx, geo in enumerate(geos):
+        idxs_dct.setdefault(len(geo), []).append(idx)
+
+    spcs = [None] * len(geos)
+    for idxs in idxs_dct.values():
+        nums = numpy.array([list(map(ptab.to_number, symbols(geos[idx])))
+                            for idx in idxs])
+        xyzs = numpy.array([coordinates(geos[idx]) for idx in idxs])
+        mats = _coulomb_matrices(nums, xyzs)
+        for idx, spc in zip(idxs, numpy.linalg.eigvalsh(mats)):
+            spcs[idx] = spc
+
+    return tuple(spcs)
+
+
 def _coulomb_matrix(geo):
     """ Calculate the Coulomb matrix wich describes the
         electrostatic interactions between nuclei:
@@ -42,20 +80,33 @@ def _coulomb_matrix(geo):
     xyzs = numpy.array(coordinates(geo))
 
     _ = numpy.newaxis
-    natms = len(nums)
-    diag_idxs = numpy.diag_indices(natms)
-    tril_idxs = numpy.tril_indices(natms, -1)
-    triu_idxs = numpy.triu_indices(natms, 1)
+    mat, = _coulomb_matrices(nums[_, :], xyzs[_, :, :])
+    return mat
 
-    zxz = numpy.outer(nums, nums)
-    rmr = numpy.linalg.norm(xyzs[:, _, :] - xyzs[_, :, :], axis=2)
 
-    mat = numpy.zeros((natms, natms))
-    mat[diag_idxs] = nums ** 2.4 / 2.
-    mat[tril_idxs] = zxz[tril_idxs] / rmr[tril_idxs]
-    mat[triu_idxs] = zxz[triu_idxs] / rmr[triu_idxs]
+def _coulomb_matrices(nums, xyzs):
+    """ Calculate a stack of Coulomb matrices from stacks of atomic numbers
+        and coordinates.
 
-    return mat
+        :param nums: atomic numbers
+        :type nums: numpy.ndarray of shape (M, N)
+        :param xyzs: atomic coordinates
+        :type xyzs: numpy.ndarray of shape (M, N, 3)
+        :rtype: numpy.ndarray of shape (M, N, N)
+    """
+    _ = numpy.newaxis
+    natms = numpy.shape(nums)[-1]
+    offd = ~numpy.eye(natms, dtype=bool)
+
+    zxz = nums[:, :, _] * nums[:, _, :]
+    rmr = numpy.linalg.norm(xyzs[:, :, _, :] - xyzs[:, _, :, :], axis=-1)
+
+    mats = numpy.zeros(numpy.shape(zxz))
+    mats[:, offd] = zxz[:, offd] / rmr[:, offd]
+    diag_idxs = numpy.arange(natms)
+    mats[:, diag_idxs, diag_idxs] = nums ** 2.4 / 2.
+
+    return mats
 
 
 def distance_matrix(geo):
@@ -66,15 +117,69 @@ def distance_matrix(geo):
         :type geo: automol geometry data structure
         :rtype: numpy.ndarray
     """
+    return numpy.array(_distance_matrix(geo))
+
+
+def distance_matrices(geos):
+    """ Form a stack of distance matrices for several geometries with the
+        same number of atoms.
+
+        :param geos: molecular geometries
+        :type geos: tuple(automol geometry data structure)
+        :rtype: numpy.ndarray of shape (M, N, N)
+    """
+    geos = tuple(geos)
+    if not geos:
+        return numpy.zeros((0, 0, 0))
+    return numpy.array(list(map(_distance_matrix, geos)))
+
+
+def _distance_matrix(geo):
+    """ Get the distance matrix of a geometry, from a cache if the geometry
+        is hashable.
+
+        The returned array is read-only, since it may be shared.
+
+        :param geo: molecular geometry
+        :type geo: automol geometry data structure
+        :rtype: numpy.ndarray
+    """
+    try:
+        mat = _cached_distance_matrix(geo)
+    except TypeError:
+        mat = _distance_matrix_from_coordinates(coordinates(geo))
+    return mat
+
 
-    mat = numpy.zeros((len(geo), len(geo)))
-    for i in range(len(geo)):
-        for j in range(len(geo)):
-            mat[i][j] = distance(geo, i, j)
+@functools.lru_cache(maxsize=4096)
+def _cached_distance_matrix(geo):
+    """ Cached distance matrix of a hashable geometry
+    """
+    return _distance_matrix_from_coordinates(coordinates(geo))
 
+
+def _distance_matrix_from_coordinates(xyzs):
+    """ Form a read-only distance matrix from coordinates
+    """
+    _ = numpy.newaxis
+    xyzs = numpy.array(xyzs, dtype=float)
+    mat = numpy.linalg.norm(xyzs[:, _, :] - xyzs[_, :, :], axis=-1)
+    mat.setflags(write=False)
     return mat
 
 
+def distance_spectrum(geo):
+    """ Get the sorted interatomic distances of a molecular geometry, which
+        are invariant to permutations of the atoms.
+
+        :param geo: molecular geometry
+        :type geo: automol geometry data structure
+        :rtype: numpy.ndarray
+    """
+    mat = _distance_matrix(geo)
+    return numpy.sort(mat[numpy.triu_indices(len(mat), 1)])
+
+
 # # comparisons
 def almost_equal(geo1, geo2, rtol=2e-3):
     """ Assess if the coordinates of two molecular geometries
@@ -125,96 +230,284 @@ def argunique_coulomb_spectrum(geos, seen_geos=(), rtol=1e-2):
         :type rtol: float
         :rtype: tuple(int)
     """
-    comp_ = functools.partial(almost_equal_coulomb_spectrum, rtol=rtol)
-    idxs = _argunique(geos, comp_, seen_items=seen_geos)
+    spc_idx = CoulombSpectrumIndex(rtol=rtol)
+    spc_idx.extend(seen_geos)
+    idxs = spc_idx.argunique(geos)
     return idxs
 
 
-def _argunique(items, comparison, seen_items=()):
-    """ Get the indices of unique items using some comparison function.
+class CoulombSpectrumIndex:
+    """ An index of Coulomb spectra for fast, incremental detection of
+        near-duplicate conformers
 
-        :param items: items to assess for uniqueness
-        :type items: tuple(obj)
-        :param comparison: function used to compare items
-        :type comparison: function object
-        :param seen_items: items that have been assessed
-        :type seen_items: tuple(obj)
-        :rtype: tuple(int)
+        Spectra are bucketed by length and kept sorted by their largest
+        eigenvalue. Since two spectra can only be close if their largest
+        eigenvalues are, a near-duplicate query only compares against the
+        window of stored spectra allowed by the tolerance. Matches are
+        decided exactly as in `almost_equal_coulomb_spectrum`, with the
+        stored spectrum as the reference.
     """
 
-    idxs = []
-    seen_items = list(seen_items)
-    for idx, item in enumerate(items):
-        if not any(comparison(item, seen_item) for seen_item in seen_items):
-            idxs.append(idx)
-            seen_items.append(item)
-    idxs = tuple(idxs)
+    _ATOL = 1e-8
+
+    def __init__(self, geos=(), rtol=1e-2):
+        """ constructor
+
+            :param geos: geometries to add to the index
+            :type geos: tuple(automol molecular geometry data structure)
+            :param rtol: Relative tolerance for the spectra
+            :type rtol: float
+        """
+        self.rtol = rtol
+        self._keys_dct = {}
+        self._spcs_dct = {}
+        self.extend(geos)
+
+    def __len__(self):
+        return sum(map(len, self._keys_dct.values()))
+
+    def add(self, geo):
+        """ Add a geometry to the index, whether or not it is unique
+
+            :param geo: molecular geometry
+            :type geo: automol molecular geometry data structure
+        """
+        self._add_spectrum(_coulomb_spectrum_array(geo))
+
+    def extend(self, geos):
+        """ Add several geometries to the index, whether or not they are
+            unique
+
+            :param geos: molecular geometries
+            :type geos: tuple(automol molecular geometry data structure)
+        """
+        for spc in coulomb_spectra(geos):
+            self._add_spectrum(spc)
+
+    def has_duplicate(self, geo):
+        """ Determine whether the index contains a near-duplicate of a
+            geometry
+
+            :param geo: molecular geometry
+            :type geo: automol molecular geometry data structure
+            :rtype: bool
+        """
+        return self._has_spectrum(_coulomb_spectrum_array(geo))
+
+    def add_if_unique(self, geo):
+        """ Add a geometry to the index if it has no near-duplicate there
+
+            :param geo: molecular geometry
+            :type geo: automol molecular geometry data structure
+            :returns: whether or not the geometry was added
+            :rtype: bool
+        """
+        spc = _coulomb_spectrum_array(geo)
+        uniq = not self._has_spectrum(spc)
+        if uniq:
+            self._add_spectrum(spc)
+        return uniq
+
+    def argunique(self, geos):
+        """ Get the indices of unique geometries, adding them to the index
+            as they are found
+
+            :param geos: molecular geometries
+            :type geos: tuple(automol molecular geometry data structure)
+            :rtype: tuple(int)
+        """
+        idxs = []
+        for idx, spc in enumerate(coulomb_spectra(geos)):
+            if not self._has_spectrum(spc):
+                self._add_spectrum(spc)
+                idxs.append(idx)
+        return tuple(idxs)
+
+    def _add_spectrum(self, spc):
+        """ Insert a spectrum, keeping its bucket sorted
+        """
+        keys = self._keys_dct.setdefault(len(spc), [])
+        spcs = self._spcs_dct.setdefault(len(spc), [])
+        pos = bisect.bisect_right(keys, spc[-1])
+        keys.insert(pos, spc[-1])
+        spcs.insert(pos, spc)
+
+    def _has_spectrum(self, spc):
+        """ Check a spectrum for near-duplicates in the index
+        """
+        keys = self._keys_dct.get(len(spc), ())
+        if not keys:
+            return False
+
+        # A match requires |k - key| <= atol + rtol * |key|; the largest
+        # eigenvalue is always positive, since the trace is
+        key = spc[-1]
+        lower = (key - self._ATOL) / (1. + self.rtol)
+        upper = ((key + self._ATOL) / (1. - self.rtol) if self.rtol < 1. else
+                 numpy.inf)
+        start = bisect.bisect_left(keys, lower)
+        stop = bisect.bisect_right(keys, upper)
+        if start == stop:
+            return False
+
+        ref_spcs = numpy.array(self._spcs_dct[len(spc)][start:stop])
+        tols = self._ATOL + self.rtol * numpy.abs(ref_spcs)
+        return bool(numpy.any(
+            numpy.all(numpy.abs(spc - ref_spcs) <= tols, axis=1)))
+
+
+class DistanceSpectrumIndex:
+    """ An index of distance spectra for finding candidate matches for
+        `almost_equal_dist_matrix` without comparing against every stored
+        geometry
+
+        If two distance matrices match within a threshold, then so do their
+        sorted distances, and so do the means of their sorted distances.
+        Spectra are therefore bucketed by their mean in units of the
+        threshold, and a query only compares against the neighboring buckets.
+        No true matches are missed, but the candidates still need to be
+        checked exactly.
+    """
 
-    return idxs
+    def __init__(self, thresh=0.1):
+        """ constructor
+
+            :param thresh: maximum allowed difference between distances
+            :type thresh: float
+        """
+        self.thresh = thresh
+        self._count = 0
+        self._bucket_dct = {}
+
+    def __len__(self):
+        return self._count
+
+    def add(self, geo):
+        """ Add a geometry to the index
+
+            :param geo: molecular geometry
+            :type geo: automol molecular geometry data structure
+            :returns: the index of the geometry, in order of addition
+            :rtype: int
+        """
+        key, spc = self._signature(geo)
+        idx = self._count
+        self._bucket_dct.setdefault(key, []).append((idx, spc))
+        self._count += 1
+        return idx
+
+    def candidates(self, geo):
+        """ Get the stored geometries that may match a geometry
+
+            :param geo: molecular geometry
+            :type geo: automol molecular geometry data structure
+            :returns: the indices of the candidates, in order of addition
+            :rtype: tuple(int)
+        """
+        key, spc = self._signature(geo)
+        idx_spcs = [
+            (idx, spc_) for key_ in (key - 1, key, key + 1)
+            for idx, spc_ in self._bucket_dct.get(key_, ())
+            if len(spc_) == len(spc)]
+        if not idx_spcs:
+            return ()
+
+        idxs, spcs = zip(*idx_spcs)
+        diffs = numpy.abs(numpy.array(spcs) - spc)
+        sims = numpy.all(diffs <= self.thresh, axis=1)
+        return tuple(sorted(i for i, sim in zip(idxs, sims) if sim))
+
+    def _signature(self, geo):
+        """ Get the bucket key and distance spectrum of a geometry
+        """
+        spc = distance_spectrum(geo)
+        key = (int(numpy.floor(numpy.mean(spc) / self.thresh)) if len(spc)
+               else 0)
+        return key, spc
 
 
 def almost_equal_dist_matrix(geo1, geo2, thresh=0.1):
-    """form distance matrix for a set of xyz coordinates
+    """ Assess if two molecular geometries have the same distance matrix,
+        within a threshold.
+
+        :param geo1: molecular geometry 1
+        :type geo1: automol molecular geometry data structure
+        :param geo2: molecular geometry 2
+        :type geo2: automol molecular geometry data structure
+        :param thresh: maximum allowed difference between distances
+        :type thresh: float
+        :rtype: bool
     """
+    natms = len(geo1)
+    dist_mat1 = _distance_matrix(geo1)
+    dist_mat2 = _distance_matrix(geo2)[:natms, :natms]
+    return bool(numpy.all(numpy.abs(dist_mat1 - dist_mat2) <= thresh))
+
 
-    natoms = len(geo1)
-    for i in range(natoms):
-        for j in range(natoms):
-            dist_mat1_ij = distance(geo1, i, j)
-            dist_mat2_ij = distance(geo2, i, j)
-            if abs(dist_mat1_ij - dist_mat2_ij) > thresh:
-                return False
+def almost_equal_dist_matrices(geo, dist_mats, thresh=0.1):
+    """ Assess which of a stack of distance matrices match the distance
+        matrix of a molecular geometry, within a threshold.
+
+        :param geo: molecular geometry
+        :type geo: automol molecular geometry data structure
+        :param dist_mats: distance matrices to compare against, as from
+            `distance_matrices()`
+        :type dist_mats: numpy.ndarray of shape (M, N, N)
+        :param thresh: maximum allowed difference between distances
+        :type thresh: float
+        :rtype: numpy.ndarray of bool, with shape (M,)
+    """
+    dist_mats = numpy.asarray(dist_mats, dtype=float)
+    if len(dist_mats) == 0:
+        return numpy.zeros((0,), dtype=bool)
 
-    return True
+    dist_mat = _distance_matrix(geo)
+    return numpy.all(
+        numpy.abs(dist_mats - dist_mat) <= thresh, axis=(1, 2))
 
 
-def minimum_volume_geometry(geos):
+def minimum_volume_geometry(geos, chunk_size=256):
     """ Generate the geometry with smallest volume from a set
         of geometrties for a given species.
 
+        The volume is measured by the maximum interatomic distance. The
+        geometries are consumed in chunks, so any iterable, such as a
+        generator over a long conformer list, can be passed in without
+        loading all of it into memory.
+
         :param geos: molecular geometries
-        :type geos: tuple(geo obj)
+        :type geos: iterable(geo obj)
+        :param chunk_size: the number of geometries to compare at once
+        :type chunk_size: int
         :rtype: geo obj
     """
+    geo_iter = iter(geos)
+
+    min_geo = None
+    min_dist = numpy.inf
+    while True:
+        chunk = tuple(itertools.islice(geo_iter, chunk_size))
+        if not chunk:
+            break
+
+        dists = _maximum_distances(
+            numpy.array([coordinates(geo) for geo in chunk], dtype=float))
+        idx = numpy.argmin(dists)
+        if dists[idx] < min_dist:
+            min_dist = dists[idx]
+            min_geo = chunk[idx]
+
+    return min_geo
 
-    # Get lines for the output string
-    geoms_string = '\n'.join([xyz_string(geom) for geom in geos])
-    lines = geoms_string.splitlines()
-
-    # Get the number of atoms
-    natom = int(lines[0])
-
-    # loop over the lines to find the smallest geometry
-    rrminmax = 1.0e10
-    ngeom = 0
-    small_geo_idx = 0
-    while ngeom*(natom+2) < len(lines):
-        rrmax = 0.0
-        for i in range(natom):
-            for j in range(i+1, natom):
-                # Get the line
-                xyz1 = lines[i+ngeom*(natom+2)+2].split()[1:]
-                xyz2 = lines[j+ngeom*(natom+2)+2].split()[1:]
-                # Get the coordinates
-                atom1 = [float(val) for val in xyz1]
-                atom2 = [float(val) for val in xyz2]
-                # Calculate the interatomic distance
-                rrtest = numpy.sqrt((atom1[0]-atom2[0])**2 +
-                                    (atom1[1]-atom2[1])**2 +
-                                    (atom1[2]-atom2[2])**2)
-                # Check and see if distance is more than max
-                if rrtest > rrmax:
-                    rrmax = rrtest
-        # If max below moving threshold, set to smallest geom
-        if rrmax < rrminmax:
-            rrminmax = rrmax
-            small_geo_idx = ngeom
-        ngeom += 1
-
-    # Set the output geometry
-    geom_str = ''
-    for i in range(natom):
-        geom_str += lines[i+small_geo_idx*(natom+2)+2] + '\n'
-    round_geom = from_string(geom_str)
-
-    return round_geom
+
+def _maximum_distances(xyzs):
+    """ Get the maximum interatomic distance for a stack of coordinates
+
+        :param xyzs: atomic coordinates
+        :type xyzs: numpy.ndarray of shape (M, N, 3)
+        :rtype: numpy.ndarray of shape (M,)
+    """
+    _ = numpy.newaxis
+    dist_mats = numpy.linalg.norm(
+        xyzs[:, :, _, :] - xyzs[:, _, :, :], axis=-1)
+    return numpy.max(dist_mats, axis=(1, 2))
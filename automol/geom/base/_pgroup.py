@@ -0,0 +1,196 @@
+"""
+  Point group symmetry detection for molecular geometries
+"""
+
+import itertools
+import numpy
+import scipy.spatial
+from phydat import ptab
+from automol.geom.base._core import symbols
+from automol.geom.base._core import coordinates
+from automol.geom.base._core import mass_centered
+from automol.geom.base._core import inertia_tensor
+
+
+MAX_ORDER = 8
+
+
+def symmetry_number_and_chirality(geo, tol=2e-1):
+    """ Determine the rotational symmetry number of a geometry, which is the
+        number of proper rotations in its point group, and whether or not it
+        is chiral, meaning that its point group has no improper rotations.
+
+        Candidate rotation axes are the principal axes, the atom positions,
+        and the axes that could swap or cycle atoms of the same element,
+        relative to the center of mass. Each candidate operation is tested by
+        mapping the atoms onto their nearest neighbors in a KD-tree.
+
+        :param geo: molecular geometry
+        :type geo: automol geometry data structure
+        :param tol: tolerance for matching atom positions, in bohr
+        :type tol: float
+        :returns: the symmetry number and whether or not it is chiral
+        :rtype: (int, bool)
+    """
+    if len(symbols(geo)) == 1:
+        return 1, False
+
+    geo = mass_centered(geo)
+    xyzs = numpy.array(coordinates(geo), dtype=float)
+    nums = numpy.array(list(map(ptab.to_number, symbols(geo))))
+    moms, paxs = numpy.linalg.eigh(inertia_tensor(geo))
+    paxs = numpy.transpose(paxs)
+    tree = scipy.spatial.cKDTree(xyzs)
+
+    def _symmetry_permutation(op_mat):
+        """ The atom permutation for a symmetry operation, or None if it
+            isn't one
+        """
+        dists, idxs = tree.query(numpy.dot(xyzs, numpy.transpose(op_mat)),
+                                 distance_upper_bound=tol)
+        perm = None
+        if (numpy.all(numpy.isfinite(dists)) and
+                numpy.array_equal(nums[idxs], nums) and
+                len(set(idxs)) == len(idxs)):
+            perm = tuple(map(int, idxs))
+        return perm
+
+    # Linear molecules only have the identity or, if centrosymmetric, an
+    # additional C2 perpendicular to the axis
+    if moms[0] < 1e-3 * moms[2]:
+        sym_num = 2 if _symmetry_permutation(-numpy.eye(3)) else 1
+        return sym_num, False
+
+    # Find the proper rotation axes, with their highest orders. Since the
+    # same axis may be found more than once, with some numerical noise,
+    # the rotations are counted by the atom permutations they produce.
+    rot_perms = {tuple(range(len(nums)))}
+    axis_orders = []
+    for axis in _candidate_axes(xyzs, nums, moms, paxs, tol):
+        for order in range(MAX_ORDER, 1, -1):
+            perm = _symmetry_permutation(
+                _rotation_matrix(axis, 2. * numpy.pi / order))
+            if perm is not None:
+                pow_perm = perm
+                for _ in range(1, order):
+                    rot_perms.add(pow_perm)
+                    pow_perm = tuple(perm[idx] for idx in pow_perm)
+                axis_orders.append((axis, order))
+                break
+
+    sym_num = len(rot_perms)
+
+    # Look for an improper rotation: the inversion, a mirror plane, or an
+    # improper rotation about one of the proper rotation axes
+    imp_mats = itertools.chain(
+        [-numpy.eye(3)],
+        (_reflection_matrix(axis)
+         for axis in _candidate_normals(xyzs, nums, paxs)),
+        (numpy.dot(_reflection_matrix(axis),
+                   _rotation_matrix(axis, numpy.pi / order))
+         for axis, max_order in axis_orders
+         for order in range(1, max_order + 1)))
+    is_chiral = all(_symmetry_permutation(imp_mat) is None
+                    for imp_mat in imp_mats)
+
+    return sym_num, is_chiral
+
+
+def symmetry_numbers_and_chiralities(geos, tol=2e-1):
+    """ Determine the rotational symmetry numbers and chiralities for several
+        geometries.
+
+        :param geos: molecular geometries
+        :type geos: tuple(automol geometry data structure)
+        :param tol: tolerance for matching atom positions, in bohr
+        :type tol: float
+        :returns: the symmetry number and chirality for each geometry
+        :rtype: tuple((int, bool))
+    """
+    return tuple(symmetry_number_and_chirality(geo, tol=tol) for geo in geos)
+
+
+def _candidate_axes(xyzs, nums, moms, paxs, tol):
+    """ Unit vectors along every axis which could be a proper rotation axis
+    """
+    axes = list(paxs)
+    axes.extend(xyzs)
+
+    # A C2 either contains an atom or swaps a pair of like atoms, in which
+    # case it passes through their midpoint or, if that is the origin, is
+    # perpendicular to them
+    for idx1, idx2 in _like_atom_pairs(nums):
+        mid_xyz = xyzs[idx1] + xyzs[idx2]
+        if numpy.linalg.norm(mid_xyz) > tol:
+            axes.append(mid_xyz)
+        else:
+            axes.extend(numpy.cross(xyzs[idx1], paxs))
+
+    # For spherical tops, higher-order axes may pass through the center of a
+    # ring of like atoms equidistant from the origin
+    if numpy.isclose(moms[0], moms[2], rtol=5e-2):
+        rads = numpy.linalg.norm(xyzs, axis=1)
+        for idx1, idx2, idx3 in itertools.combinations(range(len(nums)), 3):
+            if (nums[idx1] == nums[idx2] == nums[idx3] and
+                    numpy.ptp(rads[[idx1, idx2, idx3]]) < tol):
+                axes.append(numpy.cross(xyzs[idx2] - xyzs[idx1],
+                                        xyzs[idx3] - xyzs[idx1]))
+
+    return _unique_directions(axes)
+
+
+def _candidate_normals(xyzs, nums, paxs):
+    """ Unit vectors along every axis which could be normal to a mirror plane
+
+        A mirror plane either contains every atom, in which case it is normal
+        to a principal axis, or reflects a pair of like atoms onto each other.
+    """
+    normals = list(paxs)
+    normals.extend(xyzs[idx1] - xyzs[idx2]
+                   for idx1, idx2 in _like_atom_pairs(nums))
+    return _unique_directions(normals, tol=0.)
+
+
+def _like_atom_pairs(nums):
+    """ Pairs of atoms with the same atomic number
+    """
+    return ((idx1, idx2) for idx1, idx2
+            in itertools.combinations(range(len(nums)), 2)
+            if nums[idx1] == nums[idx2])
+
+
+def _unique_directions(vecs, tol=1e-7):
+    """ Normalize vectors and remove duplicates, regardless of sign
+    """
+    dirs = []
+    seen = set()
+    for vec in vecs:
+        norm = numpy.linalg.norm(vec)
+        if norm <= max(tol, 1e-7):
+            continue
+
+        vec = numpy.divide(vec, norm)
+        # Fix the sign, so that antiparallel vectors are the same
+        sign = numpy.sign(vec[numpy.argmax(numpy.abs(vec) > 1e-3)])
+        vec = vec * sign
+        key = tuple(numpy.round(vec, 3) + 0.)
+        if key not in seen:
+            seen.add(key)
+            dirs.append(vec)
+    return dirs
+
+
+def _rotation_matrix(axis, angle):
+    """ Proper rotation about a unit axis
+    """
+    cross_mat = numpy.array([[0., -axis[2], axis[1]],
+                             [axis[2], 0., -axis[0]],
+                             [-axis[1], axis[0], 0.]])
+    return (numpy.eye(3) + numpy.sin(angle) * cross_mat +
+            (1. - numpy.cos(angle)) * numpy.dot(cross_mat, cross_mat))
+
+
+def _reflection_matrix(normal):
+    """ Reflection through the plane normal to a unit vector
+    """
+    return numpy.eye(3) - 2. * numpy.outer(normal, normal)
@@ -41,6 +41,12 @@ from automol.graph.base._core import string
 from automol.graph.base._core import yaml_dictionary
 from automol.graph.base._core import from_string
 from automol.graph.base._core import from_yaml_dictionary
+from automol.graph.base._core import json_data
+from automol.graph.base._core import from_json_data
+from automol.graph.base._core import json_string
+from automol.graph.base._core import from_json_string
+from automol.graph.base._core import write_json_lines
+from automol.graph.base._core import read_json_lines
 # # conversions
 from automol.graph.base._core import frozen
 from automol.graph.base._core import formula
@@ -322,6 +328,12 @@ __all__ = [
     'yaml_dictionary',
     'from_string',
     'from_yaml_dictionary',
+    'json_data',
+    'from_json_data',
+    'json_string',
+    'from_json_string',
+    'write_json_lines',
+    'read_json_lines',
     # # conversions
     'frozen',
     'formula',
@@ -6,6 +6,7 @@ BEFORE ADDING ANYTHING, SEE IMPORT HIERARCHY IN __init__.py!!!!
 import itertools
 import functools
 import operator
+import json
 import numpy
 import yaml
 import future.moves.itertools as fmit
@@ -360,6 +361,68 @@ def from_yaml_dictionary(yaml_gra_dct, one_indexed=True):
     return gra
 
 
+def json_data(gra):
+    """ generate a compact, JSON-serializable representation of the graph
+
+    format:
+        [[[atm_key, atm_sym, atm_imp_hyd_vlc, atm_ste_par], ...],
+         [[atm1_key, atm2_key, bnd_ord, bnd_ste_par], ...]]
+
+    Unlike the YAML dictionary, keys are stored as-is (zero-indexed) and
+    atom and bond properties are stored positionally.
+    """
+    json_atms = [[int(k), *v] for k, v in sorted(atoms(gra).items())]
+    json_bnds = sorted([*map(int, sorted(k)), *v]
+                       for k, v in bonds(gra).items())
+    return [json_atms, json_bnds]
+
+
+def from_json_data(json_gra):
+    """ read the graph from its compact JSON representation
+
+    The data is assumed to have been written by `json_data`, so the atom and
+    bond dictionaries are built directly without the usual checks.
+    """
+    json_atms, json_bnds = json_gra
+    atm_dct = {k: (s, v, p) for k, s, v, p in json_atms}
+    bnd_dct = {frozenset({k1, k2}): (o, p) for k1, k2, o, p in json_bnds}
+    return (atm_dct, bnd_dct)
+
+
+def json_string(gra):
+    """ write the graph to a compact, single-line JSON string
+    """
+    return json.dumps(json_data(gra), separators=(',', ':'))
+
+
+def from_json_string(gra_str):
+    """ read the graph from a compact JSON string
+    """
+    return from_json_data(json.loads(gra_str))
+
+
+def write_json_lines(gras, stream):
+    """ stream a sequence of graphs to a file object, one JSON line per graph
+
+    :param gras: the graphs
+    :param stream: a writable text file object
+    """
+    for gra in gras:
+        stream.write(json_string(gra))
+        stream.write('\n')
+
+
+def read_json_lines(stream):
+    """ lazily read graphs from a file object written by `write_json_lines`
+
+    :param stream: a readable text file object
+    :returns: a generator over the graphs, in order
+    """
+    for line in stream:
+        if line.strip():
+            yield from_json_string(line)
+
+
 # # conversions
 def frozen(gra):
     """ hashable, sortable, immutable container of graph data
@@ -12,6 +12,7 @@ from automol.graph.base._core import bond_orders
 from automol.graph.base._core import atom_stereo_parities
 from automol.graph.base._core import bond_stereo_parities
 from automol.graph.base._core import set_bond_orders
+from automol.graph.base._core import set_atom_stereo_parities
 from automol.graph.base._core import atom_stereo_keys
 from automol.graph.base._core import bond_stereo_keys
 from automol.graph.base._core import add_bonds
@@ -217,6 +218,24 @@ def from_index_based_stereo(idx_tsg):
     return ste_tsg
 
 
+def reflect(ste_tsg):
+    """ Reflect a TS graph with stereo assignments, locally inverting all of
+    its stereo atoms.
+
+    The reflection is done in the index-based stereo representation, where
+    reflecting amounts to reversing the atom parities, and then converted
+    back to absolute stereo assignments.
+
+    :param ste_tsg: a TS graph with absolute stereo assignments
+    :returns: the mirror-image TS graph
+    """
+    idx_tsg = to_index_based_stereo(ste_tsg)
+    atm_par_dct = dict_.transform_values(
+        atom_stereo_parities(idx_tsg), lambda x: x if x is None else not x)
+    idx_tsg = set_atom_stereo_parities(idx_tsg, atm_par_dct)
+    return from_index_based_stereo(idx_tsg)
+
+
 def stereomers(tsg):
     """ Expand all possible stereo assignments for the reactants in this TS
     graph. (Ignores stereo assignments already present, if any.)
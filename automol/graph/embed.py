@@ -292,7 +292,7 @@ def distance_bounds_matrices(gra, keys, sp_dct=None):
 
 def join_distance_bounds_matrices(gra, keys, dist_range_dct, geos=None,
                                   relax_angles=False, relax_torsions=False,
-                                  sp_dct=None, angstrom=True):
+                                  sp_dct=None, init_mats=None, angstrom=True):
     """ distance bounds matrices for joining multiple geometries
 
     :param gra: molecular graph:
@@ -306,12 +306,18 @@ def join_distance_bounds_matrices(gra, keys, dist_range_dct, geos=None,
         their value in the reactant geometries
     :param sp_dct: a 2d dictionary giving the shortest path between any pair of
         atoms in the graph
+    :param init_mats: (optional) the initial distance bounds matrices from
+        `distance_bounds_matrices`, if they have already been computed; these
+        will not be modified
     """
     sp_dct = atom_shortest_paths(gra) if sp_dct is None else sp_dct
 
     natms = len(keys)
 
-    lmat, umat = distance_bounds_matrices(gra, keys)
+    if init_mats is None:
+        lmat, umat = distance_bounds_matrices(gra, keys)
+    else:
+        lmat, umat = map(numpy.copy, init_mats)
 
     # save the current values so that we can overwrite the fixed torsions below
     lmat_old = numpy.copy(lmat)
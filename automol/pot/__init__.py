@@ -2,9 +2,11 @@
   Libraries for constructing and manipulating potentials
 """
 
+from automol.pot._pot import ArrayPotential
 from automol.pot._pot import grid
 from automol.pot._pot import points
 from automol.pot._pot import coords
+from automol.pot._pot import coords_array
 from automol.pot._pot import scale
 from automol.pot._pot import relax_scale
 from automol.pot._pot import remove_empty_terms
@@ -21,14 +23,23 @@ from automol.pot._intmol import low_repulsion_struct
 from automol.pot._intmol import intramol_interaction_potential_sum
 from automol.pot._intmol import pairwise_potential_matrix
 from automol.pot._read import find_max1d
+from automol.pot._read import find_maxnd
+from automol.pot._read import saddle_points
+from automol.pot._read import stationary_points
+from automol.pot._read import local_extrema
 from automol.pot._fit import fit_1d_potential
 from automol.pot._fit import setup_1d_potential
+from automol.pot._fit import fit_nd_potential
+from automol.pot._fit import clean_nd_potential
+from automol.pot._fit import periodic_spline
 
 
 __all__ = [
+    'ArrayPotential',
     'grid',
     'points',
     'coords',
+    'coords_array',
     'scale',
     'relax_scale',
     'remove_empty_terms',
@@ -45,6 +56,13 @@ __all__ = [
     'intramol_interaction_potential_sum',
     'pairwise_potential_matrix',
     'find_max1d',
+    'find_maxnd',
+    'saddle_points',
+    'stationary_points',
+    'local_extrema',
     'fit_1d_potential',
     'setup_1d_potential',
+    'fit_nd_potential',
+    'clean_nd_potential',
+    'periodic_spline',
 ]
@@ -179,6 +179,131 @@ def fit_1d_potential(pot_dct, min_thresh=-0.0001, max_thresh=50.0):
     return fin_dct
 
 
+# N-D potentials on periodic grids, as arrays
+def fit_nd_potential(vals, min_thresh=-0.0001, max_thresh=50.0, shape=None):
+    """ Get a physical N-D hindered rotor potential on a periodic grid.
+
+        Missing or negative values are replaced by interpolating the
+        remaining values (see clean_nd_potential), values over the maximum
+        threshold are capped, and the potential is optionally resampled onto
+        a grid of another shape with a periodic tensor-product spline.
+
+        :param vals: potential values on the grid, with NaN for missing points
+        :type vals: numpy.ndarray
+        :param min_thresh: values below this are treated as missing
+        :type min_thresh: float
+        :param max_thresh: values above this are capped
+        :type max_thresh: float
+        :param shape: number of points along each axis of the output grid
+        :type shape: tuple(int)
+        :rtype: numpy.ndarray
+    """
+
+    vals = clean_nd_potential(vals, min_thresh=min_thresh)
+    if shape is not None:
+        vals = periodic_spline(vals, shape)
+    return numpy.minimum(vals, max_thresh)
+
+
+def clean_nd_potential(vals, min_thresh=-0.0001):
+    """ Replace the missing (NaN) and negative values of an N-D potential on a
+        periodic grid.
+
+        Each bad point is replaced by the average, over the axes of the grid,
+        of the periodic linear interpolation between the nearest good points
+        along that axis. Points with no good points along any of their axes
+        are filled in by repeating this with the newly filled values.
+
+        :param vals: potential values on the grid, with NaN for missing points
+        :type vals: numpy.ndarray
+        :param min_thresh: values below this are treated as missing
+        :type min_thresh: float
+        :rtype: numpy.ndarray
+    """
+
+    vals = numpy.array(vals, dtype=float)
+    bad = ~(vals >= min_thresh)
+    if numpy.all(bad):
+        raise ValueError('All potential values missing')
+
+    vals[bad] = numpy.nan
+    while numpy.any(bad):
+        interps = numpy.array([_periodic_linear_fill(vals, axis)
+                               for axis in range(vals.ndim)])
+        good_interps = numpy.isfinite(interps)
+        counts = numpy.sum(good_interps, axis=0)
+        fill = bad & (counts > 0)
+        vals[fill] = (numpy.sum(numpy.where(good_interps, interps, 0.),
+                                axis=0)[fill] / counts[fill])
+        bad &= ~fill
+
+    return vals
+
+
+def periodic_spline(vals, shape):
+    """ Resample an N-D potential on a periodic grid onto a grid of another
+        shape, using a periodic tensor-product cubic spline.
+
+        The grids are assumed to be evenly spaced and to exclude their
+        periodic endpoints, as those built by automol.pot.grid.
+
+        :param vals: potential values on the grid
+        :type vals: numpy.ndarray
+        :param shape: number of points along each axis of the output grid
+        :type shape: tuple(int)
+        :rtype: numpy.ndarray
+    """
+
+    vals = numpy.asarray(vals, dtype=float)
+    assert len(shape) == vals.ndim, (
+        f'Output shape {shape} should have {vals.ndim} dimensions')
+
+    # The tensor-product spline is separable, so it is fit one axis at a
+    # time, vectorized over the others
+    for axis, npts in enumerate(shape):
+        nvals = vals.shape[axis]
+        if nvals != npts:
+            x_vals = numpy.arange(nvals + 1)
+            y_vals = numpy.concatenate(
+                [vals, numpy.take(vals, [0], axis=axis)], axis=axis)
+            spl_fun = CubicSpline(x_vals, y_vals, axis=axis,
+                                  bc_type='periodic')
+            vals = spl_fun(numpy.arange(npts) * (nvals / npts))
+
+    return vals
+
+
+def _periodic_linear_fill(vals, axis):
+    """ Periodic linear interpolation across the NaN values of an array along
+        one axis; lines without any finite values are left as NaN
+    """
+
+    vals = numpy.moveaxis(vals, axis, -1)
+    npts = vals.shape[-1]
+
+    # Tile each line three times, so the nearest good points on either side
+    # of the middle copy are found without wrapping around
+    ext_vals = numpy.concatenate([vals, vals, vals], axis=-1)
+    ext_idxs = numpy.broadcast_to(numpy.arange(3 * npts), ext_vals.shape)
+    good = numpy.isfinite(ext_vals)
+    prev_idxs = numpy.maximum.accumulate(
+        numpy.where(good, ext_idxs, 0), axis=-1)[..., npts:2*npts]
+    next_idxs = numpy.flip(numpy.minimum.accumulate(
+        numpy.flip(numpy.where(good, ext_idxs, 3 * npts - 1), axis=-1),
+        axis=-1), axis=-1)[..., npts:2*npts]
+
+    prev_vals = numpy.take_along_axis(ext_vals, prev_idxs, axis=-1)
+    next_vals = numpy.take_along_axis(ext_vals, next_idxs, axis=-1)
+    idxs = numpy.arange(npts, 2 * npts)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        frac = (idxs - prev_idxs) / (next_idxs - prev_idxs)
+    interp = numpy.where(
+        good[..., npts:2*npts], vals,
+        prev_vals * (1.0 - frac) + next_vals * frac)
+
+    return numpy.moveaxis(interp, -1, axis)
+
+
 # def spline_fitter(xarr, yarr):
 #     """
 #     """
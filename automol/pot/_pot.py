@@ -8,6 +8,104 @@ import automol.zmat
 import automol.util
 
 
+# Dense-array potentials
+class ArrayPotential:
+    """ A potential on a full N-D grid, stored as grid axes and an N-D array
+        of values rather than a dict keyed by tuples.
+
+        Missing points are flagged by an optional boolean mask, which is True
+        where there is a value; their entries in the value array are NaN.
+        The potential functions in this module accept either form.
+    """
+
+    def __init__(self, grids, values, mask=None):
+        """ :param grids: the coordinate values along each axis of the grid
+            :type grids: tuple(tuple(float))
+            :param values: the potential values, of shape (len(grid1), ...)
+            :type values: numpy.ndarray
+            :param mask: whether each grid point has a value; if None, every
+                point with a finite value does
+            :type mask: numpy.ndarray
+        """
+
+        self.grids = tuple(numpy.asarray(grid, dtype=float) for grid in grids)
+        values = numpy.array(values, dtype=float)
+        shape = tuple(map(len, self.grids))
+        assert values.shape == shape, (
+            f'Potential values of shape {values.shape} do not match the '
+            f'grids of shape {shape}')
+        if mask is not None:
+            mask = numpy.array(mask, dtype=bool)
+            assert mask.shape == shape, (
+                f'Potential mask of shape {mask.shape} does not match the '
+                f'grids of shape {shape}')
+            values[~mask] = numpy.nan
+        self.values = values
+        self.mask = mask
+
+    @classmethod
+    def from_dict(cls, pot):
+        """ Build an array potential from a potential dict, whose keys may be
+            coordinate values or grid indices
+
+            :param pot: potential along a coordinate
+            :type pot: dict[tuple(float)] = float
+            :rtype: ArrayPotential
+        """
+
+        keys = numpy.array(list(pot.keys()), dtype=float)
+        keys = keys.reshape(len(pot), -1)
+        vals = numpy.array(
+            [numpy.nan if val is None else val for val in pot.values()],
+            dtype=float)
+
+        grids, idxs = [], []
+        for col in keys.T:
+            grid_vals, grid_idxs = numpy.unique(col, return_inverse=True)
+            grids.append(grid_vals)
+            idxs.append(grid_idxs.ravel())
+
+        shape = tuple(map(len, grids))
+        values = numpy.full(shape, numpy.nan)
+        values[tuple(idxs)] = vals
+        mask = numpy.zeros(shape, dtype=bool)
+        mask[tuple(idxs)] = True
+
+        return cls(grids, values, mask=None if mask.all() else mask)
+
+    def to_dict(self):
+        """ Convert to a potential dict keyed by coordinate values, with
+            entries for the points in the mask, in C order
+
+            :rtype: dict[tuple(float)] = float
+        """
+
+        present = self.present()
+        keys = coords_array(self.grids)[present.ravel()]
+        vals = [None if numpy.isnan(val) else val
+                for val in self.values[present].tolist()]
+        return dict(zip(map(tuple, keys.tolist()), vals))
+
+    def present(self):
+        """ Whether each grid point is in the potential
+
+            :rtype: numpy.ndarray
+        """
+        if self.mask is None:
+            return numpy.ones(self.values.shape, dtype=bool)
+        return self.mask
+
+    def with_values(self, values):
+        """ A copy of the potential with new values on the same grid
+
+            :rtype: ArrayPotential
+        """
+        return ArrayPotential(self.grids, values, mask=self.mask)
+
+    def __len__(self):
+        return int(numpy.sum(self.present()))
+
+
 # Build the grirds ultimately used for building potentials
 def grid(zma, coord_name, span, symmetry, increment, from_equilibrium=False):
     """ scan grids
@@ -62,6 +160,16 @@ def coords(grids):
     return grid_vals
 
 
+def coords_array(grids):
+    """ The coordinates of every point of the grid, in the same order as
+        coords, as an array of shape (npoints, ndim)
+    """
+
+    grids = [numpy.asarray(grid, dtype=float) for grid in grids]
+    mesh = numpy.meshgrid(*grids, indexing='ij')
+    return numpy.stack([arr.ravel() for arr in mesh], axis=-1)
+
+
 # Manipulate potentials
 def scale(pot, scale_factor):
     """ Scale the potential by scaling factor
@@ -75,6 +183,9 @@ def scale(pot, scale_factor):
         :rtype:
     """
 
+    if isinstance(pot, ArrayPotential):
+        return pot.with_values(pot.values * scale_factor)
+
     new_pot = {}
     for idx, val in pot.items():
         new_pot[idx] = val * scale_factor
@@ -94,6 +205,9 @@ def relax_scale(pot):
         :rtype:
     """
 
+    if isinstance(pot, ArrayPotential):
+        return pot.with_values(pot.values / (1 + 0.07 * pot.values))
+
     new_pot = {}
     for idx, val in pot.items():
         # scale_factor = 1.0
@@ -112,8 +226,18 @@ def relax_scale(pot):
 
 def truncate(pot, sym_num):
     """ Take a potential and limit it's terms by the symmetry number
+
+        For an array potential, this keeps the first 1/sym_num of the grid
+        along the first axis, which is what the dict version does when the
+        first axis is divisible by the symmetry number.
     """
 
+    if isinstance(pot, ArrayPotential):
+        npts = pot.values.shape[0] // sym_num
+        mask = None if pot.mask is None else pot.mask[:npts]
+        return ArrayPotential((pot.grids[0][:npts],) + pot.grids[1:],
+                              pot.values[:npts], mask=mask)
+
     if sym_num == 1:
         potr = copy.deepcopy(pot)
     else:
@@ -130,6 +254,9 @@ def remove_empty_terms(pot):
     """ Remove terms from the potential that do not have
         a value associated with them
     """
+    if isinstance(pot, ArrayPotential):
+        return ArrayPotential(pot.grids, pot.values,
+                              mask=numpy.isfinite(pot.values))
     return {k: v for k, v in pot.items() if v is not None}
 
 
@@ -146,6 +273,11 @@ def by_index(pot):
         :rtype: dict[tuple(int)] = float
     """
 
+    if isinstance(pot, ArrayPotential):
+        return ArrayPotential(
+            tuple(numpy.arange(len(grid)) for grid in pot.grids),
+            pot.values, mask=pot.mask)
+
     pot_keys = list(pot.keys())
     dim = dimension(pot)
 
@@ -171,6 +303,9 @@ def valid(pot):
     """ Check if the potential is valid
     """
 
+    if isinstance(pot, ArrayPotential):
+        return bool(numpy.all(numpy.isfinite(pot.values[pot.present()])))
+
     is_valid = True
 
     dim = dimension(pot)
@@ -186,12 +321,16 @@ def valid(pot):
 def is_nonempty(pot):
     """ Determine if the potential has any values
     """
+    if isinstance(pot, ArrayPotential):
+        return bool(numpy.any(numpy.isfinite(pot.values)))
     return any(val is not None for val in pot.values())
 
 
 def dimension(pot):
     """ Find the dimension of the potential
     """
+    if isinstance(pot, ArrayPotential):
+        return pot.values.ndim
     return len(list(pot.keys())[0])
 
 
@@ -213,6 +352,10 @@ def string(pot):
         call util.vec.string
     """
 
+    if isinstance(pot, ArrayPotential):
+        return ''.join(
+            f' {val:.6f}' for val in pot.values[pot.present()].tolist())
+
     pot_str = ''
     for val in pot.values():
         pot_str += f' {val:.6f}'
@@ -1,8 +1,9 @@
 """ Finds different types of maxima along potentials. Currently works
-    with lists of energies instead of the standard potential dict in
-    other functions.
+    with lists of energies, or arrays of energies on N-D grids, instead of
+    the standard potential dict in other functions.
 """
 
+import itertools
 import numpy
 from scipy.signal import argrelextrema
 from phydat import phycon
@@ -187,3 +188,179 @@ def _local_extrema(grid):
     loc_min = tuple(argrelextrema(numpy.array(grid), numpy.less)[0])
 
     return loc_max, loc_min
+
+
+# Functions for N-D potentials on grids, as arrays
+def find_maxnd(vals, max_type, ethresh=ETHRESH, periodic=True):
+    """ Find the desired maximum on an N-D potential grid, as a grid index.
+
+        This maximum could correspond to the highest first-order saddle
+        point, the one nearest to the middle of the grid, or simply the
+        global maximum. If there are no saddle points, the global maximum is
+        returned.
+
+        :param vals: potential values on the grid
+        :type vals: numpy.ndarray
+        :param max_type: 'sadpt-global', 'sadpt-innermost', or 'full-global'
+        :type max_type: str
+        :param ethresh: minimum height of a saddle point above its neighbors
+        :type ethresh: float
+        :param periodic: whether the grid axes are periodic
+        :type periodic: bool
+        :rtype: tuple(int)
+    """
+
+    vals = numpy.asarray(vals, dtype=float)
+    max_idx = numpy.unravel_index(numpy.nanargmax(vals), vals.shape)
+
+    if max_type in ('sadpt-global', 'sadpt-innermost'):
+        sadpt_idxs = saddle_points(
+            vals, ethresh=ethresh, periodic=periodic)
+        if len(sadpt_idxs):
+            if max_type == 'sadpt-global':
+                sel = numpy.argmax(vals[tuple(sadpt_idxs.T)])
+            else:
+                mid_idxs = (numpy.array(vals.shape) - 1) / 2.
+                sel = numpy.argmin(
+                    numpy.linalg.norm(sadpt_idxs - mid_idxs, axis=1))
+            max_idx = sadpt_idxs[sel]
+    elif max_type != 'full-global':
+        raise NotImplementedError(f'No max_type: {max_type}')
+
+    return tuple(map(int, max_idx))
+
+
+def saddle_points(vals, order=1, ethresh=ETHRESH, periodic=True):
+    """ Find the saddle points of some order on an N-D potential grid.
+
+        :param vals: potential values on the grid
+        :type vals: numpy.ndarray
+        :param order: number of negative curvatures of the saddle points
+        :type order: int
+        :param ethresh: minimum height above the lowest neighboring point
+        :type ethresh: float
+        :param periodic: whether the grid axes are periodic
+        :type periodic: bool
+        :return: the grid index of each saddle point
+        :rtype: numpy.ndarray, shape (nsadpts, ndim)
+    """
+
+    vals = numpy.asarray(vals, dtype=float)
+    idxs, orders = stationary_points(vals, periodic=periodic)
+    idxs = idxs[orders == order]
+
+    # Only keep saddle points that stand out from their neighbors
+    nbr_vals = _neighbor_values(vals, periodic=periodic)
+    nbr_min = numpy.nanmin(nbr_vals, axis=0)
+    heights = vals[tuple(idxs.T)] - nbr_min[tuple(idxs.T)]
+
+    return idxs[heights >= ethresh]
+
+
+def stationary_points(vals, periodic=True):
+    """ Find the stationary points on an N-D potential grid and their order,
+        which is the number of negative eigenvalues of their finite-difference
+        Hessian (0 for minima, 1 for first-order saddle points, etc.).
+
+        A grid point is stationary if it is a local extremum along each axis.
+
+        :param vals: potential values on the grid
+        :type vals: numpy.ndarray
+        :param periodic: whether the grid axes are periodic
+        :type periodic: bool
+        :return: the grid index and order of each stationary point
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    vals = numpy.asarray(vals, dtype=float)
+    ndim = vals.ndim
+
+    # Find points that are extrema along every axis
+    is_stat = numpy.ones(vals.shape, dtype=bool)
+    for axis in range(ndim):
+        dlo = vals - _shifted(vals, axis, -1, periodic)
+        dhi = vals - _shifted(vals, axis, 1, periodic)
+        is_stat &= (dlo * dhi) > 0.
+    idxs = numpy.argwhere(is_stat)
+
+    # Count the negative eigenvalues of the Hessian at each of them
+    hess = numpy.zeros((len(idxs), ndim, ndim))
+    for axis1 in range(ndim):
+        for axis2 in range(axis1, ndim):
+            hess_vals = _second_difference(vals, axis1, axis2, periodic)
+            hess[:, axis1, axis2] = hess[:, axis2, axis1] = (
+                hess_vals[tuple(idxs.T)])
+    orders = numpy.sum(numpy.linalg.eigvalsh(hess) < 0., axis=1)
+
+    return idxs, orders
+
+
+def local_extrema(vals, periodic=True):
+    """ Find the local minima and maxima on an N-D potential grid, compared
+        with all 3^N - 1 neighboring points.
+
+        :param vals: potential values on the grid
+        :type vals: numpy.ndarray
+        :param periodic: whether the grid axes are periodic
+        :type periodic: bool
+        :return: the grid indices of the local maxima and minima
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    vals = numpy.asarray(vals, dtype=float)
+    nbr_vals = _neighbor_values(vals, periodic=periodic)
+    with numpy.errstate(invalid='ignore'):
+        is_max = numpy.all((vals > nbr_vals) | numpy.isnan(nbr_vals), axis=0)
+        is_min = numpy.all((vals < nbr_vals) | numpy.isnan(nbr_vals), axis=0)
+
+    return numpy.argwhere(is_max), numpy.argwhere(is_min)
+
+
+def _neighbor_values(vals, periodic=True):
+    """ The values at each of the 3^N - 1 neighbors of every grid point,
+        stacked along the first axis; off-grid neighbors are NaN
+    """
+
+    nbr_vals = []
+    for shifts in itertools.product((-1, 0, 1), repeat=vals.ndim):
+        if any(shifts):
+            nbr = vals
+            for axis, shift in enumerate(shifts):
+                if shift:
+                    nbr = _shifted(nbr, axis, shift, periodic)
+            nbr_vals.append(nbr)
+
+    return numpy.array(nbr_vals)
+
+
+def _shifted(vals, axis, shift, periodic):
+    """ The values at the neighbor along an axis, for every grid point; for
+        non-periodic grids, off-grid neighbors are NaN
+    """
+
+    nbr = numpy.roll(vals, -shift, axis=axis)
+    if not periodic:
+        nbr = numpy.array(nbr, dtype=float)
+        edge = [slice(None)] * vals.ndim
+        edge[axis] = -1 if shift > 0 else 0
+        nbr[tuple(edge)] = numpy.nan
+
+    return nbr
+
+
+def _second_difference(vals, axis1, axis2, periodic):
+    """ Central finite-difference second derivative on a grid, in units of
+        the grid spacing
+    """
+
+    if axis1 == axis2:
+        diff = (_shifted(vals, axis1, 1, periodic) - 2. * vals +
+                _shifted(vals, axis1, -1, periodic))
+    else:
+        diff = 0.25 * (
+            _shifted(_shifted(vals, axis1, 1, periodic), axis2, 1, periodic) -
+            _shifted(_shifted(vals, axis1, 1, periodic), axis2, -1, periodic) -
+            _shifted(_shifted(vals, axis1, -1, periodic), axis2, 1, periodic) +
+            _shifted(_shifted(vals, axis1, -1, periodic), axis2, -1, periodic))
+
+    return diff
@@ -9,35 +9,109 @@ def scale_frequencies_and_zpe(freqs, method, basis, scale_method='c3'):
     """ Scale frequencies according to some method
         obtain a corrected zpe
     """
-    scaled_freqs = scale_frequencies(
-        freqs, method, basis, scale_method=scale_method)
+    scaled_freqs, scaled_zpes = scale_frequency_sets_and_zpes(
+        (freqs,), method, basis, scale_method=scale_method)
+    return (tuple(scaled_freqs[0, :len(freqs)].tolist()),
+            float(scaled_zpes[0]))
+
+
+def scale_frequencies(freqs, method, basis, scale_method='c3'):
+    """ Scale frequencies according to some method
+    """
+    # Scale the frequencies
+    if scale_method in SCALE_METHODS:
+        scaled_freqs = SCALE_METHODS[scale_method](freqs, method, basis)
+    else:
+        scaled_freqs = freqs
+    return scaled_freqs
+
+
+def scale_frequency_sets_and_zpes(freqs_lst, method, basis,
+                                  scale_method='c3', nfreqs=None):
+    """ Scale several sets of frequencies according to some method, such as
+        those of every conformer of a species, and obtain corrected zpes
+
+        :param freqs_lst: the sets of frequencies, in cm-1, or a padded
+            array of them, with the lengths given by nfreqs
+        :type freqs_lst: tuple(tuple(float)) or numpy.ndarray
+        :param nfreqs: the number of frequencies in each row of the padded
+            array, if one is given
+        :type nfreqs: tuple(int)
+        :returns: the scaled frequencies, padded with zeros, and the zpes
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    freqs, _ = _padded_frequencies(freqs_lst, nfreqs=nfreqs)
+    scaled_freqs = _scale_padded_frequencies(
+        freqs, method, basis, scale_method)
 
-    scaled_zpe = 0.0
     if 'harm' in scale_method:
         # Calculate harmonic zpe using scaled frequencies
-        scaled_zpe = sum(scaled_freqs)/2.0 * phycon.WAVEN2EH
+        scaled_zpes = numpy.sum(scaled_freqs, axis=1) / 2.0
     else:
         # Calculate the anharmonic zpe using the scaled anharmonic freqs
         # but you have to get harmonic version of those freqs first
-        harm_sfreqs = scale_frequencies(
-            freqs, method, basis, scale_method=HARM_OF_SM[scale_method])
-        for freq, scfreq in zip(harm_sfreqs, scaled_freqs):
-            scaled_zpe += _anharm_zpve_from_scaling(freq, scfreq)
-        scaled_zpe *= phycon.WAVEN2EH
-    return scaled_freqs, scaled_zpe
+        harm_sfreqs = _scale_padded_frequencies(
+            freqs, method, basis, HARM_OF_SM[scale_method])
+        scaled_zpes = numpy.sum(
+            _anharm_zpve_from_scaling(harm_sfreqs, scaled_freqs), axis=1)
+
+    return scaled_freqs, scaled_zpes * phycon.WAVEN2EH
+
+
+def scale_frequency_sets(freqs_lst, method, basis, scale_method='c3',
+                         nfreqs=None):
+    """ Scale several sets of frequencies according to some method
+
+        :param freqs_lst: the sets of frequencies, in cm-1, or a padded
+            array of them, with the lengths given by nfreqs
+        :type freqs_lst: tuple(tuple(float)) or numpy.ndarray
+        :param nfreqs: the number of frequencies in each row of the padded
+            array, if one is given
+        :type nfreqs: tuple(int)
+        :returns: the scaled frequencies, padded with zeros
+        :rtype: numpy.ndarray
+    """
+    freqs, _ = _padded_frequencies(freqs_lst, nfreqs=nfreqs)
+    return _scale_padded_frequencies(freqs, method, basis, scale_method)
 
 
-def scale_frequencies(freqs, method, basis, scale_method='c3'):
-    """ Scale frequencies according to some method
+def _scale_padded_frequencies(freqs, method, basis, scale_method):
+    """ Scale a zero-padded array of frequencies, looking up the
+        coefficients for the method and basis only once
     """
-    # Scale the frequencies
-    if scale_method in SCALE_METHODS:
-        scaled_freqs = SCALE_METHODS[scale_method](freqs, method, basis)
+    if scale_method in SCALE_COEFFS:
+        coeffs = SCALE_COEFFS[scale_method].get(
+            (method, basis), (1.0, 0.0, 0.0))
+        scaled_freqs = _three_coeff_scaling(freqs, coeffs)
     else:
         scaled_freqs = freqs
     return scaled_freqs
 
 
+def _padded_frequencies(freqs_lst, nfreqs=None, fill_val=0.0):
+    """ Gather sets of frequencies of different lengths into a padded array
+
+        :returns: the padded array and a mask of the frequencies in it
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    if nfreqs is None:
+        nfreqs = numpy.array([len(freqs) for freqs in freqs_lst], dtype=int)
+        mask = numpy.arange(max(nfreqs, default=0)) < nfreqs[:, numpy.newaxis]
+        freqs = numpy.full(mask.shape, fill_val)
+        if mask.any():
+            freqs[mask] = numpy.concatenate(
+                [numpy.ravel(fqs) for fqs in freqs_lst])
+    else:
+        freqs = numpy.array(freqs_lst, dtype=float)
+        mask = (numpy.arange(freqs.shape[1]) <
+                numpy.asarray(nfreqs)[:, numpy.newaxis])
+        freqs[~mask] = fill_val
+
+    return freqs, mask
+
+
 def _anharm_zpve_from_scaling(freq, scaled_freq):
     """ Determine what the anharmonic ZPVE should be after scaling
     """
@@ -48,37 +122,10 @@ def rotor_scale_factor_from_harmonics(rt_freqs, rth_freqs, tors_freqs):
     """ scaling factor for rotor potentials to map them into harmonic
     """
 
-    # Create a scaling factor for the frequencies
-    # First sort tors frequencies in ascending order
-    sort_tors_freqs = sorted(tors_freqs)
-
-    # Keep only freqs whose RRHO freqs are above a threshold
-    freq_thresh = 20.
-    log_rt_freq = 0.0
-    nfreq_remove = 0
-    for freq in rt_freqs:
-        if freq > freq_thresh:
-            log_rt_freq += numpy.log(freq)
-        else:
-            nfreq_remove += 1
-
-    log_freq = [numpy.log(freq) for freq in rth_freqs]
-    log_freq = sum(log_freq)
-
-    log_tors_freq = 0.0
-    idx_remove = []
-    for idx, freq in enumerate(sort_tors_freqs):
-        if idx+1 > nfreq_remove:
-            log_tors_freq += numpy.log(freq)
-        else:
-            idx_remove.append(tors_freqs.index(freq))
-
-    # Generate the scaling factor
-    factor = numpy.exp(log_rt_freq - log_freq - log_tors_freq)
-    scale_factor = (idx_remove, factor)
+    (idx_remove,), (factor,), (tau_factor,) = _rotor_scale_factors(
+        (rt_freqs,), (rth_freqs,), (tors_freqs,))
 
     # generate the set of indices for torsions that are two be scales
-    tau_factor = numpy.exp(log_rt_freq - log_freq)
     tau_factor_mode = tau_factor
     tau_str = '-'.join([str(ridx) for ridx in idx_remove])
     print(f'TAU FACTOR {tau_factor_mode:4.6f} \t '
@@ -92,6 +139,61 @@ def rotor_scale_factor_from_harmonics(rt_freqs, rth_freqs, tors_freqs):
     return scale_factor
 
 
+def rotor_scale_factors_from_harmonics(rt_freqs_lst, rth_freqs_lst,
+                                       tors_freqs_lst):
+    """ scaling factors for rotor potentials to map them into harmonic, for
+        several species or conformers at once
+
+        :param rt_freqs_lst: the RRHO frequencies of each structure
+        :param rth_freqs_lst: the projected RRHO frequencies of each structure
+        :param tors_freqs_lst: the torsional frequencies of each structure
+        :returns: the indices of the torsions to remove for each structure,
+            and the scaling factors
+        :rtype: (tuple(list(int)), numpy.ndarray)
+    """
+    idx_removes, factors, _ = _rotor_scale_factors(
+        rt_freqs_lst, rth_freqs_lst, tors_freqs_lst)
+    return idx_removes, factors
+
+
+def _rotor_scale_factors(rt_freqs_lst, rth_freqs_lst, tors_freqs_lst):
+    """ Rotor scaling factors and tau factors, over padded arrays
+    """
+
+    # Keep only freqs whose RRHO freqs are above a threshold
+    freq_thresh = 20.
+    rt_freqs, rt_mask = _padded_frequencies(rt_freqs_lst, fill_val=1.0)
+    above = rt_mask & (rt_freqs > freq_thresh)
+    log_rt_freq = numpy.sum(numpy.log(rt_freqs, where=above,
+                                      out=numpy.zeros_like(rt_freqs)), axis=1)
+    nfreq_remove = numpy.sum(rt_mask & ~above, axis=1)
+
+    rth_freqs, _ = _padded_frequencies(rth_freqs_lst, fill_val=1.0)
+    log_freq = numpy.sum(numpy.log(rth_freqs), axis=1)
+
+    # Sort the tors frequencies in ascending order, and remove as many of the
+    # lowest ones as there were RRHO frequencies removed
+    tors_freqs, tors_mask = _padded_frequencies(
+        tors_freqs_lst, fill_val=numpy.inf)
+    sort_idxs = numpy.argsort(tors_freqs, axis=1, kind='stable')
+    sort_tors_freqs = numpy.take_along_axis(tors_freqs, sort_idxs, axis=1)
+    ranks = numpy.arange(tors_freqs.shape[1])
+    sort_tors_mask = numpy.take_along_axis(tors_mask, sort_idxs, axis=1)
+    removed = (ranks < nfreq_remove[:, numpy.newaxis]) & sort_tors_mask
+    kept = ~removed & sort_tors_mask
+    log_tors_freq = numpy.sum(
+        numpy.log(sort_tors_freqs, where=kept,
+                  out=numpy.zeros_like(sort_tors_freqs)), axis=1)
+    idx_removes = tuple(
+        idxs[rmv].tolist() for idxs, rmv in zip(sort_idxs, removed))
+
+    # Generate the scaling factor
+    factors = numpy.exp(log_rt_freq - log_freq - log_tors_freq)
+    tau_factors = numpy.exp(log_rt_freq - log_freq)
+
+    return idx_removes, factors, tau_factors
+
+
 # Library of vibrational frequency scaling methods
 M3_COEFFS_ANHARM = {
     # ('b2plypd3', 'cc-pvtz'): (1.066, 0.008045, 0.33),
@@ -108,27 +210,24 @@ M3_COEFFS_HARM = {
 def _three_coeff_anharm_scaling(freqs, method, basis):
     """ Scales frequencies using factos with three coefficients
     """
-
-    cf1, cf2, cf3 = M3_COEFFS_ANHARM.get((method, basis), (1.0, 0.0, 0.0))
-    scaled_freqs = ()
-    for freq in freqs:
-        scale_factor = cf1 - (cf2 * freq**cf3)
-        scaled_freqs += (freq * scale_factor,)
-
-    return scaled_freqs
+    coeffs = M3_COEFFS_ANHARM.get((method, basis), (1.0, 0.0, 0.0))
+    return tuple(_three_coeff_scaling(freqs, coeffs).tolist())
 
 
 def _three_coeff_harm_scaling(freqs, method, basis):
     """ Scales frequencies using one factor, same factor applies to all frequencies
     """
-    cf1, cf2, cf3 = M3_COEFFS_HARM.get((method, basis), (1.0, 0.0, 0.0))
-    scaled_freqs = ()
-    for freq in freqs:
-        scale_factor = cf1 - (cf2 * freq**cf3)
-        scaled_freqs += (freq * scale_factor,)
-        # print('m3 test:', freq,scale_factor)
-    # print('scaled freq test:',scaled_freqs)
-    return scaled_freqs
+    coeffs = M3_COEFFS_HARM.get((method, basis), (1.0, 0.0, 0.0))
+    return tuple(_three_coeff_scaling(freqs, coeffs).tolist())
+
+
+def _three_coeff_scaling(freqs, coeffs):
+    """ Scales an array of frequencies using three coefficients
+    """
+    cf1, cf2, cf3 = coeffs
+    freqs = numpy.asarray(freqs, dtype=float)
+    scale_factor = cf1 - (cf2 * numpy.power(freqs, cf3))
+    return freqs * scale_factor
 
 
 SCALE_METHODS = {
@@ -136,6 +235,11 @@ SCALE_METHODS = {
     'c3_harm':  _three_coeff_harm_scaling
 }
 
+SCALE_COEFFS = {
+    'c3': M3_COEFFS_ANHARM,
+    'c3_harm': M3_COEFFS_HARM
+}
+
 HARM_OF_SM = {
     'c3': 'c3_harm'
 }
@@ -4,6 +4,13 @@
 from automol.reac._reac import Reaction
 from automol.reac._reac import string
 from automol.reac._reac import from_string
+from automol.reac._reac import from_data
+from automol.reac._reac import json_data
+from automol.reac._reac import from_json_data
+from automol.reac._reac import json_string
+from automol.reac._reac import from_json_string
+from automol.reac._reac import write_json_lines
+from automol.reac._reac import read_json_lines
 from automol.reac._reac import reverse
 from automol.reac._reac import atom_mapping
 from automol.reac._reac import forming_bond_keys
@@ -43,6 +50,7 @@ from automol.reac._find import find_from_inchis
 from automol.reac._find import intersystem_crossing
 # TS geometries
 from automol.reac._geom import ts_geometry
+from automol.reac._geom import ts_geometries
 # TS zmatrices
 from automol.reac._zmat import ts_zmatrix
 from automol.reac._zmat import zmatrix_coordinate_names
@@ -50,6 +58,8 @@ from automol.reac._zmat import zmatrix_coordinate_names
 from automol.reac._scan import build_scan_info
 from automol.reac._scan import scan_coordinate
 from automol.reac._scan import constraint_coordinates
+from automol.reac._scan import scan_grid
+from automol.reac._scan import scan_grid_geometries
 # rotational bonds & torsions
 from automol.reac._rot import linear_atom_keys
 from automol.reac._rot import rotational_bond_keys
@@ -60,6 +70,7 @@ from automol.reac._stereo import add_stereo_from_geometries
 from automol.reac._stereo import add_stereo_from_inchis
 from automol.reac._stereo import add_stereo_from_unordered_geometries
 from automol.reac._stereo import expand_stereo
+from automol.reac._stereo import expand_stereo_iter
 from automol.reac._stereo import expand_product_stereo
 from automol.reac._stereo import is_stereo_consistent
 # reaction products
@@ -71,7 +82,9 @@ from automol.reac._instab import instability_product_graphs
 from automol.reac._instab import instability_transformation
 # phase space theory
 from automol.reac._pst import pst_kt
+from automol.reac._pst import pst_kts
 from automol.reac._pst import pst_cn
+from automol.reac._pst import pst_cns
 # tunneling treatments
 from automol.reac import tunnel
 # comp functions
@@ -90,6 +103,13 @@ __all__ = [
     'Reaction',
     'string',
     'from_string',
+    'from_data',
+    'json_data',
+    'from_json_data',
+    'json_string',
+    'from_json_string',
+    'write_json_lines',
+    'read_json_lines',
     'reverse',
     'atom_mapping',
     'forming_bond_keys',
@@ -129,6 +149,7 @@ __all__ = [
     'intersystem_crossing',
     # TS geometries
     'ts_geometry',
+    'ts_geometries',
     # TS zmatrices
     'ts_zmatrix',
     'zmatrix_coordinate_names',
@@ -136,6 +157,8 @@ __all__ = [
     'build_scan_info',
     'scan_coordinate',
     'constraint_coordinates',
+    'scan_grid',
+    'scan_grid_geometries',
     # rotational bonds & torsions
     'linear_atom_keys',
     'rotational_bond_keys',
@@ -146,6 +169,7 @@ __all__ = [
     'add_stereo_from_inchis',
     'add_stereo_from_unordered_geometries',
     'expand_stereo',
+    'expand_stereo_iter',
     'expand_product_stereo',
     'is_stereo_consistent',
     # reaction products
@@ -157,7 +181,9 @@ __all__ = [
     'instability_transformation',
     # phase space theory
     'pst_kt',
+    'pst_kts',
     'pst_cn',
+    'pst_cns',
     # tunneling treatments
     'tunnel',
     # comp functions
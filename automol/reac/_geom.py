@@ -1,6 +1,8 @@
 """ TS geometries for specific reaction classes
 """
 import itertools
+import functools
+import concurrent.futures
 import more_itertools as mit
 import automol.geom.ts
 from automol.par import ReactionClass
@@ -12,11 +14,14 @@ from automol.reac._util import hydrogen_abstraction_is_sigma
 
 # Unimolecular reactions
 def hydrogen_migration_ts_geometry(rxn, rct_geos,
-                                   max_dist_err=2e-1, log=False):
+                                   max_dist_err=2e-1, log=False,
+                                   bnds_cache=None):
     """ geometry for a hydrogen migration transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.HYDROGEN_MIGRATION
     assert rxn.has_standard_keys()
@@ -37,16 +42,19 @@ def hydrogen_migration_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
 def beta_scission_ts_geometry(rxn, rct_geos,
-                              max_dist_err=2e-1, log=False):
+                              max_dist_err=2e-1, log=False,
+                              bnds_cache=None):
     """ geometry for a beta scission transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.BETA_SCISSION
     assert rxn.has_standard_keys()
@@ -67,16 +75,19 @@ def beta_scission_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
 def ring_forming_scission_ts_geometry(rxn, rct_geos,
-                                      max_dist_err=2e-1, log=False):
+                                      max_dist_err=2e-1, log=False,
+                                      bnds_cache=None):
     """ geometry for a ring-forming scission transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.RING_FORM_SCISSION
     assert rxn.has_standard_keys()
@@ -107,7 +118,7 @@ def ring_forming_scission_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
 
     # Rerun the optimization, enforcing planarity on the ring
     dist_dct = automol.geom.ts.distances([geo], angstrom=True)
@@ -125,17 +136,20 @@ def ring_forming_scission_ts_geometry(rxn, rct_geos,
         gra, [geo], geo, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
         pla_dct=pla_dct,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
 
     return geo
 
 
 def elimination_ts_geometry(rxn, rct_geos,
-                            max_dist_err=2e-1, log=False):
+                            max_dist_err=2e-1, log=False,
+                            bnds_cache=None):
     """ geometry for an elimination transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.ELIMINATION
     assert rxn.has_standard_keys()
@@ -158,17 +172,20 @@ def elimination_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
 # Bimolecular reactions
 def hydrogen_abstraction_ts_geometry(rxn, rct_geos,
-                                     max_dist_err=2e-1, log=False):
+                                     max_dist_err=2e-1, log=False,
+                                     bnds_cache=None):
     """ geometry for a hydrogen abstraction transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.HYDROGEN_ABSTRACTION
     assert rxn.has_standard_keys()
@@ -201,16 +218,19 @@ def hydrogen_abstraction_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
 def addition_ts_geometry(rxn, rct_geos,
-                         max_dist_err=2e-1, log=False):
+                         max_dist_err=2e-1, log=False,
+                         bnds_cache=None):
     """ geometry for an addition transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.ADDITION
     assert rxn.has_standard_keys()
@@ -244,16 +264,19 @@ def addition_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
 def insertion_ts_geometry(rxn, rct_geos,
-                          max_dist_err=2e-1, log=False):
+                          max_dist_err=2e-1, log=False,
+                          bnds_cache=None):
     """ geometry for an insertion transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.INSERTION
     assert rxn.has_standard_keys()
@@ -298,16 +321,19 @@ def insertion_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
 def substitution_ts_geometry(rxn, rct_geos,
-                             max_dist_err=2e-1, log=False):
+                             max_dist_err=2e-1, log=False,
+                             bnds_cache=None):
     """ geometry for a substitution transition state
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     """
     assert rxn.class_ == ReactionClass.Typ.SUBSTITUTION
     assert rxn.has_standard_keys()
@@ -348,15 +374,18 @@ def substitution_ts_geometry(rxn, rct_geos,
     geo = _geometry_from_info(
         gra, rct_geos, geo_init, dist_range_dct,
         relax_ang=relax_ang, relax_tors=relax_tors,
-        max_dist_err=max_dist_err, log=log)
+        max_dist_err=max_dist_err, log=log, bnds_cache=bnds_cache)
     return geo
 
 
-def ts_geometry(rxn, rct_geos, max_dist_err=2e-1, log=False):
+def ts_geometry(rxn, rct_geos, max_dist_err=2e-1, log=False,
+                bnds_cache=None):
     """ reaction-class-specific embedding info
 
     :param rxn: a Reaction object
     :param rct_geos: the reactant geometries
+    :param bnds_cache: a dictionary for reusing distance bounds matrices
+        between calls, as in `ts_geometries`
     :returns: the TS geometry
     """
     function_dct = {
@@ -375,20 +404,91 @@ def ts_geometry(rxn, rct_geos, max_dist_err=2e-1, log=False):
     }
 
     fun_ = function_dct[rxn.class_]
-    geo = fun_(rxn, rct_geos, max_dist_err=max_dist_err, log=log)
+    geo = fun_(rxn, rct_geos, max_dist_err=max_dist_err, log=log,
+               bnds_cache=bnds_cache)
     return geo
 
 
+def ts_geometries(rxns, rct_geos_lst, max_dist_err=2e-1, nprocs=1):
+    """ TS guess geometries for a batch of reactions
+
+    Reactions that only differ by their atom stereo assignments, such as the
+    stereomers of a reaction from `expand_stereo`, are handled together so
+    that their initial distance bounds matrices are only built once.
+
+    :param rxns: a sequence of Reaction objects
+    :param rct_geos_lst: the reactant geometries for each reaction
+    :param nprocs: the number of processes to run on; if 1, the geometries
+        are generated serially, without a process pool
+    :type nprocs: int
+    :returns: the TS geometry for each reaction, in order; if a reaction
+        fails, the exception it raised is returned in its place
+    :rtype: tuple
+    """
+    assert len(rxns) == len(rct_geos_lst), (
+        f"{len(rxns)} reactions, but {len(rct_geos_lst)} sets of geometries")
+
+    # Group the reactions by TS graph, up to atom stereo
+    idxs_dct = {}
+    for idx, rxn in enumerate(rxns):
+        tsg_key = _bounds_key(rxn.forward_ts_graph)
+        idxs_dct.setdefault(tsg_key, []).append(idx)
+
+    jobs = [[(idx, rxns[idx], rct_geos_lst[idx]) for idx in idxs]
+            for idxs in idxs_dct.values()]
+    run_ = functools.partial(_ts_geometries_job, max_dist_err=max_dist_err)
+
+    if nprocs == 1:
+        rets_lst = list(map(run_, jobs))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(nprocs) as executor:
+            rets_lst = list(executor.map(run_, jobs))
+
+    geos = [None] * len(rxns)
+    for idx, ret in itertools.chain(*rets_lst):
+        geos[idx] = ret
+
+    return tuple(geos)
+
+
+def _ts_geometries_job(job, max_dist_err=2e-1):
+    """ TS geometries for a group of reactions sharing a bounds cache
+    """
+    bnds_cache = {}
+    rets = []
+    for idx, rxn, rct_geos in job:
+        try:
+            ret = ts_geometry(rxn, rct_geos, max_dist_err=max_dist_err,
+                              bnds_cache=bnds_cache)
+        except Exception as err:  # pylint: disable=broad-except
+            ret = err
+        rets.append((idx, ret))
+    return rets
+
+
 # helpers
 def _geometry_from_info(gra, rct_geos, geo_init, dist_range_dct,
                         relax_ang=False, relax_tors=False,
                         pla_dct=None,
-                        max_dist_err=2e-1, log=False):
+                        max_dist_err=2e-1, log=False, bnds_cache=None):
     keys = sorted(atom_keys(gra))
     xmat = automol.geom.coordinates(geo_init, angstrom=True)
+
+    # The initial bounds only depend on the graph, up to atom stereo, so they
+    # can be reused if a cache is passed in
+    sp_dct = init_mats = None
+    if bnds_cache is not None:
+        gra_key = _bounds_key(gra)
+        if gra_key not in bnds_cache:
+            sp_dct_ = automol.graph.atom_shortest_paths(gra)
+            bnds_cache[gra_key] = (
+                sp_dct_, automol.graph.embed.distance_bounds_matrices(
+                    gra, keys, sp_dct=sp_dct_))
+        sp_dct, init_mats = bnds_cache[gra_key]
+
     lmat, umat = automol.graph.embed.join_distance_bounds_matrices(
         gra, keys, dist_range_dct, geos=rct_geos, relax_angles=relax_ang,
-        relax_torsions=relax_tors)
+        relax_torsions=relax_tors, sp_dct=sp_dct, init_mats=init_mats)
 
     pla_dct = {} if pla_dct is None else pla_dct
     chi_dct = automol.graph.embed.chirality_constraint_bounds(gra, keys)
@@ -405,3 +505,12 @@ def _geometry_from_info(gra, rct_geos, geo_init, dist_range_dct,
     xyzs = xmat[:, :3]
     geo = automol.geom.from_data(syms, xyzs, angstrom=True)
     return geo
+
+
+def _bounds_key(gra):
+    """ a hashable key for the distance bounds of a graph, which don't depend
+    on its atom stereo assignments
+    """
+    gra = automol.graph.set_atom_stereo_parities(
+        gra, dict.fromkeys(atom_keys(gra)))
+    return automol.graph.frozen(gra)
@@ -2,6 +2,7 @@
  Build unstable products
 """
 
+import functools
 import itertools
 from phydat import instab_fgrps
 import automol.graph
@@ -68,22 +69,59 @@ def instability_product_graphs(gra, stereo=True):
 
     # Check for instability causing functional groups
     prd_gras = ()
+    instab_dct = instability_group_graphs()
     for atm, grps in rad_grp_dct.items():
-        if atm in instab_fgrps.DCT:
-            fgrps_dct = instab_fgrps.DCT[atm]
-            for grp in grps:
-                grp_ich = automol.graph.inchi(grp, stereo=stereo)
-                if grp_ich in fgrps_dct:
-                    # If instability found, determine prod of the instability
-                    prd_ich = fgrps_dct[grp_ich]
-                    prd_geo = automol.inchi.geometry(prd_ich)
-                    prd_gra = automol.geom.graph(prd_geo)
-                    prd_gras = radical_dissociation_products(gra, prd_gra)
-                    break
+        for grp in grps:
+            prd_gra = _instability_product_graph(
+                grp, instab_dct.get(atm, ()), stereo=stereo)
+            if prd_gra is not None:
+                # If instability found, determine prod of the instability
+                prd_gras = radical_dissociation_products(gra, prd_gra)
+                break
 
     return prd_gras
 
 
+@functools.lru_cache(maxsize=None)
+def instability_group_graphs():
+    """ The table of instability-causing functional groups from
+        `phydat.instab_fgrps`, compiled into graphs
+
+        The InChIs in the table are converted once, on the first call, and
+        the result is cached.
+
+        :returns: (group graph, group formula, product graph) triples, by
+            the symbol of the radical atom the group is attached to
+        :rtype: dict[str: tuple]
+    """
+    instab_dct = {}
+    for atm, fgrps_dct in instab_fgrps.DCT.items():
+        instab_dct[atm] = tuple(
+            (grp_gra, automol.graph.formula(grp_gra), prd_gra)
+            for grp_gra, prd_gra in (
+                (automol.graph.explicit(automol.inchi.graph(grp_ich)),
+                 automol.graph.explicit(automol.inchi.graph(prd_ich)))
+                for grp_ich, prd_ich in fgrps_dct.items()))
+    return instab_dct
+
+
+def _instability_product_graph(grp, instab_grps, stereo=True):
+    """ Match a radical group against compiled instability groups, returning
+        the product graph of the first match, if any
+
+        Candidates are screened by formula before checking isomorphism.
+    """
+    prd_gra = None
+    if instab_grps:
+        grp_fml = automol.graph.formula(grp)
+        for instab_grp, instab_fml, instab_prd in instab_grps:
+            if grp_fml == instab_fml and automol.graph.isomorphism(
+                    grp, instab_grp, backbone_only=True, stereo=stereo):
+                prd_gra = instab_prd
+                break
+    return prd_gra
+
+
 # Build transformation object for instability
 def instability_transformation(conn_zma, disconn_zmas):
     """ Build the reaction objects for an instability
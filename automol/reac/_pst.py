@@ -5,20 +5,23 @@
   dependence  of k(n, mu, C0, T).
 """
 
-import scipy
 import numpy
+import scipy.special
 from phydat import phycon
 
 
 def pst_kt(n_par, mred, cn_par, temp):
     """ Calculate a rate constant according to Phase-Space Theory.
 
+        The arguments may be arrays, which are broadcast together and are
+        not modified.
+
         :param n_par: exponential parameter
         :param mred: reduced mass ()
         :param cn_par: pre-exponential potential coefficient [in Bohr]
         :param temp: temperature (K)
         :return: k(T)
-        :rtype: float
+        :rtype: float or numpy.ndarray
 
         temp_pst [K] -> [hartree]
         n_par [unitless]
@@ -30,15 +33,16 @@ def pst_kt(n_par, mred, cn_par, temp):
     # amu2au = 1.0 / (9.1093837015e-28 * 6.022e23)
     # BOHR2CM = 5.29177e-9
 
-    mred *= phycon.AMU2AU
-    temp *= phycon.K2EH
+    n_par = numpy.asarray(n_par, dtype=float)
+    mred = numpy.multiply(mred, phycon.AMU2AU)
+    temp = numpy.multiply(temp, phycon.K2EH)
 
     kt_val = (
         (8.0 * numpy.pi)**(1.0/2.0) *
         ((n_par - 2) / 2)**(2.0/n_par) *
         scipy.special.gamma(1.0 - 2.0/n_par) *
         mred**(-1.0/2.0) *
-        cn_par**(2.0/n_par) *
+        numpy.power(cn_par, 2.0/n_par) *
         temp**(1.0/2.0 - 2.0/n_par)
     )
     kt_val *= (phycon.BOHR2CM**3 / phycon.JIFFY)
@@ -46,14 +50,69 @@ def pst_kt(n_par, mred, cn_par, temp):
     return kt_val
 
 
+def pst_kts(n_pars, mreds, cn_pars, temps):
+    """ Calculate Phase-Space Theory rate constants for several channels over
+        a grid of temperatures.
+
+        :param n_pars: exponential parameter of each channel
+        :type n_pars: float or tuple(float)
+        :param mreds: reduced mass of each channel (amu)
+        :type mreds: float or tuple(float)
+        :param cn_pars: pre-exponential potential coefficient of each channel
+        :type cn_pars: float or tuple(float)
+        :param temps: temperatures (K)
+        :type temps: tuple(float)
+        :return: k(T) for each channel and temperature
+        :rtype: numpy.ndarray, shape (nchannels, ntemps)
+    """
+
+    n_pars, mreds, cn_pars = numpy.broadcast_arrays(
+        numpy.atleast_1d(n_pars), numpy.atleast_1d(mreds),
+        numpy.atleast_1d(cn_pars))
+    temps = numpy.atleast_1d(temps)
+    return pst_kt(n_pars[:, numpy.newaxis], mreds[:, numpy.newaxis],
+                  cn_pars[:, numpy.newaxis], temps[numpy.newaxis, :])
+
+
 def pst_cn(kt_pst, n_pst, mred, t_pst):
     """ Calculate a Cn value to match a k(T) value for PST
   For (n=N, mu=MU, T=T), the target parameter (C0_TGT) needed to obtain
   the target rate constant (k_TGT) can be found via
 
     C0_TGT**(2/n) = [ k_TGT / k(n=N, mu=MU, C0=1.0, T=300.0) ] * 1.0
+
+  The arguments may be arrays, which are broadcast together.
     """
 
-    cn_par = numpy.sqrt(kt_pst / pst_kt(n_pst, mred, 1.0, t_pst))**n_pst
+    cn_par = numpy.power(
+        numpy.sqrt(kt_pst / pst_kt(n_pst, mred, 1.0, t_pst)), n_pst)
 
     return cn_par
+
+
+def pst_cns(kt_psts, n_psts, mreds, t_psts):
+    """ Fit Cn values for several channels at once, each to rate constants
+        over a grid of temperatures
+
+        Since k(T) is proportional to Cn**(2/n), the least-squares fit of
+        log k(T) gives log Cn = (n/2) * mean[log k(T) - log k(T; Cn=1)].
+
+        :param kt_psts: target k(T) for each channel and temperature
+        :type kt_psts: numpy.ndarray, shape (nchannels, ntemps)
+        :param n_psts: exponential parameter of each channel
+        :type n_psts: float or tuple(float)
+        :param mreds: reduced mass of each channel (amu)
+        :type mreds: float or tuple(float)
+        :param t_psts: temperatures (K)
+        :type t_psts: tuple(float)
+        :return: Cn for each channel
+        :rtype: numpy.ndarray
+    """
+
+    kt_psts = numpy.atleast_2d(kt_psts)
+    n_psts = numpy.broadcast_to(
+        numpy.asarray(n_psts, dtype=float), kt_psts.shape[:1])
+    kt1s = pst_kts(n_psts, mreds, 1.0, t_psts)
+    log_cn2s = numpy.mean(numpy.log(kt_psts) - numpy.log(kt1s), axis=1)
+
+    return numpy.exp(n_psts / 2.0 * log_cn2s)
@@ -8,6 +8,7 @@ Function arguments:
 """
 
 import itertools
+import json
 import yaml
 import numpy
 import automol.geom.ts
@@ -199,6 +200,125 @@ def from_string(rxn_str, one_indexed=True):
     return rxn
 
 
+def from_data(rxn_cls, forw_tsg, back_tsg, rcts_keys, prds_keys,
+              check=True):
+    """ Construct a reaction object from its data
+
+        With `check=False`, the reaction is built directly from the data,
+        skipping the consistency checks in the `Reaction` constructor. Only
+        use this for data that is already known to be consistent, such as
+        data coming from another reaction object or from a serialization.
+
+        :param rxn_cls: the name of the reaction class
+        :type rxn_cls: str
+        :param forw_tsg: the forward transition state graph
+        :param back_tsg: the backward transition state graph
+        :param rcts_keys: keys for each reactant in the forward TS graph
+        :type rcts_keys: tuple[tuple[int]]
+        :param prds_keys: keys for each product in the backward TS graph
+        :type prds_keys: tuple[tuple[int]]
+        :param check: check the consistency of the data?
+        :type check: bool
+        :rtype: Reaction
+    """
+    if check:
+        rxn = Reaction(rxn_cls, forw_tsg, back_tsg, rcts_keys, prds_keys)
+    else:
+        rxn = Reaction.__new__(Reaction)
+        rxn.class_ = rxn_cls
+        rxn.reactants_keys = tuple(map(tuple, map(sorted, rcts_keys)))
+        rxn.products_keys = tuple(map(tuple, map(sorted, prds_keys)))
+        rxn.forward_ts_graph = forw_tsg
+        rxn.backward_ts_graph = back_tsg
+    return rxn
+
+
+def json_data(rxn):
+    """ Generate a compact, JSON-serializable representation of a reaction
+
+        format:
+            [rxn_cls, forw_tsg_data, back_tsg_data, rcts_keys, prds_keys]
+        [where the TS graph data is as in `automol.graph.json_data`]
+
+        :param rxn: the reaction object
+        :type rxn: Reaction
+        :rtype: list
+    """
+    return [rxn.class_,
+            automol.graph.json_data(rxn.forward_ts_graph),
+            automol.graph.json_data(rxn.backward_ts_graph),
+            [list(map(int, ks)) for ks in rxn.reactants_keys],
+            [list(map(int, ks)) for ks in rxn.products_keys]]
+
+
+def from_json_data(json_rxn, check=False):
+    """ Read a reaction object from its compact JSON representation
+
+        :param json_rxn: the data, as generated by `json_data`
+        :type json_rxn: list
+        :param check: check the consistency of the reaction? (slow)
+        :type check: bool
+        :rtype: Reaction
+    """
+    rxn_cls, json_forw_tsg, json_back_tsg, rcts_keys, prds_keys = json_rxn
+    forw_tsg = automol.graph.from_json_data(json_forw_tsg)
+    back_tsg = automol.graph.from_json_data(json_back_tsg)
+    return from_data(rxn_cls, forw_tsg, back_tsg, rcts_keys, prds_keys,
+                     check=check)
+
+
+def json_string(rxn):
+    """ Write a reaction object to a compact, single-line JSON string
+
+        This is much faster to write and read than the YAML string from
+        `string`, at the expense of human readability.
+
+        :param rxn: the reaction object
+        :type rxn: Reaction
+        :rtype: str
+    """
+    return json.dumps(json_data(rxn), separators=(',', ':'))
+
+
+def from_json_string(rxn_str, check=False):
+    """ Read a reaction object from a compact JSON string
+
+        :param rxn_str: string containing the reaction object
+        :type rxn_str: str
+        :param check: check the consistency of the reaction? (slow)
+        :type check: bool
+        :rtype: Reaction
+    """
+    return from_json_data(json.loads(rxn_str), check=check)
+
+
+def write_json_lines(rxns, stream):
+    """ Stream a sequence of reaction objects to a file object, one JSON
+        line per reaction
+
+        :param rxns: the reaction objects
+        :type rxns: tuple[Reaction]
+        :param stream: a writable text file object
+    """
+    for rxn in rxns:
+        stream.write(json_string(rxn))
+        stream.write('\n')
+
+
+def read_json_lines(stream, check=False):
+    """ Lazily read reaction objects from a file object written by
+        `write_json_lines`
+
+        :param stream: a readable text file object
+        :param check: check the consistency of each reaction? (slow)
+        :type check: bool
+        :returns: a generator over the reaction objects, in order
+    """
+    for line in stream:
+        if line.strip():
+            yield from_json_string(line, check=check)
+
+
 def reverse(rxn):
     """ Obtains the reaction object for the reverse reaction
 
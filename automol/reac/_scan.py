@@ -529,6 +529,47 @@ def scan_grid(zrxn, zma, var=False):
     return grid
 
 
+def scan_grid_geometries(zrxn, zma, var=False, dummy=False):
+    """ Cartesian coordinates of every point on the scan grid for a transition
+        state search, generated in a single vectorized pass (see
+        `automol.zmat.geometries`)
+
+        For a single scan coordinate, the points of all grid segments are
+        concatenated in order (as for the radical-radical grids); for several
+        scan coordinates, the points run over the product of their grids, with
+        the last coordinate varying fastest.
+
+        :param zrxn: a Reaction object, indexed for the z-matrix
+        :param zma: the TS z-matrix
+        :param var: use the grid for a variational TS search?
+        :type var: bool
+        :param dummy: include dummy atoms in the coordinates?
+        :type dummy: bool
+        :returns: the coordinates of each scan point, in bohr
+        :rtype: numpy.ndarray of shape (npoints, natoms, 3)
+    """
+    scan_names = scan_coordinate(zrxn, zma)
+    grids = scan_grid(zrxn, zma, var=var)
+
+    if len(scan_names) == 1:
+        grid_vals = numpy.concatenate(grids)[:, numpy.newaxis]
+    else:
+        assert len(scan_names) == len(grids), (
+            f"Mismatch between scan coordinates {scan_names} and grids")
+        grid_vals = numpy.stack(
+            numpy.meshgrid(*grids, indexing='ij'), axis=-1)
+        grid_vals = numpy.reshape(grid_vals, (-1, len(scan_names)))
+
+    name_mat = numpy.array(automol.zmat.name_matrix(zma), dtype=object)
+    val_mat = numpy.array(automol.zmat.value_matrix(zma), dtype=float)
+    val_mats = numpy.repeat(val_mat[numpy.newaxis], len(grid_vals), axis=0)
+    for idx, scan_name in enumerate(scan_names):
+        rows, cols = numpy.nonzero(name_mat == scan_name)
+        val_mats[:, rows, cols] = grid_vals[:, idx, numpy.newaxis]
+
+    return automol.zmat.geometries(zma, val_mats, dummy=dummy)
+
+
 # UPDATE GUESS DICTIONARY #
 TIGHT_TS_UPDATE_GUESS_DCT = {
     ReactionClass.Typ.BETA_SCISSION: False,
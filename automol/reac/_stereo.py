@@ -3,6 +3,7 @@
 import automol.graph
 import automol.geom
 from automol.reac._reac import Reaction
+from automol.reac._reac import from_data
 from automol.reac._reac import reverse
 from automol.reac._reac import atom_mapping
 from automol.reac._reac import reactant_graphs
@@ -140,16 +141,38 @@ def add_stereo_from_unordered_geometries(rxn, rct_geos, prd_geos,
     return found_srxn, order
 
 
-def expand_stereo(rxn):
+def expand_stereo(rxn, enant=True):
     """ Expand all possible stereo assignments for the reactants and products
     of this reaction. Only includes possibilities that are mutually consistent
     with each other.
 
     :param rxn: a reaction object
     :type rxn: Reaction
+    :param enant: include both members of each enantiomeric pair? if False,
+        only one representative of each pair will be returned
+    :type enant: bool
     :returns: a sequence reaction objects with stereo assignments
     :rtype: Reaction
     """
+    return tuple(expand_stereo_iter(rxn, enant=enant))
+
+
+def expand_stereo_iter(rxn, enant=True):
+    """ Lazily expand the possible stereo assignments for the reactants and
+    products of this reaction, in the same order as `expand_stereo`.
+
+    Since all stereo assignments come from the same reaction, the reaction
+    objects are built without re-checking their consistency. If `enant` is
+    False, forward TS stereomers whose mirror image has already been yielded
+    are skipped before their reverse stereomers are expanded, so only one
+    representative of each enantiomeric pair is generated.
+
+    :param rxn: a reaction object
+    :type rxn: Reaction
+    :param enant: include both members of each enantiomeric pair?
+    :type enant: bool
+    :returns: a generator over reaction objects with stereo assignments
+    """
     rxn_cls = rxn.class_
     forw_tsg = rxn.forward_ts_graph
     back_tsg = rxn.backward_ts_graph
@@ -158,28 +181,32 @@ def expand_stereo(rxn):
 
     key_dct = atom_mapping(rxn)
 
-    forw_ste_tsgs = ts.stereomers(forw_tsg)
-
-    srxns = []
-    for forw_ste_tsg in forw_ste_tsgs:
+    seen_forw_ste_tsgs = set()
+    for forw_ste_tsg in ts.stereomers(forw_tsg):
+        is_achiral = False
+        if not enant:
+            forw_frz = automol.graph.frozen(forw_ste_tsg)
+            refl_forw_frz = automol.graph.frozen(ts.reflect(forw_ste_tsg))
+            if refl_forw_frz in seen_forw_ste_tsgs:
+                continue
+            seen_forw_ste_tsgs.add(forw_frz)
+            is_achiral = refl_forw_frz == forw_frz
+
+        seen_back_ste_tsgs = set()
         for back_ste_tsg in ts.compatible_reverse_stereomers(forw_ste_tsg):
-            back_ste_tsg = automol.graph.relabel(back_ste_tsg, key_dct)
-
-            # But for dummy atoms, we could just do the conversion directly,
-            # but this avoids loss of dummy atoms from the products graph.
-            tsg_ = back_tsg
-            tsg_ = automol.graph.set_atom_stereo_parities(
-                tsg_, automol.graph.atom_stereo_parities(back_ste_tsg))
-            tsg_ = automol.graph.set_bond_stereo_parities(
-                tsg_, automol.graph.bond_stereo_parities(back_ste_tsg))
-            back_ste_tsg = tsg_
+            # A TS stereomer that is its own mirror image can still be
+            # compatible with both members of a pair of product enantiomers
+            if not enant and is_achiral:
+                refl_back_frz = automol.graph.frozen(ts.reflect(back_ste_tsg))
+                if refl_back_frz in seen_back_ste_tsgs:
+                    continue
+                seen_back_ste_tsgs.add(automol.graph.frozen(back_ste_tsg))
 
-            srxn = Reaction(rxn_cls, forw_ste_tsg, back_ste_tsg,
-                            rcts_keys, prds_keys)
-            srxns.append(srxn)
+            back_ste_tsg = _products_stereo_graph(
+                back_tsg, back_ste_tsg, key_dct)
 
-    srxns = tuple(srxns)
-    return srxns
+            yield from_data(rxn_cls, forw_ste_tsg, back_ste_tsg,
+                            rcts_keys, prds_keys, check=False)
 
 
 def expand_product_stereo(srxn):
@@ -203,25 +230,33 @@ def expand_product_stereo(srxn):
 
     srxns = []
     for back_ste_tsg in ts.compatible_reverse_stereomers(forw_ste_tsg):
-        back_ste_tsg = automol.graph.relabel(back_ste_tsg, key_dct)
-
-        # But for dummy atoms, we could just do the conversion directly, but
-        # this avoids loss of dummy atoms from the products graph.
-        tsg_ = back_tsg
-        tsg_ = automol.graph.set_atom_stereo_parities(
-            tsg_, automol.graph.atom_stereo_parities(back_ste_tsg))
-        tsg_ = automol.graph.set_bond_stereo_parities(
-            tsg_, automol.graph.bond_stereo_parities(back_ste_tsg))
-        back_ste_tsg = tsg_
-
-        srxn = Reaction(rxn_cls, forw_ste_tsg, back_ste_tsg,
-                        rcts_keys, prds_keys)
+        back_ste_tsg = _products_stereo_graph(
+            back_tsg, back_ste_tsg, key_dct)
+
+        srxn = from_data(rxn_cls, forw_ste_tsg, back_ste_tsg,
+                         rcts_keys, prds_keys, check=False)
         srxns.append(srxn)
 
     srxns = tuple(srxns)
     return srxns
 
 
+def _products_stereo_graph(back_tsg, back_ste_tsg, key_dct):
+    """ Transfer the stereo assignments of a reverse TS stereomer, keyed by the
+    forward TS graph, onto the backward TS graph of the reaction.
+    """
+    back_ste_tsg = automol.graph.relabel(back_ste_tsg, key_dct)
+
+    # But for dummy atoms, we could just do the conversion directly, but this
+    # avoids loss of dummy atoms from the products graph.
+    tsg_ = back_tsg
+    tsg_ = automol.graph.set_atom_stereo_parities(
+        tsg_, automol.graph.atom_stereo_parities(back_ste_tsg))
+    tsg_ = automol.graph.set_bond_stereo_parities(
+        tsg_, automol.graph.bond_stereo_parities(back_ste_tsg))
+    return tsg_
+
+
 def is_stereo_consistent(srxn):
     """ Does this reaction have consistent stereo assignments for reactants and
     products?
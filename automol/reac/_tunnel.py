@@ -2,97 +2,154 @@
  New Tunneling Equtions
 """
 
-import math
 import numpy
+import scipy.special
 # from phydat import phycon
 from automol.util import dict_
 
 
 # Tunneling expressions
 def transmission_coefficient(enes, _alpha, rxn_freq):
-    """ Calculate the transmission coefficient
-    """
-
-    kes = ()
-    for ene in enes:
-        kes += (_transmission_coefficient(ene, _alpha, rxn_freq),)
-
-    return kes
+    """ Calculate the tunneling transmission coefficients over a grid of
+        energies, relative to the top of the barrier.
 
+        The arguments are broadcast together, so several alpha coefficients
+        and reaction frequencies may be given at once, e.g. with shape (n, 1)
+        for n transition states evaluated on the same energy grid.
 
-def action(enes, _alpha, rxn_freq):
-    """ Calculate action at seve
+        :param enes: energies to calculate the transmission coefficient
+        :type enes: float or numpy.ndarray
+        :param _alpha: alpha coefficient in S(E) expansion
+        :type _alpha: float or numpy.ndarray
+        :param rxn_freq: frequency of the reaction mode
+        :type rxn_freq: float or numpy.ndarray
+        :rtype: numpy.ndarray
     """
 
-    ses = ()
-    for ene in enes:
-        ses += (_action(ene, _alpha, rxn_freq),)
+    enes = numpy.asarray(enes, dtype=float)
 
-    return ses
+    # P(E) = 1 / (1 + exp(S(-E))) below the barrier; above it, only the
+    # first-order (parabolic) term of S is used, since the second-order term
+    # would turn P(E) back down to zero at high energies for alpha > 0
+    s_e = numpy.where(
+        enes < 0.0,
+        action(-enes, _alpha, rxn_freq),
+        (-2.0 * numpy.pi * enes) / rxn_freq)
 
+    # This is evaluated as a logistic function so that deep tunneling
+    # energies underflow to zero instead of overflowing
+    return scipy.special.expit(-s_e)
 
-def _transmission_coefficient(ene, _alpha, rxn_freq):
-    """ Calculate the tunneling transmission coefficient at some energy.
 
-        :param ene: energy to calculate the transmission coefficient
-        :param alpha: alpha coefficient in S(E) expansion
+def action(enes, _alpha, rxn_freq):
+    """ Tunneling action as a second-order expansion of the energy, over a
+        grid of energies
+
+        :param enes: energies to calculate the action
+        :type enes: float or numpy.ndarray
+        :param _alpha: alpha coefficient in S(E) expansion
+        :type _alpha: float or numpy.ndarray
         :param rxn_freq: frequency of the reaction mode
+        :type rxn_freq: float or numpy.ndarray
+        :rtype: numpy.ndarray
     """
 
-    if ene < 0.0:
-        denom = math.exp(action(-1.0*ene, _alpha, rxn_freq))
-    else:
-        denom = (-2.0 * numpy.pi * ene) / rxn_freq
-
-    p_e = 1.0 / (1.0 + denom)
-
-    return p_e
-
-
-def _action(ene, _alpha, rxn_freq):
-    """ Tunneling action as a second-order expansion of the energy
-    """
+    enes = numpy.asarray(enes, dtype=float)
 
     # rxn_cfreq *= phycon.WAVEN2EH
     s_e = (
-        (2.0 * numpy.pi * ene) / rxn_freq +
-        (_alpha * ene**2) / rxn_freq**2
+        (2.0 * numpy.pi * enes) / rxn_freq +
+        (_alpha * enes**2) / rxn_freq**2
     )
 
     return s_e
 
 
 # Quantities descrining the surface
-# def alpha(freqs, cfc_dct, qfc_dct=None):
 def alpha(freqs, cfc_dct, vr4=None):
     """ calculate alpha from expansion
+
+        :param freqs: frequencies, with one imaginary (negative) frequency
+            for the reaction mode
+        :type freqs: tuple(float)
+        :param cfc_dct: cubic force constants
+        :type cfc_dct: dict[tuple(int), float]
+        :param vr4: quartic force constants, if available
+        :type vr4: dict[tuple(int), float]
+        :rtype: float
+    """
+    return float(alphas((freqs,), (cfc_dct,), vr4s=(vr4,))[0])
+
+
+def alphas(freqs_lst, cfc_dcts, vr4s=None):
+    """ calculate alpha from expansion for several transition states at once
+
+        :param freqs_lst: frequencies of each transition state
+        :type freqs_lst: tuple(tuple(float))
+        :param cfc_dcts: cubic force constants of each transition state
+        :type cfc_dcts: tuple(dict[tuple(int), float])
+        :param vr4s: quartic force constants of each transition state
+        :type vr4s: tuple(dict[tuple(int), float])
+        :rtype: numpy.ndarray
     """
 
-    # Obtain the imaginary frequency (finds negative
-    ridxs = (idx for idx, freq in enumerate(freqs) if freq < 0.0)
+    nsets = len(freqs_lst)
+    vr4s = (None,) * nsets if vr4s is None else vr4s
+    nmax = max(map(len, freqs_lst), default=0)
+
+    # Gather the force constants into arrays, padding missing modes with
+    # zero coupling so that they do not contribute
+    kfreqs = numpy.ones((nsets, nmax))
+    vkrrs = numpy.zeros((nsets, nmax))
+    rfreqs = numpy.zeros(nsets)
+    vrrrs = numpy.zeros(nsets)
+    vrrrrs = numpy.zeros(nsets)
+    for sidx, (freqs, cfc_dct, vr4) in enumerate(
+            zip(freqs_lst, cfc_dcts, vr4s)):
+        ridx = reaction_mode_index(freqs)
+        freqs = numpy.abs(numpy.asarray(freqs, dtype=float))
+        rfreqs[sidx] = freqs[ridx]
+        vrrrs[sidx] = cfc_dct[(ridx, ridx, ridx)]
+        for idx, freq in enumerate(freqs):
+            if idx != ridx:
+                kfreqs[sidx, idx] = freq
+                vkrrs[sidx, idx] = dict_.values_by_unordered_tuple(
+                    cfc_dct, (idx, ridx, ridx), fill_val=0.0)
+        if vr4 is not None:
+            vrrrrs[sidx] = vr4[(ridx, ridx, ridx, ridx)]
+
+    return alpha_from_force_constants(rfreqs, vrrrs, kfreqs, vkrrs, vrrrrs)
+
+
+def reaction_mode_index(freqs):
+    """ Index of the single imaginary (negative) frequency
+    """
+    ridxs = tuple(idx for idx, freq in enumerate(freqs) if freq < 0.0)
     assert len(ridxs) == 1, ('Freqs should only have one imag')
+    return ridxs[0]
 
-    freqs = (abs(freq) for freq in freqs)
-    ridx = ridxs[0]
-    rfreq = freqs[ridx]
 
-    # Calculate alpha with cubic contributions
-    term1 = (5.0 / 3.0) * (
-        cfc_dct[(ridx, ridx, ridx)]**2 / rfreq**3)
+def alpha_from_force_constants(rfreqs, vrrrs, kfreqs, vkrrs, vrrrrs):
+    """ Vectorized alpha coefficients, given the reaction mode frequencies
+        and force constants of each transition state, with shape (n,), and
+        the other frequencies and their cubic couplings to the reaction mode,
+        with shape (n, m)
 
-    term2 = 0.0
-    for i, ifreq in enumerate(freqs):
-        vval = dict_.values_by_unordered_tuple(cfc_dct, (i, ridx, ridx))
+        The reaction mode's own cubic term is in term1, so the couplings
+        for the reaction mode should be zero in vkrrs.
+    """
+
+    # Calculate alpha with cubic contributions
+    term1 = (5.0 / 3.0) * (vrrrs**2 / rfreqs**3)
 
-        tm1 = (vval**2 / ifreq**3)
-        tm2 = 2.0*ifreq**(-2) + (1.0 / (4.0*rfreq**2 + ifreq**2))
-        term2 += ((tm1 * tm2),)
+    tm1 = vkrrs**2 / kfreqs**3
+    tm2 = 2.0*kfreqs**(-2) + (
+        1.0 / (4.0*rfreqs[:, numpy.newaxis]**2 + kfreqs**2))
+    term2 = numpy.sum(tm1 * tm2, axis=1)
 
     _alpha = (numpy.pi / 8.0) * (term1 - term2)
 
     # Calculate quartic contributions to alpha, if available
-    if vr4 is not None:
-        _alpha -= (numpy.pi / 8.0) * (
-            cfc_dct[(ridx, ridx, ridx, ridx)] / rfreq**6)
+    _alpha -= (numpy.pi / 8.0) * (vrrrrs / rfreqs**6)
 
     return _alpha
@@ -2,95 +2,93 @@
  New Tunneling Equtions
 """
 
-import math
 import numpy
 from phydat import phycon
+from automol.util import highd_mat
+from automol.reac import _tunnel
 
 
 # Tunneling expressions
 def transmission_coefficient(enes, valpha, rxn_freq):
     """ Calculate the tunneling transmission coefficients at Es.
-    """
-
-    kes = ()
-    for ene in enes:
-        kes += (_transmission_coefficient(ene, valpha, rxn_freq),)
-
-    return kes
-
-
-def action(enes, valpha, rxn_freq):
-    """ Calculate action at seve
-    """
-
-    ses = ()
-    for ene in enes:
-        ses += (_action(ene, valpha, rxn_freq),)
-
-    return ses
-
-
-def _transmission_coefficient(ene, valpha, rxn_freq):
-    """ Calculate the tunneling transmission coefficient at some energy.
 
-        :param ene: energy to calculate the transmission coefficient
-        :param alpha: alpha coefficient in S(E) expansion
-        :param rxn_freq: frequency of the reaction mode
+        :param enes: energies relative to the top of the barrier
+        :type enes: float or numpy.ndarray
+        :param valpha: alpha coefficient in S(E) expansion
+        :param rxn_freq: frequency of the reaction mode, in cm-1
+        :rtype: numpy.ndarray
     """
+    return _tunnel.transmission_coefficient(
+        enes, valpha, numpy.multiply(rxn_freq, phycon.WAVEN2EH))
 
-    if ene < 0.0:
-        denom = math.exp(action(-1.0*ene, valpha, rxn_freq))
-    else:
-        denom = (-2.0 * numpy.pi * ene) / rxn_freq
-
-    p_e = 1.0 / (1.0 + denom)
-
-    return p_e
 
+def action(enes, valpha, rxn_freq):
+    """ Calculate action at several energies
 
-def _action(ene, valpha, rxn_freq):
-    """ Tunneling action as a second-order expansion of the energy
+        :param enes: energies relative to the top of the barrier
+        :type enes: float or numpy.ndarray
+        :param valpha: alpha coefficient in S(E) expansion
+        :param rxn_freq: frequency of the reaction mode, in cm-1
+        :rtype: numpy.ndarray
     """
-
-    rxn_freq *= phycon.WAVEN2EH
-    s_e = (
-        (2.0 * numpy.pi * ene) / rxn_freq +
-        (valpha * ene**2) / rxn_freq**2
-    )
-
-    return s_e
+    return _tunnel.action(
+        enes, valpha, numpy.multiply(rxn_freq, phycon.WAVEN2EH))
 
 
 # Quantities descrining the surface
 def alpha(freqs, cfc_mat, qfc_mat=None):
     """ calculate alpha from expansion
-    """
 
-    # Obtain the imaginary frequency and sort other freqs
-    ridxs = tuple(idx for idx, freq in enumerate(freqs) if freq < 0.0)
-    assert len(ridxs) == 1, ('Freqs should only have one imag')
-    ridx = ridxs[0]
-
-    freqs = tuple(abs(freq) * phycon.WAVEN2EH for freq in freqs)
-    rfreq = freqs[ridx]
-
-    # Calculate alpha with cubic contributions
-    term1 = (5.0 / 3.0) * (
-        cfc_mat[ridx, ridx, ridx]**2 / rfreq**3)
-
-    term2 = 0.0
-    for i, ifreq in enumerate(freqs):
-        vval = cfc_mat[i, ridx, ridx]
+        :param freqs: frequencies in cm-1, with one imaginary (negative)
+            frequency for the reaction mode
+        :param cfc_mat: cubic force constants, as a full or sparse array
+        :type cfc_mat: numpy.ndarray
+        :param qfc_mat: quartic force constants, if available
+        :type qfc_mat: numpy.ndarray
+        :rtype: float
+    """
+    return float(alphas((freqs,), (cfc_mat,), qfc_mats=(qfc_mat,))[0])
 
-        tm1 = (vval**2 / ifreq**3)
-        tm2 = 2.0*ifreq**(-2) + (1.0 / (4.0*rfreq**2 + ifreq**2))
-        term2 += (tm1 * tm2)
 
-    _alpha = (numpy.pi / 8.0) * (term1 - term2)
+def alphas(freqs_lst, cfc_mats, qfc_mats=None):
+    """ calculate alpha from expansion for several transition states at once
 
-    # Calculate quartic contributions to alpha, if available
-    if qfc_mat is not None:
-        _alpha -= (numpy.pi / 8.0) * (
-            qfc_mat[ridx, ridx, ridx, ridx] / rfreq**6)
+        :param freqs_lst: frequencies of each transition state, in cm-1
+        :param cfc_mats: cubic force constants of each transition state, as
+            full arrays or sparse arrays from automol.util.highd_mat.sparse
+        :type cfc_mats: tuple(numpy.ndarray)
+        :param qfc_mats: quartic force constants of each transition state
+        :type qfc_mats: tuple(numpy.ndarray)
+        :rtype: numpy.ndarray
+    """
 
-    return _alpha
+    nsets = len(freqs_lst)
+    qfc_mats = (None,) * nsets if qfc_mats is None else qfc_mats
+    nmax = max(map(len, freqs_lst), default=0)
+
+    kfreqs = numpy.ones((nsets, nmax))
+    vkrrs = numpy.zeros((nsets, nmax))
+    rfreqs = numpy.zeros(nsets)
+    vrrrs = numpy.zeros(nsets)
+    vrrrrs = numpy.zeros(nsets)
+    for sidx, (freqs, cfc_mat, qfc_mat) in enumerate(
+            zip(freqs_lst, cfc_mats, qfc_mats)):
+        # Obtain the imaginary frequency and sort other freqs
+        ridx = _tunnel.reaction_mode_index(freqs)
+        nfreq = len(freqs)
+        freqs = numpy.abs(numpy.asarray(freqs, dtype=float)) * phycon.WAVEN2EH
+
+        # Only the couplings to the reaction mode are needed, so these are
+        # looked up directly, which also works for sparse force constants
+        rfreqs[sidx] = freqs[ridx]
+        kfreqs[sidx, :nfreq] = freqs
+        vkrrs[sidx, :nfreq] = highd_mat.values(
+            cfc_mat, tuple((idx, ridx, ridx) for idx in range(nfreq)))
+        vrrrs[sidx] = vkrrs[sidx, ridx]
+        kfreqs[sidx, ridx] = 1.0
+        vkrrs[sidx, ridx] = 0.0
+        if qfc_mat is not None:
+            vrrrrs[sidx] = highd_mat.values(qfc_mat, ((ridx,) * 4,))[0]
+
+    return _tunnel.alpha_from_force_constants(
+        rfreqs, vrrrs, kfreqs, vkrrs, vrrrrs)
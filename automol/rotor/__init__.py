@@ -21,6 +21,7 @@ from automol.rotor._tors import all_torsion_symmetries
 from automol.rotor._tors import torsion_groups
 from automol.rotor._tors import torsion_symmetry
 from automol.rotor._tors import torsion_lst
+from automol.rotor._tors import torsion_data
 from automol.rotor._tors import reaction_torsion_lst
 
 
@@ -44,5 +45,6 @@ __all__ = [
     'torsion_groups',
     'torsion_symmetry',
     'torsion_lst',
+    'torsion_data',
     'reaction_torsion_lst',
 ]
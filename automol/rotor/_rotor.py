@@ -113,28 +113,60 @@ def potentials(rotor_lst, flat=False):
 def grids(rotor_lst,
           span=2.0*numpy.pi, increment=30.0*phycon.DEG2RAD, flat=False):
     """ Build a list of list of grids
+
+        The grids of all the torsions are built together, giving the same
+        values as automol.pot.grid with from_equilibrium=True
     """
 
-    rotor_lst_grids = ()
-    for rotor in rotor_lst:
-        rotor_grids = ()
-        for torsion in rotor:
-            # print('rotor grids input test:', torsion.zma, torsion.name,
-            #       span, torsion.symmetry, increment)
-            rotor_grids += (
-                automol.pot.grid(
-                    torsion.zma, torsion.name,
-                    span, torsion.symmetry, increment, from_equilibrium=True),
-            )
-            # print('torsion and rotor grids:', torsion, rotor_grids)
-        rotor_lst_grids += (rotor_grids,)
+    torsions = tuple(chain(*rotor_lst))
+    tors_grids = _torsion_grids(torsions, span, increment)
+
     if flat:
-        rotor_lst_grids = tuple(chain(*rotor_lst_grids))
-    # print('rotor_lst_grids:', rotor_lst_grids)
+        rotor_lst_grids = tors_grids
+    else:
+        rotor_lst_grids = ()
+        start = 0
+        for rotor in rotor_lst:
+            rotor_lst_grids += (tors_grids[start:start+len(rotor)],)
+            start += len(rotor)
 
     return rotor_lst_grids
 
 
+def _torsion_grids(torsions, span, increment):
+    """ Build the scan grids for a sequence of torsions at once
+    """
+
+    if not torsions:
+        return ()
+
+    # Set the space for each torsion
+    symms = numpy.array([torsion.symmetry for torsion in torsions],
+                        dtype=float)
+    intervals = (span / symms) - increment
+    npoints = numpy.round(intervals / increment).astype(int) + 1
+
+    # Evaluate every linspace(0, interval, npoint) on a common padded grid,
+    # with the endpoints set exactly, as numpy.linspace does
+    steps = intervals / numpy.maximum(npoints - 1, 1)
+    vals = numpy.arange(numpy.max(npoints)) * steps[:, numpy.newaxis]
+    ends = npoints > 1
+    vals[ends, npoints[ends] - 1] = intervals[ends]
+
+    # Displace from the equilibrium values of the coordinates
+    val_dcts = {}
+    ini_vals = numpy.zeros(len(torsions))
+    for idx, torsion in enumerate(torsions):
+        zma_id = id(torsion.zma)
+        if zma_id not in val_dcts:
+            val_dcts[zma_id] = automol.zmat.value_dictionary(torsion.zma)
+        ini_vals[idx] = val_dcts[zma_id][torsion.name]
+    vals += ini_vals[:, numpy.newaxis]
+
+    return tuple(tuple(row[:npoint].tolist())
+                 for row, npoint in zip(vals, npoints))
+
+
 def zmatrix(rotor_lst):
     """ Get the Z-Matrix for the rotors
     """
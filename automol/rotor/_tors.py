@@ -5,6 +5,7 @@
 """
 
 import copy
+import functools
 import numpy
 from automol.rotor._util import sort_tors_names
 import automol.graph
@@ -48,31 +49,66 @@ class Torsion:
 # Build functions
 def torsion_lst(zma):
     """  Build a list of torsion objects
+
+        The torsion data for a z-matrix is cached, but new torsion objects are
+        built on each call, since their potentials are set later on
+    """
+
+    return tuple(
+        Torsion(zma, name, axis, grps, symm, indices=idxs)
+        for name, axis, grps, symm, idxs in torsion_data(zma))
+
+
+def torsion_data(zma):
+    """ The name, axis, groups, symmetry number, and coordinate indices of
+        each torsion of a z-matrix, sorted by name
+
+        :param zma: Z-Matrix
+        :type zma: automol Z-Matrix data structure
+        :rtype: tuple(tuple)
+    """
+    try:
+        data = _cached_torsion_data(zma)
+    except TypeError:
+        data = _torsion_data(zma)
+    return data
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_torsion_data(zma):
+    """ Cached torsion data of a hashable z-matrix
+    """
+    return _torsion_data(zma)
+
+
+def _torsion_data(zma):
+    """ Determine the torsion data for all torsions of a z-matrix at once
     """
 
-    # Get the necessary graph and lin keys
-    gra = automol.zmat.graph(zma, stereo=True, dummy=True)
+    # Get the necessary graph and lin keys; the rotational bonds, groups, and
+    # symmetry numbers only depend on the connectivity, not the stereo
+    gra = automol.zmat.graph(zma, stereo=False, dummy=True)
     lin_keys = sorted(
         automol.graph.dummy_atoms_neighbor_atom_key(gra).values())
 
-    # Build the torsion objects
     _name_axis_dct = name_axis_dct(zma, gra, lin_keys)
+    coo_dct = automol.zmat.coordinates(zma)
 
     # Get the sorted tors names for building the list
     sorted_tors_names = sort_tors_names(tuple(_name_axis_dct.keys()))
 
-    tors_obj_lst = ()
+    data = ()
     for name in sorted_tors_names:
 
         # Determine constituent rotor pieces in graph system
         axis = _name_axis_dct[name]
         grps = torsion_groups(gra, axis)
         symm = torsion_symmetry(gra, axis, lin_keys)
+        idxs = coo_dct[name][0]
 
-        # Build the torsion object and add to the list
-        tors_obj_lst += (Torsion(zma, name, axis, grps, symm),)
+        data += ((name, axis, grps, symm, idxs),)
 
-    return tors_obj_lst
+    return data
 
 
 def reaction_torsion_lst(zma, zrxn):
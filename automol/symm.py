@@ -2,8 +2,7 @@
 """
 
 
-import random
-import string
+import collections
 
 import automol.zmat.base
 import automol.graph.base
@@ -11,11 +10,11 @@ from automol.rotor import names as rotor_names
 from automol.reac import forming_bond_keys, breaking_bond_keys
 from automol.geom.base import remove
 from automol.geom.base import almost_equal_dist_matrix
+from automol.geom.base import DistanceSpectrumIndex
 from automol.geom._conv import external_symmetry_factor
 from automol.geom._conv import graph
 from automol.geom._extra import are_torsions_same
 from automol.geom._extra import are_torsions_same2
-from automol.graph._conv import inchi
 
 
 # external
@@ -56,6 +55,9 @@ def internal_symm_from_sampling(symm_geos, rotors, grxn=None, zma=None):
     # this will be accounted for separately as multiplicative factor
     int_sym_num = 0
     mod_symm_geos = []
+    # Bucket the kept geometries by distance spectrum, so that each new one
+    # is only checked exactly against those that could match it
+    spc_idx = DistanceSpectrumIndex(thresh=3e-1)
     for geo_sym_i in symm_geos:
         ret = end_group_symmetry_factor(
             geo_sym_i, frm_bnd_keys, brk_bnd_keys)
@@ -65,7 +67,8 @@ def internal_symm_from_sampling(symm_geos, rotors, grxn=None, zma=None):
                 tors_idxs, removed_atms, automol.zmat.dummy_keys(zma))
 
         new_geom = True
-        for mod_geo_sym_j in mod_symm_geos:
+        for idx in spc_idx.candidates(mod_geo_sym_i):
+            mod_geo_sym_j = mod_symm_geos[idx]
             if almost_equal_dist_matrix(
                     mod_geo_sym_i, mod_geo_sym_j, thresh=3e-1):
                 if grxn is None:
@@ -79,6 +82,7 @@ def internal_symm_from_sampling(symm_geos, rotors, grxn=None, zma=None):
                     break
         if new_geom:
             mod_symm_geos.append(mod_geo_sym_i)
+            spc_idx.add(mod_geo_sym_i)
             int_sym_num += 1
 
     int_sym_num *= end_group_factor
@@ -201,11 +205,11 @@ def _modify_idxs(idxs_lst, removed_atms, dummy_atms):
     return mod_idxs_lst
 
 
-ICH_DCT = {'C': 'InChI=1S/C', 'O': 'InChI=1S/O'}
-
-
 def oxygenated_hydrocarbon_symm_num(geo, zrxn=None):
     """ determine the symmetry number of a CHO molecule
+
+        Groups around each atom are compared by graph symmetry class, so the
+        result only depends on the graph.
     """
     int_symm = 1.
     chiral_center = 0
@@ -220,44 +224,27 @@ def oxygenated_hydrocarbon_symm_num(geo, zrxn=None):
         ext_symm = external_symmetry_factor(geo)
     else:
         gra = automol.graph.base.explicit(gra)
+        gra = automol.graph.base.without_stereo_parities(gra)
         atms = automol.graph.base.atom_keys(gra)
         atm_vals = automol.graph.base.unsaturated_atom_keys(gra)
         ring_atms = automol.graph.base.rings_atom_keys(gra)
         ring_atms = [x for ring in ring_atms for x in ring]
         atm_rads = automol.graph.base.radical_atom_keys(gra)
         atm_syms = automol.graph.base.atom_symbols(gra)
+        atm_ngbs_dct = automol.graph.base.atoms_neighbor_atom_keys(gra)
+        cla_dct = _symmetry_class_dict(gra)
         atms = [x for x in atms if atm_syms[x] != 'H']
         for atm in atms:
             if atm in atm_vals and atm not in atm_rads:
                 continue
             if atm in ring_atms:
-                atm_groups = automol.graph.base.ring_atom_chirality(
-                    gra, atm, ring_atms)
+                group_keys = _ring_atom_group_keys(gra, atm, ring_atms)
             else:
-                atm_groups = automol.graph.base.atom_groups(gra, atm)
-            group_dct = {}
-            for group in atm_groups:
-                try:
-                    group_smi = inchi(group)
-                except Exception as err:
-                    # Excepts rdkit errors, assumes group is complicated enough
-                    # that is is unique
-                    if not str(err).startswith('Python argument types in'):
-                        print('Error evaluating atom group in symm number '
-                              'routine')
-                        print('Symmetry number may be incorrect as a result,'
-                              'group is', group)
-                    group_smi = ''.join(random.choice(string.ascii_letters)
-                                        for i in range(10))
-                if group_smi in group_dct:
-                    group_dct[group_smi] += 1
-                else:
-                    group_dct[group_smi] = 1
-            # remove atom inchi from dct
-            atm_sym = atm_syms[atm]
-            atm_ich = ICH_DCT[atm_sym]
-            group_dct[atm_ich] -= 1
-            group_dct = {x: y for x, y in group_dct.items() if y != 0}
+                # Outside of rings, the group off of each neighbor is a
+                # branch, so two groups are the same if their neighbors are
+                # in the same symmetry class
+                group_keys = [cla_dct[ngb] for ngb in atm_ngbs_dct[atm]]
+            group_dct = collections.Counter(group_keys)
             if len(group_dct) == 4:
                 chiral_center += 1
             elif len(group_dct) == 3 and atm in atm_rads:
@@ -265,21 +252,39 @@ def oxygenated_hydrocarbon_symm_num(geo, zrxn=None):
             if atm in ring_atms:
                 continue
             if len(group_dct) == 2:
-                chain_group = None
-                symm_groups = None
-                for group in group_dct.keys():
-                    if group_dct[group] == 1:  # and group != 'InChI=1S/H':
-                        chain_group = group
-                    else:
-                        symm_groups = group
-                    symm_groups = group
-                if chain_group and symm_groups:
-                    atm_symm = group_dct[symm_groups]
-                    # if atm_symm == 2:
-                    #     if chain_group != 'InChI=1S/H':
-                    #         atm_symm = 1
-                    int_symm *= atm_symm
+                # The repeated groups rotate about the bond to the unique
+                # group, unless that is a terminal atom, in which case the
+                # rotation moves the whole molecule and is external
+                counts = sorted(group_dct.values())
+                if counts[0] == 1 and counts[1] > 1:
+                    axis_ngb, = (ngb for ngb in atm_ngbs_dct[atm]
+                                 if group_dct[cla_dct[ngb]] == 1)
+                    if len(atm_ngbs_dct[axis_ngb]) > 1:
+                        int_symm *= counts[1]
         ext_symm = external_symmetry_factor(
             geo, chiral_center=chiral_center > 0.)
 
     return int_symm, ext_symm
+
+
+def _symmetry_class_dict(gra):
+    """ Symmetry class indices for all atoms in a graph, which may be
+        disconnected
+
+        Indices are only comparable within a connected component.
+    """
+    cla_dct = {}
+    for cgra in automol.graph.base.connected_components(gra):
+        cla_dct.update(
+            automol.graph.base.class_indices(cgra, backbone_only=False))
+    return cla_dct
+
+
+def _ring_atom_group_keys(gra, atm, ring_atms):
+    """ Hashable keys for comparing the groups off of a ring atom
+    """
+    groups = automol.graph.base.ring_atom_chirality(gra, atm, ring_atms)
+    groups = [group for group in groups
+              if atm not in automol.graph.base.atom_keys(group)]
+    return [automol.graph.base.frozen(automol.graph.base.canonical(group))
+            for group in groups]
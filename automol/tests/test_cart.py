@@ -2,6 +2,7 @@
 """
 
 import os
+import io
 import pytest
 import numpy
 from ioformat import pathtools
@@ -148,3 +149,23 @@ def test__highd_mat():
     test_4d_submat_str = automol.util.highd_mat.string_submat_4d(test_4d_mat)
     assert (test_4d_submat_str ==
             pathtools.read_file(DAT_PATH, 'ch4_h.quartic_submat'))
+
+    # Handle sparse representations, which are only stored once for each
+    # permutation of the indices
+    sp_4d_mat = automol.util.highd_mat.sparse_from_string(ref_4d_str)
+    assert (automol.util.highd_mat.sparse_string(sp_4d_mat) ==
+            automol.util.highd_mat.string(test_4d_mat))
+    full_4d_mat = automol.util.highd_mat.dense(sp_4d_mat, fill_perms=True)
+    assert numpy.array_equal(
+        automol.util.highd_mat.sparse(full_4d_mat)[1], sp_4d_mat[1])
+    idxs_lst = ((0, 0, 0, 0), (3, 2, 1, 0), (5, 0, 5, 0), (11, 0, 4, 11))
+    assert numpy.allclose(
+        automol.util.highd_mat.values(sp_4d_mat, idxs_lst),
+        automol.util.highd_mat.values(full_4d_mat, idxs_lst))
+
+    npz_file = io.BytesIO()
+    automol.util.highd_mat.sparse_to_npz(sp_4d_mat, npz_file)
+    npz_file.seek(0)
+    sp_4d_mat2 = automol.util.highd_mat.sparse_from_npz(npz_file)
+    assert numpy.array_equal(sp_4d_mat[0], sp_4d_mat2[0])
+    assert numpy.array_equal(sp_4d_mat[1], sp_4d_mat2[1])
@@ -87,6 +87,33 @@ def test__comp():
     unique6, idx6 = automol.geom.is_unique(GEO1, GEO_LST1, CHECK_DCT2)
     assert not unique6 and idx6 == 0
 
+    # Test against precomputed distance matrices
+    dist_mats = automol.geom.distance_matrices(GEO_LST5)
+    assert tuple(automol.geom.almost_equal_dist_matrices(
+        GEO1_DISP, dist_mats)) == (False, False)
+    dist_mats = automol.geom.distance_matrices(GEO_LST2)
+    assert tuple(automol.geom.almost_equal_dist_matrices(
+        GEO1_DISP, dist_mats)) == (False, True)
+    unique7, idx7 = automol.geom.is_unique(
+        GEO1, GEO_LST2, CHECK_DCT, dist_mats=dist_mats)
+    assert not unique7 and idx7 == 1
+
+
+def test__distance_spectrum_index():
+    """ test automol.geom.DistanceSpectrumIndex
+    """
+    spc_idx = automol.geom.DistanceSpectrumIndex(thresh=3e-1)
+    assert spc_idx.add(GEO1_DIFF_ATOM_ORDER) == 0
+    assert spc_idx.add(GEO1_CC_STRETCH) == 1
+    assert len(spc_idx) == 2
+
+    # The spectrum ignores atom order, so only the exact check separates
+    # GEO1 from GEO1_DIFF_ATOM_ORDER
+    assert spc_idx.candidates(GEO1_DISP) == (0,)
+    assert not automol.geom.almost_equal_dist_matrix(
+        GEO1_DISP, GEO1_DIFF_ATOM_ORDER, thresh=3e-1)
+
 
 if __name__ == '__main__':
     test__comp()
+    test__distance_spectrum_index()
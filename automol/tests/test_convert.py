@@ -521,6 +521,12 @@ def test__geom__x2z_torsion_coordinate_names():
     tors_names = automol.geom.x2z_torsion_coordinate_names(geo)
     assert tors_names == ('D5',)
 
+    x2z_anl = automol.geom.x2z_analysis(geo)
+    assert x2z_anl is automol.geom.x2z_analysis(geo)
+    assert x2z_anl.torsion_coordinate_names == tors_names
+    assert x2z_anl.zmatrix == automol.geom.x2z_zmatrix(geo)
+    assert x2z_anl.atom_ordering == automol.geom.x2z_atom_ordering(geo)
+
     geo2 = (('H', (2.9512589894, 0.17507745634, 0.22317665541)),)
 
     tors_names2 = automol.geom.x2z_torsion_coordinate_names(geo2)
@@ -185,6 +185,51 @@ def test__estimate_no_model():
     assert sig is None and eps is None
 
 
+def test__estimate_arrays():
+    """ test automol.etrans.estimate.effective_rotor_counts
+        test automol.etrans.estimate.lennard_jones_params_array
+        test automol.etrans.estimate.alphas
+    """
+
+    ichs = (CH1_INF[0], CYC_INF[0], ALC_INF[0])
+    geos = tuple(map(automol.inchi.geometry, ichs))
+    gras = tuple(map(automol.geom.connectivity_graph, geos))
+
+    n_effs = automol.etrans.estimate.effective_rotor_counts(geos)
+    assert numpy.allclose(n_effs, [2.0, 3.0, 2.333333])
+    assert numpy.allclose(
+        automol.etrans.estimate.graph_effective_rotor_counts(gras), n_effs)
+
+    collider_sets = (frozenset({BATH_INF[0], 'n-alkane'}),
+                     frozenset({'InChI=1S/Kr', 'n-alkane'}),
+                     frozenset({BATH_INF[0], 'n-alcohol'}))
+    n_heavys = [automol.geom.atom_count(geo, 'H', match=False)
+                for geo in geos]
+    sigs, epss = automol.etrans.estimate.lennard_jones_params_array(
+        n_heavys, collider_sets)
+    assert numpy.isnan(sigs[1]) and numpy.isnan(epss[1])
+    for idx in (0, 2):
+        sig, eps = automol.etrans.estimate.lennard_jones_params(
+            n_heavys[idx], collider_sets[idx])
+        assert numpy.isclose(sigs[idx], sig)
+        assert numpy.isclose(epss[idx], eps)
+
+    bath_mass = automol.geom.total_mass(automol.inchi.geometry(BATH_INF[0]))
+    tgt_masses = list(map(automol.geom.total_mass, geos))
+    edown_alphas, edown_ns = automol.etrans.estimate.alphas(
+        n_effs, epss, sigs, tgt_masses, bath_mass, collider_sets)
+    assert numpy.isnan(edown_alphas[1]) and numpy.isnan(edown_ns[1])
+    for idx in (0, 2):
+        edown_alpha, edown_n = automol.etrans.estimate.alpha(
+            n_effs[idx], epss[idx], sigs[idx], tgt_masses[idx], bath_mass,
+            collider_sets[idx])
+        assert numpy.isclose(edown_alphas[idx], edown_alpha)
+        assert numpy.isclose(edown_ns[idx], edown_n)
+    assert automol.etrans.estimate.alpha(
+        n_effs[1], epss[0], sigs[0], tgt_masses[1], bath_mass,
+        collider_sets[1]) == (None, None)
+
+
 def test__combine():
     """ test automol.etrans.combine.epsilon
         test automol.etrans.combine.sigma
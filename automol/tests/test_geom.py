@@ -350,6 +350,29 @@ def test__argunique_coulomb_spectrum():
     idxs = geom.argunique_coulomb_spectrum(geos)
     assert idxs == ref_idxs
 
+    spcs = geom.coulomb_spectra(geos)
+    assert all(numpy.allclose(spc, geom.coulomb_spectrum(geo))
+               for spc, geo in zip(spcs, geos))
+
+    spc_idx = geom.CoulombSpectrumIndex(geos[:4])
+    assert len(spc_idx) == 4
+    assert spc_idx.has_duplicate(geos[1])
+    assert not spc_idx.has_duplicate(geos[5])
+    assert spc_idx.add_if_unique(geos[5])
+    assert not spc_idx.add_if_unique(geos[6])
+    assert spc_idx.argunique(geos) == (8,)
+
+
+def test__minimum_volume_geometry():
+    """ test geom.minimum_volume_geometry
+    """
+    geo = C2H2CLF_GEO
+    geos = [geom.set_coordinates(geo, {0: numpy.multiply(xyz, scale)})
+            for xyz in [geom.coordinates(geo)[0]]
+            for scale in (1.5, 1.2, 1.0, 1.1, 1.0)]
+    assert geom.minimum_volume_geometry(geos) == geos[2]
+    assert geom.minimum_volume_geometry(iter(geos), chunk_size=2) == geos[2]
+
 
 def test__mass():
     """ test geom.masses
@@ -506,6 +529,11 @@ def test__permutations():
     perm_geos = automol.geom.rot_permutated_geoms(C2H5_GEO)
     assert any(automol.geom.almost_equal_dist_matrix(geo, ref_perm_geo)
                for geo in perm_geos)
+    assert automol.geom.rot_permutation_count(C2H5_GEO) == len(perm_geos)
+    assert list(automol.geom.rot_permutated_geoms_iter(C2H5_GEO)) == perm_geos
+    assert automol.geom.rot_permutation_count(
+        C2H5_GEO, prune=True) == len(list(
+            automol.geom.rot_permutated_geoms_iter(C2H5_GEO, prune=True)))
 
     ref_perm_idxs = (0, 1, 4, 5, 6, 7, 2, 3)
     perm_idxs = automol.geom.permutation(C2H6_GEO_2, C2H6_GEO)
@@ -1,6 +1,7 @@
 """ test automol.graph
 """
 
+import io
 import itertools
 import numpy
 import automol
@@ -357,6 +358,19 @@ def test__string():
         assert sgr == automol.graph.from_string(automol.graph.string(sgr))
 
 
+def test__json_string():
+    """ test graph.json_string and graph.from_json_string
+    """
+    for sgr in C8H13O_SGRS:
+        sgr_str = automol.graph.json_string(sgr)
+        assert sgr == automol.graph.from_json_string(sgr_str)
+
+    stream = io.StringIO()
+    automol.graph.write_json_lines(C8H13O_SGRS, stream)
+    stream.seek(0)
+    assert tuple(automol.graph.read_json_lines(stream)) == tuple(C8H13O_SGRS)
+
+
 def test__without_bond_orders():
     """ test graph.without_bond_orders
     """
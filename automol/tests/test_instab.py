@@ -325,6 +325,19 @@ def test__prod_zmas():
     assert not instab_zmas3
 
 
+def test__prod_graphs():
+    """ test.automol.reac.instability_product_graphs
+    """
+
+    gra1 = automol.zmat.graph(ZMA1, stereo=False)
+    prd_gras1 = automol.reac.instability_product_graphs(gra1)
+    prd_fmls1 = tuple(map(automol.graph.formula, prd_gras1))
+    assert prd_fmls1 == ({'H': 1, 'O': 1}, {'C': 1, 'H': 2, 'O': 1})
+
+    gra3 = automol.zmat.graph(ZMA3, stereo=False)
+    assert not automol.reac.instability_product_graphs(gra3)
+
+
 def test__transformation():
     """ test automol.zmat
     """
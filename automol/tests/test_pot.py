@@ -204,6 +204,43 @@ def test__empty_terms_in_potential():
         tuple(filt_pot.values()), tuple(ref_filt_pot.values()), atol=1.0e-2)
 
 
+def test__array_potential():
+    """ test automol.pot.ArrayPotential
+    """
+
+    # Round trip through the dict form, with missing values masked
+    apot5 = automol.pot.ArrayPotential.from_dict(POT5)
+    assert apot5.values.shape == (4, 2) and apot5.mask is None
+    assert automol.pot.dimension(apot5) == 2
+    assert apot5.to_dict() == POT5
+    assert numpy.allclose(
+        automol.pot.coords_array((PCOORDS1, PCOORDS2)),
+        automol.pot.coords((PCOORDS1, PCOORDS2)))
+
+    apot3 = automol.pot.ArrayPotential.from_dict(POT3)
+    assert len(apot3) == 12
+    assert automol.pot.is_nonempty(apot3)
+    assert not automol.pot.valid(apot3)
+    filt_apot = automol.pot.remove_empty_terms(apot3)
+    assert len(filt_apot) == 9
+    assert filt_apot.to_dict() == automol.pot.remove_empty_terms(POT3)
+
+    # Transformations agree with the dict versions
+    apot1 = automol.pot.ArrayPotential.from_dict(POT1)
+    apot2 = automol.pot.ArrayPotential.from_dict(POT2)
+    for apot, pot in (
+            (automol.pot.scale(apot1, SCALE_COEFF),
+             automol.pot.scale(POT1, SCALE_COEFF)),
+            (automol.pot.relax_scale(apot1), automol.pot.relax_scale(POT1)),
+            (automol.pot.truncate(apot2, SYM_NUM2),
+             automol.pot.truncate(POT2, SYM_NUM2)),
+            (automol.pot.by_index(apot5), automol.pot.by_index(POT5))):
+        apot_dct = apot.to_dict()
+        assert numpy.allclose(list(apot_dct.keys()), list(pot.keys()))
+        assert numpy.allclose(list(apot_dct.values()), list(pot.values()))
+    assert automol.pot.string(apot1) == automol.pot.string(POT1)
+
+
 def test__fit_potential():
     """ test automol.pot.fit_1d_potential
     """
@@ -253,6 +290,69 @@ def test__fit_potential():
         tuple(pot3.values()), tuple(ref_pot3.values()), atol=1.0e-2)
 
 
+def test__fit_nd_potential():
+    """ test automol.pot.fit_nd_potential
+        test automol.pot.periodic_spline
+    """
+
+    # The 1-D cleanup matches fit_1d_potential
+    init_vals = [0.000, 1.299, 3.085, 2.780, 2.045, -10.0,
+                 3.949, 2.655, 1.480, 2.358, 2.948, numpy.nan]
+    vals = automol.pot.fit_nd_potential(init_vals)
+    assert numpy.allclose(vals[[5, 11]], [2.997, 1.474])
+
+    # 2-D potential with missing points and values over the threshold
+    grid = numpy.arange(12) * 2. * numpy.pi / 12.
+    ref_vals = (2. - numpy.cos(grid)[:, numpy.newaxis] -
+                numpy.cos(3. * grid)[numpy.newaxis, :])
+    init_vals = ref_vals.copy()
+    init_vals[3, 4] = numpy.nan
+    init_vals[5, 5] = -1.
+    init_vals[6, 0] = 100.
+    vals = automol.pot.fit_nd_potential(init_vals, max_thresh=50.)
+    assert vals[6, 0] == 50.
+    assert numpy.allclose(vals[3, 4], ref_vals[3, 4], atol=0.5)
+    assert numpy.allclose(vals[5, 5], ref_vals[5, 5], atol=0.5)
+
+    # Spline resampling reproduces the grid points and smooth functions
+    fine_vals = automol.pot.periodic_spline(ref_vals, (24, 36))
+    assert fine_vals.shape == (24, 36)
+    assert numpy.allclose(fine_vals[::2, ::3], ref_vals)
+    fine_grid1 = numpy.arange(24) * 2. * numpy.pi / 24.
+    fine_grid2 = numpy.arange(36) * 2. * numpy.pi / 36.
+    assert numpy.allclose(
+        fine_vals, 2. - numpy.cos(fine_grid1)[:, numpy.newaxis] -
+        numpy.cos(3. * fine_grid2)[numpy.newaxis, :], atol=0.05)
+
+
+def test__find_maxnd():
+    """ test automol.pot.stationary_points
+        test automol.pot.saddle_points
+        test automol.pot.find_maxnd
+    """
+
+    grid = numpy.arange(12) * 2. * numpy.pi / 12.
+    vals = (2. - numpy.cos(grid)[:, numpy.newaxis] -
+            0.5 * numpy.cos(grid)[numpy.newaxis, :])
+
+    idxs, orders = automol.pot.stationary_points(vals)
+    stat_dct = dict(zip(map(tuple, idxs), orders))
+    assert stat_dct == {(0, 0): 0, (0, 6): 1, (6, 0): 1, (6, 6): 2}
+
+    max_idxs, min_idxs = automol.pot.local_extrema(vals)
+    assert list(map(tuple, max_idxs)) == [(6, 6)]
+    assert list(map(tuple, min_idxs)) == [(0, 0)]
+
+    sadpt_idxs = automol.pot.saddle_points(vals)
+    assert sorted(map(tuple, sadpt_idxs)) == [(0, 6), (6, 0)]
+    assert automol.pot.find_maxnd(vals, 'sadpt-global') == (6, 0)
+    assert automol.pot.find_maxnd(vals, 'full-global') == (6, 6)
+
+    # Without periodicity, the edges are not stationary points
+    idxs, _ = automol.pot.stationary_points(vals[1:, 1:], periodic=False)
+    assert list(map(tuple, idxs)) == [(5, 5)]
+
+
 def test__intmol():
     """ test pot.low_repulsion_struct
         test pot.intramol_interaction_potential_sum
@@ -101,6 +101,34 @@ def test__freq_scale():
     assert numpy.isclose(zpve4, ref_zpve3)
 
 
+def test__freq_scale_sets():
+    """ test prop.freq.scale_frequency_sets_and_zpes
+        test prop.freq.scale_frequency_sets
+    """
+
+    freqs_lst = (HARM_FREQS, FREQS, PROJ_FREQS)
+    freqs, zpves = prop.freq.scale_frequency_sets_and_zpes(
+        freqs_lst, METHOD1, BASIS1)
+    assert freqs.shape == (3, len(HARM_FREQS))
+    for idx, _freqs in enumerate(freqs_lst):
+        ref_freqs, ref_zpve = prop.freq.scale_frequencies_and_zpe(
+            _freqs, METHOD1, BASIS1)
+        assert numpy.allclose(freqs[idx, :len(_freqs)], ref_freqs)
+        assert not numpy.any(freqs[idx, len(_freqs):])
+        assert numpy.isclose(zpves[idx], ref_zpve)
+
+    # Padded arrays with their lengths give the same result
+    nfreqs = tuple(map(len, freqs_lst))
+    padded_freqs = numpy.zeros(freqs.shape)
+    for idx, _freqs in enumerate(freqs_lst):
+        padded_freqs[idx, :len(_freqs)] = _freqs
+    harm_freqs = prop.freq.scale_frequency_sets(
+        padded_freqs, METHOD2, BASIS2, scale_method='c3_harm', nfreqs=nfreqs)
+    ref_freqs = prop.freq.scale_frequencies(
+        FREQS, METHOD2, BASIS2, scale_method='c3_harm')
+    assert numpy.allclose(harm_freqs[1, :len(FREQS)], ref_freqs)
+
+
 def test__freq_scale_factor():
     """ test automol.prop.freq.rotor_scale_factor_from_harmonics
     """
@@ -112,5 +140,27 @@ def test__freq_scale_factor():
     assert not scale_factor[0]
     assert numpy.isclose(scale_factor[1], ref_scale_factor[1])
 
+    # Several sets at once, including one with low RRHO frequencies
+    idx_removes, factors = prop.freq.rotor_scale_factors_from_harmonics(
+        (HARM_FREQS, (5.0,) + HARM_FREQS[1:]),
+        (PROJ_FREQS, PROJ_FREQS),
+        (TORS_FREQS, TORS_FREQS[::-1]))
+    assert idx_removes == ([], [1])
+    assert numpy.isclose(factors[0], ref_scale_factor[1])
+
+    # Ragged sets, with more low RRHO frequencies than torsions
+    rt_freqs_lst = ((5.0, 6.0, 300.0), (5.0, 300.0, 400.0, 500.0))
+    rth_freqs_lst = ((300.0,), (300.0, 400.0))
+    tors_freqs_lst = ((100.0,), (250.0, 90.0, 120.0))
+    idx_removes, factors = prop.freq.rotor_scale_factors_from_harmonics(
+        rt_freqs_lst, rth_freqs_lst, tors_freqs_lst)
+    for args, idx_remove, factor in zip(
+            zip(rt_freqs_lst, rth_freqs_lst, tors_freqs_lst),
+            idx_removes, factors):
+        ref_idx_remove, ref_factor = (
+            prop.freq.rotor_scale_factor_from_harmonics(*args))
+        assert idx_remove == ref_idx_remove
+        assert numpy.isclose(factor, ref_factor)
+
     # need tests where idx remove list nonempty
     # nice to have 1DHRFA from large molecule
@@ -23,3 +23,31 @@ def test__pst():
     pst_kt2 = automol.reac.pst_kt(N_PAR, MRED, pst_cn, TEMP)
 
     assert numpy.isclose(pst_kt, pst_kt2)
+
+
+def test__pst_arrays():
+    """ test automol.reac.pst_kts
+        test automol.reac.pst_cns
+    """
+
+    temps = numpy.array([300., 500., 1000., 2000.])
+    n_pars = numpy.array([6., 4., 8.])
+    mreds = numpy.array([1.0, 7.5, 15.0])
+    cn_pars = numpy.array([6., 20., 1.5])
+
+    # The input arrays are not modified
+    pst_kt = automol.reac.pst_kt(n_pars[0], mreds, cn_pars[0], temps[:3])
+    assert numpy.array_equal(mreds, [1.0, 7.5, 15.0])
+    assert numpy.array_equal(temps, [300., 500., 1000., 2000.])
+
+    pst_kts = automol.reac.pst_kts(n_pars, mreds, cn_pars, temps)
+    assert pst_kts.shape == (3, 4)
+    for idx, temp in enumerate(temps):
+        assert numpy.isclose(pst_kts[1, idx], automol.reac.pst_kt(
+            n_pars[1], mreds[1], cn_pars[1], temp))
+    assert numpy.isclose(pst_kt[1], automol.reac.pst_kt(
+        N_PAR, mreds[1], CN_PAR, temps[1]))
+
+    # Fit Cn for every channel at once
+    pst_cns = automol.reac.pst_cns(pst_kts, n_pars, mreds, temps)
+    assert numpy.allclose(pst_cns, cn_pars)
@@ -1,9 +1,13 @@
 """ test automol.reac
 """
 
+import io
+import itertools
 import numpy
+from phydat import phycon
 import automol
 from automol.par import ReactionClass
+from automol.reac import _tunnel
 # from automol.graph import ts
 
 SUBSTITUTION_RXN_STR = """
@@ -155,6 +159,22 @@ def test__reac__string():
     assert automol.reac.string(rxn).strip() == rxn_str.strip()
 
 
+def test__reac__json_string():
+    """ test reac.json_string and reac.write_json_lines
+    """
+    rxn = automol.reac.from_string(SUBSTITUTION_RXN_STR)
+    rxn_str = automol.reac.json_string(rxn)
+    assert '\n' not in rxn_str
+    assert automol.reac.from_json_string(rxn_str) == rxn
+    assert automol.reac.from_json_string(rxn_str, check=True) == rxn
+
+    rxns = [rxn, automol.reac.from_string(MIGRATION_RXN_STR)]
+    stream = io.StringIO()
+    automol.reac.write_json_lines(rxns, stream)
+    stream.seek(0)
+    assert list(automol.reac.read_json_lines(stream)) == rxns
+
+
 def test__reac__forming_bond_keys():
     """ test reac.forming_bond_keys
     """
@@ -333,6 +353,24 @@ def test__reac__hydrogen_migration():
                     ref_tors_names, ref_tors_symms)
 
 
+def test__reac__ts_geometries():
+    """ test reac.ts_geometries
+    """
+    rxn_objs = automol.reac.rxn_objs_from_smiles(['CCCO[O]'], ['C[CH]COO'])
+    rxn, _, rct_geos, _ = rxn_objs[0]
+    srxns = automol.reac.expand_stereo(rxn)
+
+    # The last reaction is given the wrong number of reactant geometries
+    rxns = list(srxns) + [rxn]
+    rct_geos_lst = [rct_geos] * len(srxns) + [rct_geos * 2]
+    rets = automol.reac.ts_geometries(rxns, rct_geos_lst)
+    assert len(rets) == len(rxns)
+    for ret in rets[:-1]:
+        assert automol.geom.is_valid(ret)
+        assert automol.geom.symbols(ret) == automol.geom.symbols(rct_geos[0])
+    assert isinstance(rets[-1], Exception)
+
+
 def test__reac__2ts_hydrogen_migration():
     """ test hydrogen migration functionality
 
@@ -951,6 +989,11 @@ def test__expand_stereo():
         ('InChI=1S/C6H13F.H/c1-3-4-5-6(2)7;/h6H,3-5H2,1-2H3;/t6-;/m1./s1',
          'InChI=1S/C6H13F.H/c1-3-4-5-6(2)7;/h6H,3-5H2,1-2H3;/t6-;/m1./s1'))
 
+    # Only one member of the enantiomeric pair should be kept
+    srxn_objs = automol.reac.expand_stereo(rxn_obj, enant=False)
+    assert len(srxn_objs) == 1
+    assert srxn_objs[0] == automol.reac.expand_stereo(rxn_obj)[0]
+
 
 def test__expand_product_stereo():
     """ test reaction stereo expansion
@@ -1058,6 +1101,21 @@ def _check_reaction(rxn_obj, ref_class, var,
     scan_info = automol.reac.build_scan_info(zrxn, zma, var=var)
     scan_names, constraint_dct, scan_grid, update_guess = scan_info
     # print('scan grid', scan_grid)
+
+    # Check the vectorized scan geometries against point-by-point conversion
+    scan_xyzs = automol.reac.scan_grid_geometries(zrxn, zma, var=var)
+    if len(scan_names) == 1:
+        scan_vals_lst = [(v,) for v in numpy.concatenate(scan_grid)]
+    else:
+        scan_vals_lst = list(itertools.product(*scan_grid))
+    assert len(scan_xyzs) == len(scan_vals_lst)
+    for xyzs, scan_vals in zip(scan_xyzs, scan_vals_lst):
+        scan_zma = automol.zmat.set_values_by_name(
+            zma, dict(zip(scan_names, scan_vals)), angstrom=False,
+            degree=False)
+        scan_geo = automol.zmat.geometry(scan_zma)
+        assert numpy.allclose(xyzs, automol.geom.coordinates(scan_geo))
+
     # graph aligned to geometry keys
     # (for getting rotational groups and symmetry numbers)
     geo, gdummy_key_dct = automol.zmat.geometry_with_conversion_info(zma)
@@ -1140,6 +1198,97 @@ def _check_products(rct_gras, rxn_class_typ, num_rxns):
         assert any(r.class_ == rxn_class_typ for r in rxns_)
 
 
+def test__tunnel():
+    """ test automol.reac.tunnel.transmission_coefficient
+        test automol.reac.tunnel.alphas
+    """
+    freqs = (-1354.5, 569.5, 1117.2, 3114.7)
+    cfc_mat = numpy.zeros((4, 4, 4))
+    for idxs, val in (((0, 0, 0), 1e-8), ((1, 0, 0), 2e-8),
+                      ((2, 0, 0), -3e-8)):
+        for perm in itertools.permutations(idxs):
+            cfc_mat[perm] = val
+
+    # Batched alphas match the alphas of each transition state
+    alphas = automol.reac.tunnel.alphas([freqs, freqs[:3]], [cfc_mat] * 2)
+    assert numpy.isclose(
+        alphas[0], automol.reac.tunnel.alpha(freqs, cfc_mat))
+    assert numpy.isclose(
+        alphas[1], automol.reac.tunnel.alpha(freqs[:3], cfc_mat[:3, :3, :3]))
+    assert numpy.isclose(alphas[0], automol.reac.tunnel.alpha(
+        freqs, automol.util.highd_mat.sparse(cfc_mat)))
+
+    # Full arrays may also be given as nested tuples
+    cfc_tup = tuple(tuple(map(tuple, sub)) for sub in cfc_mat.tolist())
+    assert numpy.isclose(
+        alphas[0], automol.reac.tunnel.alpha(freqs, cfc_tup))
+    cfc_tup2 = tuple(tuple(map(tuple, sub[:2])) for sub in cfc_tup[:2])
+    assert numpy.isclose(
+        automol.reac.tunnel.alpha(freqs[:2], cfc_tup2),
+        automol.reac.tunnel.alpha(freqs[:2], cfc_mat[:2, :2, :2]))
+
+    # Reference values for a small set of force constants, by hand:
+    # alpha = (pi/8) * [(5/3) V_rrr^2 / w_r^3
+    #                   - sum_k V_krr^2 / w_k^3 (2/w_k^2 + 1/(4w_r^2 + w_k^2))
+    #                   - V_rrrr / w_r^6],
+    # where the reaction mode r is left out of the sum over k
+    ref_alpha = (numpy.pi / 8.) * (
+        15. / 8. - 35. / 17. - 5. / 512. - 1.)
+    cfc_dct = {(0, 0, 0): 3., (1, 0, 0): 1., (0, 2, 0): 2.}
+    qfc_dct = {(0, 0, 0, 0): 64.}
+    assert numpy.isclose(
+        _tunnel.alpha((-2., 1., 4.), cfc_dct, vr4=qfc_dct), ref_alpha)
+    assert numpy.allclose(
+        _tunnel.alphas([(-2., 1., 4.), (1., -2., 4.)],
+                       [cfc_dct, {(1, 1, 1): 3., (0, 1, 1): 1.}],
+                       vr4s=[qfc_dct, None]),
+        [ref_alpha, (numpy.pi / 8.) * (15. / 8. - 35. / 17.)])
+
+    # The same force constants in cm-1 and hartree units
+    wvn = phycon.WAVEN2EH
+    cfc_mat = numpy.zeros((3, 3, 3))
+    qfc_mat = numpy.zeros((3, 3, 3, 3))
+    for idxs, val in cfc_dct.items():
+        for perm in itertools.permutations(idxs):
+            cfc_mat[perm] = val
+    qfc_mat[0, 0, 0, 0] = 64.
+    ref_alpha = (numpy.pi / 8.) * (
+        (5. / 3.) * 3.**2 / (2. * wvn)**3
+        - 1.**2 / wvn**3 * (2. / wvn**2 + 1. / (17. * wvn**2))
+        - 2.**2 / (4. * wvn)**3 * (2. / (4. * wvn)**2 + 1. / (32. * wvn**2))
+        - 64. / (2. * wvn)**6)
+    assert numpy.isclose(
+        automol.reac.tunnel.alpha((-2., 1., 4.), cfc_mat, qfc_mat=qfc_mat),
+        ref_alpha)
+
+    # Transmission coefficients over a grid, for both transition states,
+    # without overflow deep below the barrier
+    enes = numpy.linspace(-0.05, 0.01, 51)
+    kes = automol.reac.tunnel.transmission_coefficient(
+        enes, alphas[:, numpy.newaxis], -freqs[0])
+    ses = automol.reac.tunnel.action(-enes, alphas[0], -freqs[0])
+    below = enes < 0.
+    assert kes.shape == (2, 51)
+    assert numpy.allclose(kes[0, below], 1. / (1. + numpy.exp(ses[below])))
+    assert kes[0, 0] < 1e-10 and kes[0, -1] > 0.5
+    assert automol.reac.tunnel.transmission_coefficient(
+        -1., alphas[0], -freqs[0]) == 0.
+    assert numpy.all(numpy.diff(kes, axis=1) >= 0.)
+
+    # Above the barrier, the parabolic form is used, so P(E) keeps rising
+    # to one well above the barrier, even for alpha > 0
+    enes = numpy.linspace(-0.05, 0.1, 301)
+    rxn_freq = -freqs[0] * phycon.WAVEN2EH
+    kes = automol.reac.tunnel.transmission_coefficient(
+        enes, 0.5, -freqs[0])
+    above = enes >= 0.
+    assert numpy.allclose(
+        kes[above],
+        1. / (1. + numpy.exp(-2. * numpy.pi * enes[above] / rxn_freq)))
+    assert numpy.all(numpy.diff(kes) >= 0.)
+    assert numpy.isclose(kes[-1], 1.)
+
+
 if __name__ == '__main__':
     # test__reac__hydrogen_abstraction()
     # test__reac__sigma_hydrogen_abstraction()
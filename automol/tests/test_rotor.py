@@ -3,6 +3,9 @@
 """
 
 import os
+import itertools
+import numpy
+from phydat import phycon
 import automol
 from ioformat import pathtools
 
@@ -237,6 +240,32 @@ def test__rotor():
         (((11,), (0, 1, 2, 3, 4, 6, 7, 9, 10)),))
 
 
+def test__rotor_cache():
+    """ rotors built repeatedly from the same z-matrix
+    """
+
+    rotors1 = automol.rotor.from_zmatrix(C3H7OH_ZMA)
+    rotors2 = automol.rotor.from_zmatrix(C3H7OH_ZMA)
+    assert automol.rotor.names(rotors1) == automol.rotor.names(rotors2)
+    assert automol.rotor.groups(rotors1) == automol.rotor.groups(rotors2)
+    assert automol.rotor.symmetries(rotors1) == (
+        automol.rotor.symmetries(rotors2))
+
+    # The torsion objects themselves are not shared
+    rotors1[0][0].pot = {(0.0,): 0.0}
+    assert rotors2[0][0].pot is None
+    assert rotors1[0][0].indices == automol.zmat.coord_idxs(
+        C3H7OH_ZMA, rotors1[0][0].name)
+
+    # The grids of all torsions match the grid of each one on its own
+    tors_grids = automol.rotor.grids(rotors1, flat=True)
+    for torsion, tors_grid in zip(
+            itertools.chain(*rotors1), tors_grids):
+        assert tors_grid == automol.pot.grid(
+            torsion.zma, torsion.name, 2.0*numpy.pi, torsion.symmetry,
+            30.0*phycon.DEG2RAD, from_equilibrium=True)
+
+
 def test__rotor_wdummy():
     """ rotor
     """
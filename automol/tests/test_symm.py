@@ -1,6 +1,9 @@
 """ symmetry functions
 """
 
+import automol.geom
+import automol.graph
+import automol.reac
 import automol.symm
 
 
@@ -37,6 +40,157 @@ TS_GEO = (('H', (4.2225665711697, 0.5285809637301855, -0.000115273293652927)),
           ('H', (-2.909531946870, -1.4944029789165523, 1.6724813203490707)),
           ('H', (-4.22464715963, 1.091354631974405, -9.448630627289141e-06)))
 H_GEO = (('H', (-0.9827048283, 0.061897979239, 2.02901783816)),)
+SF6_GEO = (('S', (0.0, 0.0, 0.0)),
+           ('F', (2.96, 0.0, 0.0)),
+           ('F', (-2.96, 0.0, 0.0)),
+           ('F', (0.0, 2.96, 0.0)),
+           ('F', (0.0, -2.96, 0.0)),
+           ('F', (0.0, 0.0, 2.96)),
+           ('F', (0.0, 0.0, -2.96)))
+C6H6_GEO = (('C', (2.64, 0.0, 0.0)),
+            ('C', (1.32, 2.286307, 0.0)),
+            ('C', (-1.32, 2.286307, 0.0)),
+            ('C', (-2.64, 0.0, 0.0)),
+            ('C', (-1.32, -2.286307, 0.0)),
+            ('C', (1.32, -2.286307, 0.0)),
+            ('H', (4.68, 0.0, 0.0)),
+            ('H', (2.34, 4.052999, 0.0)),
+            ('H', (-2.34, 4.052999, 0.0)),
+            ('H', (-4.68, 0.0, 0.0)),
+            ('H', (-2.34, -4.052999, 0.0)),
+            ('H', (2.34, -4.052999, 0.0)))
+C2H6_GEO = (('C', (0.0, 0.0, 1.45)),
+            ('C', (0.0, 0.0, -1.45)),
+            ('H', (1.94, 0.0, 2.12)),
+            ('H', (-0.97, 1.680089, 2.12)),
+            ('H', (-0.97, -1.680089, 2.12)),
+            ('H', (0.97, 1.680089, -2.12)),
+            ('H', (-1.94, 0.0, -2.12)),
+            ('H', (0.97, -1.680089, -2.12)))
+NH3_GEO = (('N', (0.0, 0.0, 0.13)),
+           ('H', (1.78, 0.0, -0.6)),
+           ('H', (-0.89, 1.541525, -0.6)),
+           ('H', (-0.89, -1.541525, -0.6)))
+C3H4_GEO = (('C', (0.0, 0.0, 0.0)),
+            ('C', (0.0, 0.0, 2.48)),
+            ('C', (0.0, 0.0, -2.48)),
+            ('H', (1.75, 0.0, 3.52)),
+            ('H', (-1.75, 0.0, 3.52)),
+            ('H', (0.0, 1.75, -3.52)),
+            ('H', (0.0, -1.75, -3.52)))
+CO2_GEO = (('C', (0.0, 0.0, 0.0)),
+           ('O', (0.0, 0.0, 2.2)),
+           ('O', (0.0, 0.0, -2.2)))
+HCN_GEO = (('H', (0.0, 0.0, -3.2)),
+           ('C', (0.0, 0.0, -1.19)),
+           ('N', (0.0, 0.0, 0.99)))
+BH3O3_GEO = (('B', (0.0, 0.0, 0.0)),
+             ('O', (2.6, 0.0, 0.0)),
+             ('O', (-1.3, 2.251666, 0.0)),
+             ('O', (-1.3, -2.251666, 0.0)),
+             ('H', (3.3, 1.6, 0.0)),
+             ('H', (-3.035641, 2.057884, 0.0)),
+             ('H', (-0.264359, -3.657884, 0.0)))
+H2O2_GEO = (('O', (0.0, 1.37, 0.0)),
+            ('O', (0.0, -1.37, 0.0)),
+            ('H', (1.73, 1.7, 0.3)),
+            ('H', (-0.648069, -1.7, 1.604028)))
+C2H6_DISTORTED_GEO = (('C', (0.01, 0.03, 1.47)),
+                      ('C', (-0.02, -0.02, -1.42)),
+                      ('H', (1.9, 0.03, 2.14)),
+                      ('H', (-0.97, 1.660089, 2.1)),
+                      ('H', (-0.99, -1.680089, 2.12)),
+                      ('H', (0.97, 1.720089, -2.1)),
+                      ('H', (-1.93, 0.04, -2.14)),
+                      ('H', (0.94, -1.670089, -2.16)))
+C3H8_GEO = (('C', (2.216662, 0.88079, -0.465966)),
+            ('C', (0.177688, -1.084677, 0.006118)),
+            ('C', (-2.382666, 0.132567, 0.46025)),
+            ('H', (1.772728, 2.02428, -2.131783)),
+            ('H', (2.414921, 2.14803, 1.157115)),
+            ('H', (4.040075, -0.040982, -0.787324)),
+            ('H', (0.695429, -2.234213, 1.648449)),
+            ('H', (0.056735, -2.357291, -1.62255)),
+            ('H', (-3.817251, -1.319217, 0.794994)),
+            ('H', (-2.971968, 1.252405, -1.176296)),
+            ('H', (-2.329777, 1.376163, 2.112603)))
+C4H10_GEO = (('C', (2.419603, -0.75953, 1.055462)),
+             ('C', (0.230235, -0.001841, -0.665055)),
+             ('C', (-1.9338, -1.89859, -0.448487)),
+             ('C', (-0.685862, 2.659722, -0.029091)),
+             ('H', (1.841986, -0.784266, 3.043051)),
+             ('H', (3.996865, 0.566515, 0.863938)),
+             ('H', (3.117372, -2.645979, 0.568366)),
+             ('H', (0.908333, -0.007269, -2.623797)),
+             ('H', (-1.296493, -3.800858, -0.956475)),
+             ('H', (-3.48509, -1.391121, -1.720812)),
+             ('H', (-2.684088, -1.968512, 1.47945)),
+             ('H', (-2.219814, 3.230497, -1.295597)),
+             ('H', (-1.386657, 2.770609, 1.915479)),
+             ('H', (0.848269, 4.033256, -0.235678)))
+C5H12_GEO = (('C', (1.297441, -1.857717, 1.812033)),
+             ('C', (0.0, 0.0, 0.0)),
+             ('C', (-0.970918, 2.289727, 1.494122)),
+             ('C', (-2.230211, -1.319777, -1.304715)),
+             ('C', (1.903689, 0.887769, -2.001442)),
+             ('H', (2.012113, -3.515972, 0.798341)),
+             ('H', (-0.016986, -2.526363, 3.265762)),
+             ('H', (2.901016, -0.968124, 2.773958)),
+             ('H', (0.581372, 3.273077, 2.448875)),
+             ('H', (-2.336636, 1.714841, 2.940653)),
+             ('H', (-1.908686, 3.652808, 0.248837)),
+             ('H', (-3.196453, -0.038306, -2.613276)),
+             ('H', (-3.624393, -1.976264, 0.078548)),
+             ('H', (-1.595285, -2.96587, -2.388866)),
+             ('H', (2.632068, -0.708413, -3.101348)),
+             ('H', (3.52097, 1.839433, -1.12573)),
+             ('H', (1.030899, 2.219151, -3.325752)))
+C2H5OH_GEO = (('C', (-2.338174, 0.492392, 0.511253)),
+              ('C', (0.212599, -0.789916, 0.689782)),
+              ('O', (1.872436, 0.311861, -1.107177)),
+              ('H', (-2.160628, 2.522346, 0.871564)),
+              ('H', (-3.666228, -0.313389, 1.874164)),
+              ('H', (-3.126169, 0.286675, -1.391062)),
+              ('H', (0.039043, -2.810052, 0.285176)),
+              ('H', (1.01759, -0.544262, 2.57828)),
+              ('H', (3.488349, -0.548198, -0.946926)))
+CH3OCH3_GEO = (('C', (2.270729, 0.034766, 0.005806)),
+               ('O', (-0.223508, 0.26695, 0.973985)),
+               ('C', (-2.064913, -0.280585, -0.902696)),
+               ('H', (2.619885, -1.898801, -0.639058)),
+               ('H', (3.602046, 0.475152, 1.523077)),
+               ('H', (2.572173, 1.368528, -1.545534)),
+               ('H', (-1.903366, 1.043016, -2.483336)),
+               ('H', (-3.938482, -0.073326, -0.056979)),
+               ('H', (-1.855643, -2.22432, -1.576893)))
+C7H14_GEO = (('C', (-4.691988, 0.224182, -0.12795)),
+             ('C', (-1.896163, -0.241405, -0.674752)),
+             ('C', (-0.72265, -1.938425, 1.363393)),
+             ('C', (2.097746, -2.349708, 0.913022)),
+             ('C', (3.515721, 0.150738, 0.693985)),
+             ('C', (2.359556, 1.851941, -1.325927)),
+             ('C', (-0.460409, 2.270136, -0.879241)),
+             ('H', (-5.546794, 1.383236, -1.613992)),
+             ('H', (-5.730429, -1.563818, -0.043588)),
+             ('H', (-4.954151, 1.202413, 1.677163)),
+             ('H', (-1.758648, -1.221931, -2.498741)),
+             ('H', (-1.683843, -3.773891, 1.394212)),
+             ('H', (-0.996207, -1.086197, 3.234503)),
+             ('H', (2.894198, -3.468331, 2.463078)),
+             ('H', (2.364871, -3.448918, -0.824122)),
+             ('H', (5.50434, -0.2124, 0.245054)),
+             ('H', (3.477408, 1.127302, 2.522142)),
+             ('H', (3.339384, 3.676205, -1.344061)),
+             ('H', (2.641864, 0.996373, -3.192903)),
+             ('H', (-0.718302, 3.37377, 0.857901)),
+             ('H', (-1.236601, 3.403649, -2.430516)))
+C2H5_GEO = (('C', (1.432035, 0.108716, 0.462445)),
+            ('C', (-1.325589, -0.036134, -0.310353)),
+            ('H', (2.22522, -1.823822, 0.660209)),
+            ('H', (2.527545, 1.168708, -0.979509)),
+            ('H', (-2.108667, 1.901452, -0.487787)),
+            ('H', (-1.501323, -1.027235, -2.151535)),
+            ('H', (-2.410212, -1.083336, 1.147691)))
 
 
 def test__external_symmetry_factor():
@@ -48,8 +202,77 @@ def test__external_symmetry_factor():
     assert automol.symm.external_symm(C2H5OF_GEO) == 0.5
     assert automol.symm.external_symm(C2H2CLF_GEO) == 1
 
+    assert automol.geom.external_symmetry_factors(
+        [METHANE_GEO, H_GEO, C2H5OF_GEO, C2H2CLF_GEO]) == (12, 1, 0.5, 1)
+    assert automol.geom.symmetry_number_and_chirality(C2H5OF_GEO) == (1, True)
+
+
+def test__symmetry_number_and_chirality():
+    """ test geom.symmetry_number_and_chirality
+    """
+
+    # nonlinear, achiral point groups
+    assert automol.geom.symmetry_number_and_chirality(
+        METHANE_GEO) == (12, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        SF6_GEO) == (24, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        C6H6_GEO) == (12, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        C2H6_GEO) == (6, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        NH3_GEO) == (3, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        C3H4_GEO) == (4, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        BH3O3_GEO) == (3, False)
+
+    # chiral point group (C2)
+    assert automol.geom.symmetry_number_and_chirality(
+        H2O2_GEO) == (2, True)
+
+    # linear molecules, with and without an inversion center
+    assert automol.geom.symmetry_number_and_chirality(
+        CO2_GEO) == (2, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        HCN_GEO) == (1, False)
+
+    # a distorted geometry is symmetric within the default tolerance only
+    assert automol.geom.symmetry_number_and_chirality(
+        C2H6_DISTORTED_GEO) == (6, False)
+    assert automol.geom.symmetry_number_and_chirality(
+        C2H6_DISTORTED_GEO, tol=1e-3) == (1, True)
+
 
 def test__hco_symm_num():
-    """ test
+    """ test symm.oxygenated_hydrocarbon_symm_num
     """
-    print(automol.symm.oxygenated_hydrocarbon_symm_num(TS_GEO))
+
+    for geo, ref_symm_nums in [(C3H8_GEO, (9, 2)),
+                               (C4H10_GEO, (27, 3)),
+                               (C5H12_GEO, (81, 12)),
+                               (C2H5OH_GEO, (3, 1)),
+                               (CH3OCH3_GEO, (9, 2)),
+                               (C7H14_GEO, (3, 1)),
+                               (C2H5_GEO, (6, 1))]:
+        assert automol.symm.oxygenated_hydrocarbon_symm_num(
+            geo) == ref_symm_nums
+
+        # the rotor symmetries should not depend on the order of the atoms
+        natms = len(geo)
+        rev_geo = automol.geom.reorder(
+            geo, {idx: natms - idx - 1 for idx in range(natms)})
+        assert automol.symm.oxygenated_hydrocarbon_symm_num(
+            rev_geo) == ref_symm_nums
+
+    # propane + H => 1-propyl + H2, with the abstracted hydrogen listed first
+    gra = automol.graph.remove_bonds(
+        automol.geom.connectivity_graph(TS_GEO), [{0, 1}])
+    tsg = automol.graph.ts.graph(gra, [{0, 1}], [{0, 2}])
+    zrxn = automol.reac.Reaction(
+        'hydrogen abstraction', tsg, automol.graph.ts.reverse(tsg),
+        [[0] + list(range(2, 12)), [1]], [list(range(2, 12)), [0, 1]])
+    assert automol.symm.oxygenated_hydrocarbon_symm_num(
+        TS_GEO) == (3, 1)
+    assert automol.symm.oxygenated_hydrocarbon_symm_num(
+        TS_GEO, zrxn=zrxn) == (3, 1)
@@ -4,7 +4,7 @@
 import pytest
 import numpy
 from automol import zmat
-# from automol import geom
+from automol import geom
 
 CH4O2_ZMA = (
     ('C', (None, None, None), (None, None, None), (None, None, None)),
@@ -472,6 +472,41 @@ def test__shift():
     assert zmat.shift_up(C5H8O_ZMA, (3, 9, 12)) == (3, 10, 14)
 
 
+def test__geometries():
+    """ test zmat.geometries
+    """
+    val_mat = numpy.array(zmat.value_matrix(C2H5OH_ZMA), dtype=float)
+    val_mats = numpy.repeat(val_mat[numpy.newaxis], 5, axis=0)
+    val_mats[:, 5, 2] += numpy.linspace(0., numpy.pi, 5)
+    val_mats[:, 8, 2] -= numpy.linspace(0., numpy.pi, 5)
+
+    xyzs_lst = zmat.geometries(C2H5OH_ZMA, val_mats)
+    assert numpy.shape(xyzs_lst) == numpy.shape(val_mats)
+    for xyzs, val_mat in zip(xyzs_lst, val_mats):
+        zma = zmat.set_value_matrix(C2H5OH_ZMA, val_mat)
+        geo = zmat.geometry_with_dummy_atoms(zma)
+        assert numpy.allclose(xyzs, geom.coordinates(geo))
+
+
+def test__value_matrices_from_coordinates():
+    """ test zmat.value_matrices_from_coordinates
+    """
+    vma = zmat.vmatrix(C2H5OH_ZMA)
+    val_mat = numpy.array(zmat.value_matrix(C2H5OH_ZMA), dtype=float)
+    val_mats = numpy.repeat(val_mat[numpy.newaxis], 5, axis=0)
+    val_mats[:, 5, 2] += numpy.linspace(0., numpy.pi, 5)
+    val_mats[:, 8, 2] -= numpy.linspace(0., numpy.pi, 5)
+
+    xyzs_lst = zmat.geometries(C2H5OH_ZMA, val_mats)
+    val_mats = zmat.value_matrices_from_coordinates(vma, xyzs_lst)
+    assert numpy.shape(val_mats) == numpy.shape(xyzs_lst)
+    for xyzs, val_mat in zip(xyzs_lst, val_mats):
+        geo = geom.from_data(zmat.symbols(C2H5OH_ZMA), xyzs)
+        ref_val_mat = numpy.array(
+            zmat.value_matrix(zmat.from_geometry(vma, geo)), dtype=float)
+        assert numpy.allclose(val_mat, ref_val_mat, equal_nan=True)
+
+
 def test__extra():
     """ test zmat.bond_key_from_idxs
     """
@@ -6,6 +6,113 @@ import numpy as np
 import automol.util.vec
 
 
+# Sparse representation
+def sparse(arr, include_zeros=False, include_perms=False):
+    """ Convert a higher dimensional array (3 or more) to a sparse,
+        coordinate-format array of its index tuples and values.
+
+        Unless include_perms is set, only one permutation of each index
+        tuple is kept, with the indices in non-decreasing order, which is
+        all that is needed for a permutation-symmetric array.
+
+        :param arr: higher dimensions matrix
+        :type arr: numpy.ndarray
+        :rtype: (numpy.ndarray, numpy.ndarray)
+
+        The sparse array is a pair of an integer array of index tuples, with
+        shape (nvals, ndim), sorted in lexicographic order, and an array
+        of the nvals values.
+    """
+
+    arr = np.asarray(arr)
+    if include_zeros:
+        idxs = np.argwhere(np.ones(arr.shape, dtype=bool))
+    else:
+        idxs = np.argwhere(arr != 0.0)
+
+    if not include_perms:
+        idxs = idxs[np.all(np.diff(idxs, axis=1) >= 0, axis=1)]
+
+    return idxs, arr[tuple(idxs.T)]
+
+
+def dense(sp_arr, fill_perms=False):
+    """ Convert a sparse array to a full higher dimensional array
+
+        :param sp_arr: sparse array of index tuples and values
+        :type sp_arr: (numpy.ndarray, numpy.ndarray)
+        :param fill_perms: fill in all permutations of the index tuples
+        :type fill_perms: bool
+        :rtype: numpy.ndarray
+    """
+    sp_idxs, sp_vals = sp_arr
+    return build_full_array(sp_idxs, sp_vals, fill_perms=fill_perms)
+
+
+def is_sparse(arr):
+    """ Determine if an array is a sparse (index tuples, values) pair, as
+        opposed to a full array, which may also be given as nested tuples
+
+        :param arr: full array, or sparse (index tuples, values) pair
+        :type arr: numpy.ndarray or (numpy.ndarray, numpy.ndarray)
+        :rtype: bool
+    """
+
+    if not isinstance(arr, (tuple, list)) or len(arr) != 2:
+        return False
+
+    sp_idxs, sp_vals = arr
+    return bool(
+        isinstance(sp_idxs, np.ndarray) and isinstance(sp_vals, np.ndarray)
+        and sp_idxs.ndim == 2 and sp_vals.ndim == 1
+        and np.issubdtype(sp_idxs.dtype, np.integer)
+        and len(sp_idxs) == len(sp_vals))
+
+
+def values(arr, idxs_lst):
+    """ Get the values of a full or sparse array at several index tuples
+
+        For a sparse array, the index tuples are matched regardless of the
+        order of their indices, as for a permutation-symmetric array, and
+        missing values are zero.
+
+        :param arr: full array, or sparse (index tuples, values) pair
+        :type arr: numpy.ndarray or (numpy.ndarray, numpy.ndarray)
+        :param idxs_lst: the index tuples
+        :type idxs_lst: tuple(tuple(int))
+        :rtype: numpy.ndarray
+    """
+
+    if not is_sparse(arr):
+        arr = np.asarray(arr)
+        idxs = np.asarray(idxs_lst, dtype=int).reshape(len(idxs_lst), -1)
+        return arr[tuple(idxs.T)]
+
+    sp_idxs, sp_vals = arr
+    sp_idxs = np.sort(np.asarray(sp_idxs, dtype=int), axis=1)
+    sp_vals = np.asarray(sp_vals, dtype=float)
+    ndim = sp_idxs.shape[1]
+    idxs = np.sort(
+        np.asarray(idxs_lst, dtype=int).reshape(len(idxs_lst), ndim), axis=1)
+
+    vals = np.zeros(len(idxs))
+    if not sp_idxs.size or not idxs.size:
+        return vals
+
+    # Look up each index tuple by its flattened index in the sorted keys
+    dims = (max(sp_idxs.max(), idxs.max()) + 1,) * ndim
+    sp_keys = np.ravel_multi_index(tuple(sp_idxs.T), dims)
+    keys = np.ravel_multi_index(tuple(idxs.T), dims)
+
+    order = np.argsort(sp_keys, kind='stable')
+    sp_keys, sp_vals = sp_keys[order], sp_vals[order]
+    pos = np.minimum(np.searchsorted(sp_keys, keys), len(sp_keys) - 1)
+    found = sp_keys[pos] == keys
+    vals[found] = sp_vals[pos[found]]
+
+    return vals
+
+
 # I/O
 def string(arr, include_zeros=False, include_perms=False,
            val_format='{0:>16.8f}'):
@@ -19,39 +126,40 @@ def string(arr, include_zeros=False, include_perms=False,
             idx1 idx2 .. idxn  val1
             idx1 idx2 .. idxn  valn
     """
+    sp_idxs, sp_vals = sparse(arr, include_zeros=include_zeros,
+                              include_perms=include_perms)
 
-    def _chk_zero(val, include_zeros):
-        """ decide to write value
-        """
-        iszero = np.isclose(val, 0.0)
-        return bool(not iszero or (iszero and include_zeros))
+    # Also leave out values that would be written as zero
+    if not include_zeros:
+        keep = ~np.isclose(sp_vals, 0.0)
+        sp_idxs, sp_vals = sp_idxs[keep], sp_vals[keep]
 
-    def _chk_idxs(arr):
-        """ decide if idxs
-            check if any permutation of idxs is already written
-        """
-        idxs_lst = tuple(idxs for idxs, _ in np.ndenumerate(arr))
-        if not include_perms:
-            idxs_lst = set(tuple(sorted(x)) for x in idxs_lst)
-        vals_lst = tuple(arr[idxs] for idxs in idxs_lst)
+    return sparse_string((sp_idxs, sp_vals), val_format=val_format)
 
-        re_idxs = list(zip(idxs_lst, vals_lst))
-        fin_idxs = tuple(sorted(re_idxs, key=lambda x: x[0]))
 
-        return fin_idxs
+def sparse_string(sp_arr, val_format='{0:>16.8f}'):
+    """ Write a sparse array to a string, in the same format as string()
 
-    arr_str = ''
-    for idxs, val in _chk_idxs(arr):
-        if _chk_zero(val, include_zeros):
-            val_str = ''.join((f'{idx+1:<6d}' for idx in idxs))
-            val_str += val_format.format(val)
-            val_str += '\n'
+        :param sp_arr: sparse array of index tuples and values
+        :type sp_arr: (numpy.ndarray, numpy.ndarray)
+        :rtype: str
+    """
+    return ''.join(string_lines(sp_arr, val_format=val_format))
 
-            arr_str += val_str
 
-    arr_str.rstrip()
+def string_lines(sp_arr, val_format='{0:>16.8f}'):
+    """ Generate the lines of the string for a sparse array one at a time,
+        so that they can be streamed to a file with writelines()
 
-    return arr_str
+        :param sp_arr: sparse array of index tuples and values
+        :type sp_arr: (numpy.ndarray, numpy.ndarray)
+        :rtype: iterator(str)
+    """
+    sp_idxs, sp_vals = sp_arr
+    for idxs, val in zip(np.asarray(sp_idxs).tolist(),
+                         np.asarray(sp_vals).tolist()):
+        idx_str = ''.join(f'{idx+1:<6d}' for idx in idxs)
+        yield idx_str + val_format.format(val) + '\n'
 
 
 def from_string(arr_str, fill_perms=False):
@@ -65,26 +173,64 @@ def from_string(arr_str, fill_perms=False):
             idx1 idx2 .. idxn  val1
             idx1 idx2 .. idxn  valn
     """
+    return dense(sparse_from_string(arr_str), fill_perms=fill_perms)
+
+
+def sparse_from_string(arr_str):
+    """ Read a sparse array from a string, in the format written by string()
+
+        :param arr_str: string containing higher dimensions matrix
+        :type arr_str: str
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+    return sparse_from_lines(arr_str.splitlines())
 
-    lines = arr_str.splitlines()
 
-    # Get the number of values in each array dimension; initialize array
-    nvals = [int(val) for val in lines[-1].strip().split()[:-1]]
-    arr = np.zeros(nvals)
+def sparse_from_lines(lines):
+    """ Read a sparse array from lines in the format written by string(),
+        one line at a time, such as from an open file
+
+        :param lines: lines of the higher dimensions matrix string
+        :type lines: iterator(str)
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
 
     mat_idxs, mat_vals = [], []
     for line in lines:
-        # Read the values from the line
-        tmp = line.strip().split()
-        idxs = tuple(int(val)-1 for val in tmp[:-1])
-        val = float(tmp[-1])
-        # Store values
-        mat_idxs.append(idxs)
-        mat_vals.append(val)
+        tmp = line.split()
+        if tmp:
+            mat_idxs.append(tuple(map(int, tmp[:-1])))
+            mat_vals.append(float(tmp[-1]))
+
+    ndim = len(mat_idxs[0]) if mat_idxs else 0
+    sp_idxs = np.array(mat_idxs, dtype=int).reshape(len(mat_idxs), ndim) - 1
+    sp_vals = np.array(mat_vals, dtype=float)
+
+    return sp_idxs, sp_vals
+
+
+def sparse_to_npz(sp_arr, file):
+    """ Write a sparse array to a compressed binary .npz file
+
+        :param sp_arr: sparse array of index tuples and values
+        :type sp_arr: (numpy.ndarray, numpy.ndarray)
+        :param file: file name or open file
+        :type file: str or file
+    """
+    sp_idxs, sp_vals = sp_arr
+    np.savez_compressed(file, idxs=sp_idxs, vals=sp_vals)
+
 
-    arr = build_full_array(mat_idxs, mat_vals, fill_perms=fill_perms)
+def sparse_from_npz(file):
+    """ Read a sparse array from a .npz file written by sparse_to_npz()
 
-    return arr
+        :param file: file name or open file
+        :type file: str or file
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+    with np.load(file) as npz:
+        sp_arr = (npz['idxs'], npz['vals'])
+    return sp_arr
 
 
 def string_submat_4d(arr):
@@ -153,37 +299,19 @@ def build_full_array(mat_idxs, mat_vals, fill_perms=False):
             ((idx1, idx2, ..., idxn), valn),
     """
 
-    def _gen_idxs(mat_idxs, mat_vals):
-        """ permute idxs
-        """
-
-        full_idxs, full_vals = [], []
-        for idxs, val in zip(mat_idxs, mat_vals):
-            idx_perms = tuple(itertools.permutations(idxs))
-            for perm in idx_perms:
-                full_idxs.append(perm)
-                full_vals.append(val)
-
-        return full_idxs, full_vals
-
-    # Build out the idxs and vals to include permutations, if needed
-    if fill_perms:
-        mat_idxs, mat_vals = _gen_idxs(mat_idxs, mat_vals)
+    mat_idxs = np.asarray(mat_idxs, dtype=int)
+    mat_vals = np.asarray(mat_vals, dtype=float)
 
     # Get dimensionality of matrix (assumes 0 idx of mat)
-    ncoords = max((max(idxs) for idxs in mat_idxs))+1
-    print(ncoords)
-    ndim = len(mat_idxs[0])
-    print(ndim)
-
+    ncoords = mat_idxs.max() + 1
+    ndim = mat_idxs.shape[1]
     dims = tuple(ncoords for _ in range(ndim))
-    print(dims)
 
-    # Build the force constant matrix
+    # Build the force constant matrix, including the permutations if needed
     mat = np.zeros(dims)
-    if fill_perms:
-        mat_idxs, mat_vals = _gen_idxs(mat_idxs, mat_vals)
-    for idxs, val in zip(mat_idxs, mat_vals):
-        mat[idxs] = val
+    perms = (itertools.permutations(range(ndim)) if fill_perms else
+             (tuple(range(ndim)),))
+    for perm in perms:
+        mat[tuple(mat_idxs[:, perm].T)] = mat_vals
 
     return mat
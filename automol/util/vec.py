@@ -148,6 +148,61 @@ def from_internals(dist=0., xyz1=(0., 0., 0.), ang=0., xyz2=(0., 0., 1.),
     return xyz4
 
 
+def from_internals_array(dists, xyzs1, angs=0., xyzs2=(0., 0., 1.),
+                         dihs=0., xyzs3=(0., 1., 0.)):
+    """ Vectorized version of `from_internals`, placing a whole stack of
+        points in one pass (NeRF-style).
+
+        The internal coordinates and support points are broadcast against each
+        other along the leading axis, so that, for M points, each argument may
+        either be given for all M points or once for all of them.
+
+        :param dists: distances between each point and `xyzs1` (in bohr)
+        :type dists: float or numpy.ndarray of shape (M,)
+        :param xyzs1: 3D vectors to support point 1
+        :type xyzs1: numpy.ndarray of shape (M, 3) or (3,)
+        :param angs: angles between each point, `xyzs1`, `xyzs2` (in radians)
+        :type angs: float or numpy.ndarray of shape (M,)
+        :param xyzs2: 3D vectors to support point 2
+        :type xyzs2: numpy.ndarray of shape (M, 3) or (3,)
+        :param dihs: dihedrals from each point to `xyzs3` (in radians)
+        :type dihs: float or numpy.ndarray of shape (M,)
+        :param xyzs3: 3D vectors to support point 3
+        :type xyzs3: numpy.ndarray of shape (M, 3) or (3,)
+        :rtype: numpy.ndarray of shape (M, 3)
+    """
+    dists, angs, dihs = (numpy.asarray(x, dtype=float)[..., numpy.newaxis]
+                         for x in (dists, angs, dihs))
+    xyzs1, xyzs2, xyzs3 = (numpy.asarray(x, dtype=float)
+                           for x in (xyzs1, xyzs2, xyzs3))
+
+    # Local axes, as in `_local_axes`
+    uxyzs12 = _unit_norms(xyzs2 - xyzs1)
+    uxyzs23 = _unit_norms(xyzs3 - xyzs2)
+    uxyzs123_perp = _unit_norms(numpy.cross(uxyzs23, uxyzs12))
+    z_axs = uxyzs12
+    y_axs = _unit_norms(numpy.cross(uxyzs12, uxyzs123_perp))
+    x_axs = _unit_norms(numpy.cross(y_axs, z_axs))
+
+    # Local position, as in `_local_position`
+    xyzs4 = (xyzs1 +
+             dists * numpy.sin(angs) * numpy.sin(dihs) * x_axs +
+             dists * numpy.sin(angs) * numpy.cos(dihs) * y_axs +
+             dists * numpy.cos(angs) * z_axs)
+
+    return xyzs4
+
+
+def _unit_norms(xyzs, thresh=1e-7):
+    """ Normalize a stack of vectors along the last axis, leaving vectors
+        with norms below `thresh` as zero (cf. `unit_perpendicular`).
+    """
+    norms = numpy.linalg.norm(xyzs, axis=-1, keepdims=True)
+    uxyzs = numpy.zeros(numpy.broadcast(xyzs, norms).shape)
+    numpy.divide(xyzs, norms, out=uxyzs, where=norms > thresh)
+    return uxyzs
+
+
 def _local_position(dist=0., ang=0., dih=0.):
     """ Determine the xyz coordinates of a point in the local axis frame
         defined by a set of internal coordinates.
@@ -298,6 +353,67 @@ def dihedral_angle(xyz1, xyz2, xyz3, xyz4):
     return dih
 
 
+def distance_array(xyzs1, xyzs2):
+    """ Vectorized version of `distance`, measuring the distances between two
+        stacks of points along their last axis.
+
+        :param xyzs1: 3D vectors to point 1
+        :type xyzs1: numpy.ndarray of shape (..., 3)
+        :param xyzs2: 3D vectors to point 2
+        :type xyzs2: numpy.ndarray of shape (..., 3)
+        :rtype: numpy.ndarray of shape (...)
+    """
+    return numpy.linalg.norm(numpy.subtract(xyzs1, xyzs2), axis=-1)
+
+
+def central_angle_array(xyzs1, xyzs2, xyzs3):
+    """ Vectorized version of `central_angle`, measuring the angles inscribed
+        by stacks of three points along their last axis.
+
+        :param xyzs1: 3D vectors to point 1
+        :type xyzs1: numpy.ndarray of shape (..., 3)
+        :param xyzs2: 3D vectors to point 2
+        :type xyzs2: numpy.ndarray of shape (..., 3)
+        :param xyzs3: 3D vectors to point 3
+        :type xyzs3: numpy.ndarray of shape (..., 3)
+        :rtype: numpy.ndarray of shape (...)
+    """
+    uxyzs21 = _unit_norms(numpy.subtract(xyzs1, xyzs2))
+    uxyzs23 = _unit_norms(numpy.subtract(xyzs3, xyzs2))
+    coss = numpy.clip(numpy.sum(uxyzs21 * uxyzs23, axis=-1), -1., 1.)
+    return numpy.arccos(coss)
+
+
+def dihedral_angle_array(xyzs1, xyzs2, xyzs3, xyzs4):
+    """ Vectorized version of `dihedral_angle`, measuring the dihedral angles
+        defined by stacks of four points along their last axis.
+
+        :param xyzs1: 3D vectors to point 1
+        :type xyzs1: numpy.ndarray of shape (..., 3)
+        :param xyzs2: 3D vectors to point 2
+        :type xyzs2: numpy.ndarray of shape (..., 3)
+        :param xyzs3: 3D vectors to point 3
+        :type xyzs3: numpy.ndarray of shape (..., 3)
+        :param xyzs4: 3D vectors to point 4
+        :type xyzs4: numpy.ndarray of shape (..., 3)
+        :rtype: numpy.ndarray of shape (...)
+    """
+    uxyzs21 = _unit_norms(numpy.subtract(xyzs1, xyzs2))
+    uxyzs23 = _unit_norms(numpy.subtract(xyzs3, xyzs2))
+    uxyzs34 = _unit_norms(numpy.subtract(xyzs4, xyzs3))
+    uxyzs123_perp = _unit_norms(numpy.cross(uxyzs21, uxyzs23))
+    uxyzs234_perp = _unit_norms(numpy.cross(-uxyzs23, uxyzs34))
+    coss = numpy.clip(
+        numpy.sum(uxyzs123_perp * uxyzs234_perp, axis=-1), -1., 1.)
+
+    # Get the sign of the angle
+    vals = numpy.sum(uxyzs123_perp * uxyzs34, axis=-1)
+    signs = numpy.where(vals < 0., 1., -1.)
+
+    dihs = numpy.mod(signs * numpy.arccos(coss), 2*numpy.pi)
+    return dihs
+
+
 # transformations
 def rotater(axis, angle, orig_xyz=None):
     """ A function to rotate vectors about an axis at a particular point.
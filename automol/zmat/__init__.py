@@ -32,6 +32,7 @@ from automol.vmat import standard_name_matrix
 # # constructors
 from automol.zmat.base._core import from_data
 from automol.zmat.base._core import from_geometry
+from automol.zmat.base._core import value_matrices_from_coordinates
 # # getters
 from automol.zmat.base._core import value_matrix
 from automol.zmat.base._core import value_dictionary
@@ -83,6 +84,7 @@ from automol.zmat._conv import connectivity_graph
 from automol.zmat._conv import geometry
 from automol.zmat._conv import geometry_with_conversion_info
 from automol.zmat._conv import geometry_with_dummy_atoms
+from automol.zmat._conv import geometries
 # # derived properties
 from automol.zmat._conv import distance
 from automol.zmat._conv import central_angle
@@ -125,6 +127,7 @@ __all__ = [
     # # constructors
     'from_data',
     'from_geometry',
+    'value_matrices_from_coordinates',
     # # getters
     'value_matrix',
     'value_dictionary',
@@ -176,6 +179,7 @@ __all__ = [
     'geometry',
     'geometry_with_conversion_info',
     'geometry_with_dummy_atoms',
+    'geometries',
     # # derived properties
     'distance',
     'central_angle',
@@ -114,23 +114,55 @@ def geometry_with_dummy_atoms(zma):
     """
 
     syms = symbols(zma)
+    xyzs, = geometries(zma, [value_matrix(zma)])
+
+    geo = automol.geom.from_data(syms, xyzs)
+
+    return geo
+
+
+def geometries(zma, val_mats, dummy=True):
+    """ Convert a stack of value matrices for a Z-Matrix into Cartesian
+        coordinates in a single vectorized pass.
+
+        All value matrices share the symbols and key matrix of `zma`. Atoms
+        are placed one at a time, as in `geometry_with_dummy_atoms`, but each
+        placement is done for every value matrix at once.
+
+        :param zma: Z-Matrix
+        :type zma: automol Z-Matrix data structure
+        :param val_mats: value matrices, in bohr and radians; entries without
+            a coordinate may be None or NaN
+        :type val_mats: numpy.ndarray of shape (M, N, 3)
+        :param dummy: include dummy atoms in the coordinates?
+        :type dummy: bool
+        :returns: the Cartesian coordinates for each value matrix, in bohr
+        :rtype: numpy.ndarray of shape (M, N, 3)
+    """
 
-    natms = len(syms)
     key_mat = key_matrix(zma)
-    val_mat = value_matrix(zma)
+    nmats = len(val_mats)
+    val_mats = numpy.reshape(
+        numpy.array(val_mats, dtype=float), (nmats, -1, 3))
+    natms = numpy.shape(val_mats)[1]
+    assert natms == len(key_mat), (
+        f"Value matrices have {natms} rows, but the Z-Matrix has "
+        f"{len(key_mat)}")
 
-    xyzs = numpy.zeros((natms, 3))
+    xyzs = numpy.zeros((nmats, natms, 3))
 
     for key in range(1, natms):
-        vals = val_mat[key][:min(key, 3)]
+        vals = val_mats[:, key, :min(key, 3)]
         keys = key_mat[key][:min(key, 3)]
-        ref_xyzs = xyzs[list(keys)]
-        xyz = util.vec.from_internals(*itertools.chain(*zip(vals, ref_xyzs)))
-        xyzs[key] = xyz
+        ref_xyzs = [xyzs[:, k] for k in keys]
+        xyzs[:, key] = util.vec.from_internals_array(
+            *itertools.chain(*zip(numpy.transpose(vals), ref_xyzs)))
 
-    geo = automol.geom.from_data(syms, xyzs)
+    if not dummy:
+        keys = [k for k, s in enumerate(symbols(zma)) if s != 'X']
+        xyzs = xyzs[:, keys]
 
-    return geo
+    return xyzs
 
 
 # # derived properties
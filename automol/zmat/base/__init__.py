@@ -25,6 +25,7 @@ from automol.vmat import standard_name_matrix
 # # constructors
 from automol.zmat.base._core import from_data
 from automol.zmat.base._core import from_geometry
+from automol.zmat.base._core import value_matrices_from_coordinates
 # # getters
 from automol.zmat.base._core import value_matrix
 from automol.zmat.base._core import value_dictionary
@@ -91,6 +92,7 @@ __all__ = [
     # # constructors
     'from_data',
     'from_geometry',
+    'value_matrices_from_coordinates',
     # # getters
     'value_matrix',
     'value_dictionary',
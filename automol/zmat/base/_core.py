@@ -79,6 +79,46 @@ def from_geometry(vma, geo):
     return zma
 
 
+def value_matrices_from_coordinates(vma, xyzs):
+    """ Build the Z-Matrix value matrices for a stack of Cartesian
+        coordinates, such as an optimization trajectory or a set of scan
+        points, in a single vectorized pass.
+
+        This is the vectorized counterpart of `from_geometry`, returning only
+        the values.
+
+        :param vma: V-Matrix
+        :type vma: automol V-Matrix data structure
+        :param xyzs: Cartesian coordinates, in bohr, with atoms in the order
+            of the V-Matrix rows
+        :type xyzs: numpy.ndarray of shape (M, N, 3)
+        :returns: value matrices in bohr and radians, with NaN for entries
+            without a coordinate
+        :rtype: numpy.ndarray of shape (M, N, 3)
+    """
+    key_mat = numpy.array(key_matrix(vma), dtype=float)
+    xyzs = numpy.asarray(xyzs, dtype=float)
+    nmats, natms, _ = numpy.shape(xyzs)
+    assert natms == len(key_mat), (
+        f"Coordinates have {natms} atoms, but the V-Matrix has "
+        f"{len(key_mat)}")
+
+    val_mats = numpy.full((nmats, natms, 3), numpy.nan)
+    if natms > 1:
+        key_mat = numpy.nan_to_num(key_mat).astype(int)
+        xyzs0 = xyzs
+        xyzs1, xyzs2, xyzs3 = (xyzs[:, key_mat[:, col]] for col in range(3))
+
+        val_mats[:, 1:, 0] = util.vec.distance_array(
+            xyzs0[:, 1:], xyzs1[:, 1:])
+        val_mats[:, 2:, 1] = util.vec.central_angle_array(
+            xyzs0[:, 2:], xyzs1[:, 2:], xyzs2[:, 2:])
+        val_mats[:, 3:, 2] = util.vec.dihedral_angle_array(
+            xyzs0[:, 3:], xyzs1[:, 3:], xyzs2[:, 3:], xyzs3[:, 3:])
+
+    return val_mats
+
+
 # # getters
 def value_matrix(zma, angstrom=False, degree=False):
     """ Obtain the value matrix of the Z-Matrix that contains the
@@ -1,7 +1,9 @@
 """ <fill in this module docstring>
 """
 from autoreact import params
+from autoreact import rates
 
 __all__ = [
     'params',
+    'rates',
 ]
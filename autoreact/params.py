@@ -401,3 +401,463 @@ class RxnParams:
             dup_counts['lind'] = 0
 
         return dups, dup_counts
+
+
+FORMS = ('arr', 'plog', 'cheb', 'troe', 'lind')
+
+# Columns holding one entry per block (i.e., per functional form expression)
+BLOCK_COLS = {
+    'arr': ('arr_collids',),
+    'plog': (),
+    'cheb': ('cheb_tlims', 'cheb_plims', 'cheb_shapes', 'cheb_one_atm_arrs'),
+    'troe': ('troe_dcts',),
+    'lind': ('lind_dcts',),
+}
+# Nested levels of variable-length columns below each block, given as
+# (offsets column, value columns); the values of one level are indexed by
+# the offsets of the next
+RAGGED_COLS = {
+    'arr': (('arr_offsets', ('arr_params',)),),
+    'plog': (('plog_offsets', ('plog_pressures',)),
+             ('plog_arr_offsets', ('plog_params',))),
+    'cheb': (('cheb_offsets', ('cheb_alphas',)),),
+    'troe': (),
+    'lind': (),
+}
+
+
+class RxnParamsSet:
+    """ Stores the parameters of many reactions, such as those of a whole
+        mechanism, in contiguous Numpy arrays instead of one RxnParams object
+        per reaction
+
+        Each functional form expression of a reaction is a block. The blocks
+        of reaction i for some form are blocks <form>_rxn_offsets[i] to
+        <form>_rxn_offsets[i+1], the first of which is the main expression
+        and the rest of which are duplicates. The Arrhenius parameters of a
+        block are rows arr_offsets[blk] to arr_offsets[blk+1] of arr_params;
+        the pressures of a PLOG block are entries plog_offsets[blk] to
+        plog_offsets[blk+1] of plog_pressures, each of which has the rows
+        plog_arr_offsets[ent] to plog_arr_offsets[ent+1] of plog_params; and
+        the coefficient matrix of a Chebyshev block is entries
+        cheb_offsets[blk] to cheb_offsets[blk+1] of cheb_alphas, with shape
+        cheb_shapes[blk]. Troe and Lindemann blocks are stored as dcts.
+    """
+
+    def __init__(self, rxn_dcts=()):
+        """ Creates an instance of RxnParamsSet given the input dcts for each
+            reaction
+
+            :param rxn_dcts: the RxnParams arguments for each reaction
+            :type rxn_dcts: list(dct {'arr_dct': arr_dct,
+                'plog_dct': plog_dct, 'cheb_dct': cheb_dct,
+                'troe_dct': troe_dct, 'lind_dct': lind_dct})
+        """
+
+        cols = _empty_columns()
+        nrxn = 0
+        for rxn_dct in rxn_dcts:
+            for key in rxn_dct.keys():
+                assert key[:-4] in FORMS and key.endswith('_dct'), (
+                    f'rxn_dct keys should be one of "arr_dct", "plog_dct", '
+                    f'"cheb_dct", "troe_dct", or "lind_dct", not "{key}"')
+            for form in FORMS:
+                dct = rxn_dct.get(f'{form}_dct')
+                if dct is not None:
+                    _add_block(cols, nrxn, form, dct)
+            nrxn += 1
+
+        self.nrxn = nrxn
+        self._set_columns(cols)
+        self.check()
+
+    @classmethod
+    def from_params(cls, params_lst):
+        """ Creates an instance of RxnParamsSet from RxnParams objects,
+            including their duplicates
+
+            :param params_lst: the parameters for each reaction
+            :type params_lst: list(RxnParams object)
+            :rtype: RxnParamsSet object
+        """
+
+        cols = _empty_columns()
+        nrxn = 0
+        for params in params_lst:
+            if params.arr is not None:
+                _add_block(cols, nrxn, 'arr', {
+                    'arr_tuples': params.arr,
+                    'arr_collid': getattr(params, 'arr_collid', None)})
+            for form in FORMS[1:]:
+                dct = getattr(params, form)
+                dups = getattr(params, f'{form}_dups')
+                dcts = ([] if dct is None else [dct]) + list(dups or ())
+                for dct in dcts:
+                    _add_block(cols, nrxn, form, dct)
+            nrxn += 1
+
+        params_set = cls()
+        params_set.nrxn = nrxn
+        params_set._set_columns(cols)
+        params_set.check()
+        return params_set
+
+    def _set_columns(self, cols):
+        """ Converts accumulated Python lists into the column arrays
+        """
+
+        for form in FORMS:
+            ids = numpy.array(cols[form]['ids'], dtype=int)
+            setattr(self, f'{form}_rxn_offsets',
+                    _offsets(numpy.bincount(ids, minlength=self.nrxn)))
+
+        self.arr_collids = cols['arr']['collids']
+        self.arr_offsets = _offsets(cols['arr']['counts'])
+        self.arr_params = _float_array(cols['arr']['rows'], (3,), 'arr')
+
+        self.plog_offsets = _offsets(cols['plog']['counts'])
+        self.plog_pressures = _float_array(
+            cols['plog']['pressures'], (), 'PLOG pressure')
+        self.plog_arr_offsets = _offsets(cols['plog']['row_counts'])
+        self.plog_params = _float_array(cols['plog']['rows'], (3,), 'PLOG')
+
+        self.cheb_tlims = _float_array(cols['cheb']['tlims'], (2,), 'tlim')
+        self.cheb_plims = _float_array(cols['cheb']['plims'], (2,), 'plim')
+        self.cheb_shapes = numpy.array(
+            cols['cheb']['shapes'], dtype=int).reshape(-1, 2)
+        self.cheb_offsets = _offsets(numpy.prod(self.cheb_shapes, axis=1))
+        self.cheb_alphas = _float_array(
+            [val for alpha in cols['cheb']['alphas'] for val in alpha], (),
+            'Cheb alpha')
+        self.cheb_one_atm_arrs = cols['cheb']['one_atm_arrs']
+
+        self.troe_dcts = cols['troe']['dcts']
+        self.lind_dcts = cols['lind']['dcts']
+
+    def __len__(self):
+        return self.nrxn
+
+    def __getitem__(self, idx):
+        return self.params(idx)
+
+    def __iter__(self):
+        return (self.params(idx) for idx in range(self.nrxn))
+
+    def blocks(self, form, idx):
+        """ The indices of the blocks of some form for one reaction
+
+            :param form: the functional form ('arr', 'plog', etc.)
+            :type form: str
+            :param idx: the index of the reaction
+            :type idx: int
+            :rtype: range
+        """
+
+        idx = range(self.nrxn)[idx]
+        rxn_offsets = getattr(self, f'{form}_rxn_offsets')
+        return range(rxn_offsets[idx], rxn_offsets[idx + 1])
+
+    def params(self, idx):
+        """ Get the RxnParams object for one reaction, without copying or
+            re-checking the stored parameters
+
+            :param idx: the index of the reaction
+            :type idx: int
+            :rtype: RxnParams object
+        """
+
+        params = RxnParams()
+
+        blks = self.blocks('arr', idx)
+        if blks:
+            start = self.arr_offsets[blks.start]
+            stop = self.arr_offsets[blks.stop]
+            params.arr = tuple(
+                map(tuple, self.arr_params[start:stop].tolist()))
+            params.arr_collid = self.arr_collids[blks.start]
+
+        for form, block_dct in (('plog', self._plog_dct),
+                                ('cheb', self._cheb_dct),
+                                ('troe', self.troe_dcts.__getitem__),
+                                ('lind', self.lind_dcts.__getitem__)):
+            dcts = [block_dct(blk) for blk in self.blocks(form, idx)]
+            if dcts:
+                setattr(params, form, dcts[0])
+                setattr(params, f'{form}_dups', dcts[1:] or None)
+
+        return params
+
+    def _plog_dct(self, blk):
+        """ The PLOG dct for one block
+        """
+
+        plog_dct = {}
+        for ent in range(self.plog_offsets[blk], self.plog_offsets[blk + 1]):
+            start = self.plog_arr_offsets[ent]
+            stop = self.plog_arr_offsets[ent + 1]
+            plog_dct[float(self.plog_pressures[ent])] = tuple(
+                map(tuple, self.plog_params[start:stop].tolist()))
+        return plog_dct
+
+    def _cheb_dct(self, blk):
+        """ The Chebyshev dct for one block; alpha is a view into the columns
+        """
+
+        start = self.cheb_offsets[blk]
+        stop = self.cheb_offsets[blk + 1]
+        return {'tlim': tuple(self.cheb_tlims[blk].tolist()),
+                'plim': tuple(self.cheb_plims[blk].tolist()),
+                'alpha': self.cheb_alphas[start:stop].reshape(
+                    self.cheb_shapes[blk]),
+                'one_atm_arr': self.cheb_one_atm_arrs[blk]}
+
+    def check(self):
+        """ Ensures that the columns of all reactions are consistent, with
+            vectorized checks in place of the per-reaction checks of RxnParams
+        """
+
+        for form in FORMS:
+            nblk = _check_offsets(
+                getattr(self, f'{form}_rxn_offsets'), self.nrxn, form)
+            for col in BLOCK_COLS[form]:
+                assert len(getattr(self, col)) == nblk, (
+                    f'{col} should have one entry per {form} block')
+            # Each level of offsets has one entry per item of the level above
+            nitems = nblk
+            for offsets_col, value_cols in RAGGED_COLS[form]:
+                offsets = getattr(self, offsets_col)
+                nitems = _check_offsets(offsets, nitems, offsets_col)
+                for col in value_cols:
+                    assert len(getattr(self, col)) == nitems, (
+                        f'{offsets_col} is inconsistent with {col}')
+
+        assert numpy.all(self.cheb_shapes > 0), (
+            'Cheb alpha should have at least one row and column')
+        assert numpy.array_equal(numpy.prod(self.cheb_shapes, axis=1),
+                                 numpy.diff(self.cheb_offsets)), (
+            'Cheb alpha sizes are inconsistent with their shapes')
+
+        # The collider and Troe/Lindemann checks are not vectorized, since
+        # these are held as dcts
+        params = RxnParams()
+        for collid in self.arr_collids:
+            if collid is not None:
+                params.check_collid(collid)
+        for troe_dct in self.troe_dcts:
+            params.check_troe(troe_dct)
+        for lind_dct in self.lind_dcts:
+            params.check_lind(lind_dct)
+
+    def get_existing_forms(self):
+        """ Determine which functional forms each reaction has
+
+            :return form_masks: whether or not each reaction has each form
+            :rtype: dct {form: numpy.ndarray(bool)}
+        """
+
+        return {form: numpy.diff(getattr(self, f'{form}_rxn_offsets')) > 0
+                for form in FORMS}
+
+    def combine_objects(self, other_set, idxs=None):
+        """ Combines the reactions of another RxnParamsSet with those of the
+            current one, as duplicates. This is the vectorized equivalent of
+            calling RxnParams.combine_objects for each reaction.
+
+            :param other_set: the parameters to be added; each reaction should
+                only have one functional form
+            :type other_set: RxnParamsSet object
+            :param idxs: the reaction in the current set that each reaction of
+                the other set is added to; by default, the one at the same
+                position
+            :type idxs: list(int)
+        """
+
+        idxs = (numpy.arange(len(other_set)) if idxs is None else
+                numpy.asarray(idxs, dtype=int))
+        assert len(idxs) == len(other_set), (
+            f'There should be one index per reaction to be added, not '
+            f'{len(idxs)} for {len(other_set)} reactions')
+        assert numpy.all((idxs >= 0) & (idxs < self.nrxn)), (
+            'Indices of the reactions to be added to are out of range')
+        form_counts = sum(map(numpy.asarray,
+                              other_set.get_existing_forms().values()))
+        assert numpy.all(form_counts == 1), (
+            'The reactions to be appended should only have one functional '
+            'form each')
+
+        for form in FORMS:
+            rxn_offsets1 = getattr(self, f'{form}_rxn_offsets')
+            rxn_offsets2 = getattr(other_set, f'{form}_rxn_offsets')
+            ids = numpy.concatenate(
+                [_block_ids(rxn_offsets1), idxs[_block_ids(rxn_offsets2)]])
+            # The stable sort keeps the existing blocks first
+            order = numpy.argsort(ids, kind='stable')
+            setattr(self, f'{form}_rxn_offsets',
+                    _offsets(numpy.bincount(ids, minlength=self.nrxn)))
+
+            for col in BLOCK_COLS[form]:
+                setattr(self, col, _take(
+                    _concat(getattr(self, col), getattr(other_set, col)),
+                    order))
+
+            for offsets_col, value_cols in RAGGED_COLS[form]:
+                offsets1 = getattr(self, offsets_col)
+                offsets2 = getattr(other_set, offsets_col)
+                offsets = numpy.concatenate(
+                    [offsets1, offsets2[1:] + offsets1[-1]])
+                order, offsets = _ragged_take(offsets, order)
+                setattr(self, offsets_col, offsets)
+                for col in value_cols:
+                    setattr(self, col, _take(
+                        _concat(getattr(self, col), getattr(other_set, col)),
+                        order))
+
+    def check_for_dups(self):
+        """ Checks every reaction for unusual cases of duplicates, as in
+            RxnParams.check_for_dups
+
+            :return dups: whether or not any duplicates are present
+            :rtype: numpy.ndarray(bool)
+            :return dup_counts: number of duplicates for each form (excluding
+                Arrhenius)
+            :rtype: dct {'plog': numpy.ndarray(int), 'cheb': ...,
+                'troe': ..., 'lind': ...}
+        """
+
+        form_masks = self.get_existing_forms()
+        dup_counts = {
+            form: numpy.maximum(
+                numpy.diff(getattr(self, f'{form}_rxn_offsets')) - 1, 0)
+            for form in FORMS[1:]}
+
+        dups = sum(map(numpy.asarray, form_masks.values())) > 1
+        for counts in dup_counts.values():
+            dups |= counts > 0
+
+        return dups, dup_counts
+
+
+def _empty_columns():
+    """ Python lists for accumulating the columns of each form
+    """
+
+    return {
+        'arr': {'ids': [], 'collids': [], 'counts': [], 'rows': []},
+        'plog': {'ids': [], 'counts': [], 'pressures': [], 'row_counts': [],
+                 'rows': []},
+        'cheb': {'ids': [], 'tlims': [], 'plims': [], 'shapes': [],
+                 'alphas': [], 'one_atm_arrs': []},
+        'troe': {'ids': [], 'dcts': []},
+        'lind': {'ids': [], 'dcts': []},
+    }
+
+
+def _add_block(cols, idx, form, dct):
+    """ Add the parameters of one functional form expression to the columns
+    """
+
+    form_cols = cols[form]
+    form_cols['ids'].append(idx)
+    if form == 'arr':
+        for key in dct.keys():
+            assert key in ('arr_tuples', 'arr_collid'), (
+                f'arr_dct keys should be "arr_tuples" or "arr_collid"'
+                f', not "{key}"')
+        arr_tuples = dct['arr_tuples']
+        form_cols['collids'].append(dct.get('arr_collid'))
+        form_cols['counts'].append(len(arr_tuples))
+        form_cols['rows'].extend(arr_tuples)
+    elif form == 'plog':
+        assert isinstance(dct, dict)
+        plog_items = [(pressure, arr_tuples)
+                      for pressure, arr_tuples in dct.items()
+                      if pressure != 'high']
+        form_cols['counts'].append(len(plog_items))
+        for pressure, arr_tuples in plog_items:
+            form_cols['pressures'].append(pressure)
+            form_cols['row_counts'].append(len(arr_tuples))
+            form_cols['rows'].extend(arr_tuples)
+    elif form == 'cheb':
+        alpha = numpy.asarray(dct['alpha'])
+        assert alpha.ndim == 2, (
+            f'Cheb alpha should be a matrix, not shape {alpha.shape}')
+        form_cols['tlims'].append(dct['tlim'])
+        form_cols['plims'].append(dct['plim'])
+        form_cols['shapes'].append(alpha.shape)
+        form_cols['alphas'].append(alpha.ravel())
+        one_atm_arr = dct.get('one_atm_arr')
+        if one_atm_arr is not None:
+            RxnParams().check_arr(one_atm_arr)
+        form_cols['one_atm_arrs'].append(one_atm_arr)
+    else:
+        form_cols['dcts'].append(dct)
+
+
+def _float_array(vals, shape, name):
+    """ Convert a list of values to a float array, ensuring that they are all
+        numbers of the given shape
+    """
+
+    arr = numpy.array(vals) if len(vals) else numpy.zeros((0,) + shape)
+    assert arr.shape[1:] == shape, (
+        f'Each {name} entry should have shape {shape}, not {arr.shape[1:]}')
+    assert arr.dtype.kind in 'iuf', (
+        f'Each {name} param should be a float or an int')
+    return arr.astype(float)
+
+
+def _offsets(counts):
+    """ Offsets into a flat array, given the count for each item
+    """
+
+    return numpy.concatenate([[0], numpy.cumsum(counts, dtype=int)])
+
+
+def _check_offsets(offsets, nitems, name):
+    """ Ensure offsets have one entry per item, returning the total count
+    """
+
+    assert len(offsets) == nitems + 1 and offsets[0] == 0, (
+        f'{name} offsets should have one entry per item')
+    assert numpy.all(numpy.diff(offsets) >= 0), (
+        f'{name} offsets should be non-decreasing')
+    return int(offsets[-1])
+
+
+def _block_ids(rxn_offsets):
+    """ The reaction index for each block
+    """
+
+    return numpy.repeat(numpy.arange(len(rxn_offsets) - 1),
+                        numpy.diff(rxn_offsets))
+
+
+def _ragged_take(offsets, idxs):
+    """ Select and reorder the items of a variable-length column
+
+        :returns: indices of the selected values, and their new offsets
+    """
+
+    counts = numpy.diff(offsets)[idxs]
+    new_offsets = _offsets(counts)
+    val_idxs = (numpy.repeat(offsets[:-1][idxs] - new_offsets[:-1], counts) +
+                numpy.arange(new_offsets[-1]))
+    return val_idxs, new_offsets
+
+
+def _concat(col1, col2):
+    """ Concatenate two columns, either lists or arrays
+    """
+
+    if isinstance(col1, list):
+        return col1 + col2
+    return numpy.concatenate([col1, col2])
+
+
+def _take(col, idxs):
+    """ Select and reorder entries of a column, either a list or an array
+    """
+
+    if isinstance(col, list):
+        return [col[idx] for idx in idxs]
+    return col[idxs]
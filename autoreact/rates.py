@@ -0,0 +1,365 @@
+""" Evaluate rate constants from RxnParams objects
+
+    Rate constants are evaluated on the grid of a temperature array (in K)
+    and a pressure array (in atm), returning arrays of shape (nT, nP).
+    Arrhenius activation energies are in the units given by `ea_units`, and
+    concentrations of the bath gas are in mol/cm^3, as in CHEMKIN.
+"""
+
+import numpy
+from numpy.polynomial import chebyshev as npcheb
+
+
+# Gas constant in the units of the activation energy (per K)
+RC_DCT = {
+    'cal/mole': 1.98720425864083,
+    'kcal/mole': 1.98720425864083e-3,
+    'J/mole': 8.31446261815324,
+    'kJ/mole': 8.31446261815324e-3,
+    'K': 1.,
+}
+# Gas constant in cm^3 atm / (mol K), for bath gas concentrations
+RC_CM3_ATM = 82.0573661
+
+
+# single functional forms
+def arrhenius(arr_tuples, temps, ea_units='cal/mole'):
+    """ Evaluate a sum of modified Arrhenius expressions,
+        k = sum(A T^n exp(-Ea/RT)).
+
+        :param arr_tuples: Arrhenius parameters
+        :type arr_tuples: tuple(tuple(float))
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param ea_units: units of the activation energies
+        :type ea_units: str
+        :return: rate constants
+        :rtype: numpy.ndarray of the same shape as temps
+    """
+    temps = numpy.asarray(temps, dtype=float)
+    arr_mat = numpy.reshape(numpy.array(arr_tuples, dtype=float), (-1, 3))
+    a_vals, n_vals, ea_vals = (arr_mat[:, idx, numpy.newaxis]
+                               for idx in range(3))
+    log_temps = numpy.log(temps.ravel())[numpy.newaxis, :]
+    inv_temps = 1. / temps.ravel()[numpy.newaxis, :]
+    ktps = a_vals * numpy.exp(
+        n_vals * log_temps - ea_vals * inv_temps / RC_DCT[ea_units])
+    return numpy.reshape(numpy.sum(ktps, axis=0), temps.shape)
+
+
+def plog(plog_dct, temps, pressures, ea_units='cal/mole'):
+    """ Evaluate a PLOG expression, interpolating log(k) linearly in log(P)
+        between the given pressures. Outside of the given pressures, the
+        rate constants at the nearest pressure are used.
+
+        :param plog_dct: dct describing PLOG parameters
+        :type plog_dct: dct {pressure1: arr_tuples1, pressure2: ...}
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :param ea_units: units of the activation energies
+        :type ea_units: str
+        :return: rate constants
+        :rtype: numpy.ndarray of shape (nT, nP)
+    """
+    temps = numpy.ravel(temps).astype(float)
+    pressures = numpy.ravel(pressures).astype(float)
+
+    plog_prs = sorted(pressure for pressure in plog_dct
+                      if pressure != 'high')
+    log_plog_prs = numpy.log(plog_prs)
+    # Rate constants at each PLOG pressure, (nT, nPLOG)
+    log_ktps = numpy.log(numpy.stack(
+        [arrhenius(plog_dct[pressure], temps, ea_units=ea_units)
+         for pressure in plog_prs], axis=-1))
+
+    if len(plog_prs) == 1:
+        return numpy.repeat(numpy.exp(log_ktps), len(pressures), axis=1)
+
+    # For each pressure, find the bracketing PLOG pressures and interpolate
+    log_prs = numpy.clip(numpy.log(pressures), log_plog_prs[0],
+                         log_plog_prs[-1])
+    upp_idxs = numpy.clip(numpy.searchsorted(log_plog_prs, log_prs), 1,
+                          len(plog_prs) - 1)
+    low_idxs = upp_idxs - 1
+    wgts = ((log_prs - log_plog_prs[low_idxs]) /
+            (log_plog_prs[upp_idxs] - log_plog_prs[low_idxs]))
+    log_ktps = ((1. - wgts) * log_ktps[:, low_idxs] +
+                wgts * log_ktps[:, upp_idxs])
+    return numpy.exp(log_ktps)
+
+
+def chebyshev(cheb_dct, temps, pressures):
+    """ Evaluate a Chebyshev expression,
+        log10(k) = sum_ij alpha_ij phi_i(T~) phi_j(P~).
+
+        :param cheb_dct: dct describing Chebyshev parameters
+        :type cheb_dct: dct {'tlim': (tmin, tmax), 'plim': (pmin, pmax),
+            'alpha': matrix of Cheb coefficients}
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :return: rate constants
+        :rtype: numpy.ndarray of shape (nT, nP)
+    """
+    red_temps, red_prs = _chebyshev_reduced_coordinates(
+        cheb_dct['tlim'], cheb_dct['plim'], temps, pressures)
+    alpha = numpy.array(cheb_dct['alpha'], dtype=float)
+    return 10. ** npcheb.chebgrid2d(red_temps, red_prs, alpha)
+
+
+def troe(troe_dct, temps, pressures, mix_dct=None, ea_units='cal/mole'):
+    """ Evaluate a Troe falloff expression.
+
+        :param troe_dct: dct describing Troe parameters
+        :type troe_dct: dct {'highp_arr': highp_arr_tuples,
+            'lowp_arr': lowp_arr_tuples,
+            'troe_params': [alpha, T***, T*, T**],
+            'collid': {spc1: eff1, spc2: ...}}
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :param mix_dct: mole fractions of the bath gas species; if None, the
+            bath gas is taken to have an efficiency of 1
+        :type mix_dct: dict[str: float]
+        :param ea_units: units of the activation energies
+        :type ea_units: str
+        :return: rate constants
+        :rtype: numpy.ndarray of shape (nT, nP)
+    """
+    temps = numpy.ravel(temps).astype(float)[:, numpy.newaxis]
+    alpha, ts3, ts1 = troe_dct['troe_params'][:3]
+    ts2 = (troe_dct['troe_params'][3]
+           if len(troe_dct['troe_params']) > 3 else None)
+
+    f_cent = (1. - alpha) * numpy.exp(-temps / ts3) + alpha * numpy.exp(
+        -temps / ts1)
+    if ts2 is not None:
+        f_cent = f_cent + numpy.exp(-ts2 / temps)
+    log_f_cent = numpy.log10(f_cent)
+
+    ktps_high, red_prs = _falloff_reduced_pressures(
+        troe_dct, temps[:, 0], pressures, mix_dct=mix_dct, ea_units=ea_units)
+    log_red_prs = numpy.log10(red_prs)
+    c_vals = -0.4 - 0.67 * log_f_cent
+    n_vals = 0.75 - 1.27 * log_f_cent
+    f1_vals = (log_red_prs + c_vals) / (
+        n_vals - 0.14 * (log_red_prs + c_vals))
+    log_f_vals = log_f_cent / (1. + f1_vals ** 2)
+
+    return ktps_high * red_prs / (1. + red_prs) * 10. ** log_f_vals
+
+
+def lindemann(lind_dct, temps, pressures, mix_dct=None, ea_units='cal/mole'):
+    """ Evaluate a Lindemann falloff expression.
+
+        :param lind_dct: dct describing Lindemann parameters
+        :type lind_dct: dct {'highp_arr': highp_arr_tuples,
+            'lowp_arr': lowp_arr_tuples, 'collid': {spc1: eff1, spc2: ...}}
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :param mix_dct: mole fractions of the bath gas species; if None, the
+            bath gas is taken to have an efficiency of 1
+        :type mix_dct: dict[str: float]
+        :param ea_units: units of the activation energies
+        :type ea_units: str
+        :return: rate constants
+        :rtype: numpy.ndarray of shape (nT, nP)
+    """
+    ktps_high, red_prs = _falloff_reduced_pressures(
+        lind_dct, temps, pressures, mix_dct=mix_dct, ea_units=ea_units)
+    return ktps_high * red_prs / (1. + red_prs)
+
+
+# full reactions
+def rxn_rates(params, temps, pressures, mix_dct=None, ea_units='cal/mole'):
+    """ Evaluate the total rate constant for a RxnParams object, summing
+        over all of its functional forms and duplicates.
+
+        If the Arrhenius parameters have collider efficiencies, they are
+        taken to describe a three-body reaction, and are multiplied by the
+        effective bath gas concentration.
+
+        :param params: the reaction parameters
+        :type params: autoreact.params.RxnParams
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :param mix_dct: mole fractions of the bath gas species; if None, the
+            bath gas is taken to have an efficiency of 1
+        :type mix_dct: dict[str: float]
+        :param ea_units: units of the activation energies
+        :type ea_units: str
+        :return: rate constants
+        :rtype: numpy.ndarray of shape (nT, nP)
+    """
+    temps = numpy.ravel(temps).astype(float)
+    pressures = numpy.ravel(pressures).astype(float)
+
+    ktps = numpy.zeros((len(temps), len(pressures)))
+    if params.arr is not None:
+        ktps = ktps + arrhenius(
+            params.arr, temps, ea_units=ea_units)[:, numpy.newaxis]
+        collid = getattr(params, 'arr_collid', None)
+        if collid is not None:
+            ktps = ktps * bath_concentrations(
+                temps, pressures, collid=collid, mix_dct=mix_dct)
+    for plog_dct in _with_dups(params.plog, params.plog_dups):
+        ktps = ktps + plog(plog_dct, temps, pressures, ea_units=ea_units)
+    for cheb_dct in _with_dups(params.cheb, params.cheb_dups):
+        ktps = ktps + chebyshev(cheb_dct, temps, pressures)
+    for troe_dct in _with_dups(params.troe, params.troe_dups):
+        ktps = ktps + troe(troe_dct, temps, pressures, mix_dct=mix_dct,
+                           ea_units=ea_units)
+    for lind_dct in _with_dups(params.lind, params.lind_dups):
+        ktps = ktps + lindemann(lind_dct, temps, pressures, mix_dct=mix_dct,
+                                ea_units=ea_units)
+
+    return ktps
+
+
+def mech_rates(params_lst, temps, pressures, mix_dct=None,
+               ea_units='cal/mole'):
+    """ Evaluate the total rate constants for every reaction in a mechanism.
+
+        Reactions with only Arrhenius parameters (without colliders) are
+        evaluated together from stacked parameter arrays, as are reactions
+        with only a single Chebyshev expression that share temperature and
+        pressure limits and coefficient matrix shapes. The rest are
+        evaluated one by one with `rxn_rates()`.
+
+        :param params_lst: the parameters for each reaction
+        :type params_lst: tuple(autoreact.params.RxnParams)
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :param mix_dct: mole fractions of the bath gas species; if None, the
+            bath gas is taken to have an efficiency of 1
+        :type mix_dct: dict[str: float]
+        :param ea_units: units of the activation energies
+        :type ea_units: str
+        :return: rate constants
+        :rtype: numpy.ndarray of shape (nrxns, nT, nP)
+    """
+    params_lst = tuple(params_lst)
+    temps = numpy.ravel(temps).astype(float)
+    pressures = numpy.ravel(pressures).astype(float)
+    ktps_arr = numpy.zeros((len(params_lst), len(temps), len(pressures)))
+
+    arr_idxs = []
+    cheb_idxs_dct = {}
+    for idx, params in enumerate(params_lst):
+        forms = params.get_existing_forms()
+        dups, _ = params.check_for_dups()
+        if forms == ('arr',) and getattr(params, 'arr_collid', None) is None:
+            arr_idxs.append(idx)
+        elif forms == ('cheb',) and not dups:
+            cheb_dct = params.cheb
+            key = (tuple(cheb_dct['tlim']), tuple(cheb_dct['plim']),
+                   numpy.shape(cheb_dct['alpha']))
+            cheb_idxs_dct.setdefault(key, []).append(idx)
+        else:
+            ktps_arr[idx] = rxn_rates(params, temps, pressures,
+                                      mix_dct=mix_dct, ea_units=ea_units)
+
+    # Arrhenius: evaluate every tuple at once and sum within reactions
+    if arr_idxs:
+        arr_tuples_lst = [params_lst[idx].arr for idx in arr_idxs]
+        nums = [len(arr_tuples) for arr_tuples in arr_tuples_lst]
+        arr_mat = numpy.array(
+            [arr_tuple for arr_tuples in arr_tuples_lst
+             for arr_tuple in arr_tuples], dtype=float)
+        ktps = arr_mat[:, 0, numpy.newaxis] * numpy.exp(
+            numpy.outer(arr_mat[:, 1], numpy.log(temps)) -
+            numpy.outer(arr_mat[:, 2], 1. / temps) / RC_DCT[ea_units])
+        offsets = numpy.concatenate([[0], numpy.cumsum(nums)[:-1]])
+        ktps = numpy.add.reduceat(ktps, offsets, axis=0)
+        ktps_arr[arr_idxs] = ktps[:, :, numpy.newaxis]
+
+    # Chebyshev: contract each group's stacked coefficients with the basis
+    for (tlim, plim, _), cheb_idxs in cheb_idxs_dct.items():
+        alphas = numpy.array([params_lst[idx].cheb['alpha']
+                              for idx in cheb_idxs], dtype=float)
+        red_temps, red_prs = _chebyshev_reduced_coordinates(
+            tlim, plim, temps, pressures)
+        t_basis = npcheb.chebvander(red_temps, alphas.shape[1] - 1)
+        p_basis = npcheb.chebvander(red_prs, alphas.shape[2] - 1)
+        ktps_arr[cheb_idxs] = 10. ** numpy.einsum(
+            'rij,ti,pj->rtp', alphas, t_basis, p_basis)
+
+    return ktps_arr
+
+
+# helpers
+def bath_concentrations(temps, pressures, collid=None, mix_dct=None):
+    """ Effective bath gas concentrations, [M] = P/RT, scaled by the
+        collider efficiencies averaged over the bath gas mixture.
+
+        :param temps: temperatures (K)
+        :type temps: numpy.ndarray
+        :param pressures: pressures (atm)
+        :type pressures: numpy.ndarray
+        :param collid: collider efficiencies for various species
+        :type collid: dct
+        :param mix_dct: mole fractions of the bath gas species; if None, the
+            bath gas is taken to have an efficiency of 1
+        :type mix_dct: dict[str: float]
+        :return: concentrations (mol/cm^3)
+        :rtype: numpy.ndarray of shape (nT, nP)
+    """
+    concs = numpy.outer(1. / numpy.ravel(temps), numpy.ravel(pressures))
+    concs = concs / RC_CM3_ATM
+
+    if mix_dct is not None:
+        collid = {} if collid is None else collid
+        tot = sum(mix_dct.values())
+        eff = sum(frac * collid.get(spc, 1.)
+                  for spc, frac in mix_dct.items()) / tot
+        concs = concs * eff
+
+    return concs
+
+
+def _falloff_reduced_pressures(falloff_dct, temps, pressures, mix_dct=None,
+                               ea_units='cal/mole'):
+    """ High-pressure rate constants and reduced pressures, k0 [M] / kinf,
+        for a falloff expression
+    """
+    temps = numpy.ravel(temps).astype(float)
+    ktps_high = arrhenius(falloff_dct['highp_arr'], temps, ea_units=ea_units)
+    ktps_low = arrhenius(falloff_dct['lowp_arr'], temps, ea_units=ea_units)
+    concs = bath_concentrations(temps, pressures,
+                                collid=falloff_dct.get('collid'),
+                                mix_dct=mix_dct)
+    ktps_high = ktps_high[:, numpy.newaxis]
+    red_prs = ktps_low[:, numpy.newaxis] * concs / ktps_high
+    return ktps_high, red_prs
+
+
+def _chebyshev_reduced_coordinates(tlim, plim, temps, pressures):
+    """ Reduced temperatures and pressures, which run from -1 to 1 over the
+        limits of a Chebyshev expression
+    """
+    inv_tmin, inv_tmax = 1. / numpy.array(tlim, dtype=float)
+    log_pmin, log_pmax = numpy.log10(numpy.array(plim, dtype=float))
+    red_temps = ((2. / numpy.ravel(temps) - inv_tmin - inv_tmax) /
+                 (inv_tmax - inv_tmin))
+    red_prs = ((2. * numpy.log10(numpy.ravel(pressures)) - log_pmin -
+                log_pmax) / (log_pmax - log_pmin))
+    return red_temps, red_prs
+
+
+def _with_dups(form_dct, form_dups):
+    """ The parameters for a functional form, followed by its duplicates
+    """
+    dcts = [] if form_dct is None else [form_dct]
+    if form_dups is not None:
+        dcts.extend(form_dups)
+    return dcts
@@ -108,9 +108,66 @@ def test_lind():
     assert dups
 
 
+def test_params_set():
+    """ Tests the columnar storage of many reactions
+    """
+
+    alpha = numpy.arange(12.).reshape(4, 3)
+    rxn_dcts = [
+        {'arr_dct': {'arr_tuples': [[1e12, 1.5, 50000], [2e11, 0, 100]],
+                     'arr_collid': {'AR': 0.7}}},
+        {'plog_dct': {1.0: [[1e12, 1.5, 50000]],
+                      10.0: [[1e13, 1.0, 40000], [1e11, 0, 0]]}},
+        {'cheb_dct': {'alpha': alpha, 'tlim': (300, 2500),
+                      'plim': (0.01, 100)}},
+        {'troe_dct': {'highp_arr': [[1e12, 1.5, 50000]],
+                      'lowp_arr': [[1e12, 1.5, 50000]],
+                      'troe_params': [1.5, 8000, 100, 1000]},
+         'arr_dct': {'arr_tuples': [[1e10, 0, 0]]}},
+    ]
+    params_set = autoreact.params.RxnParamsSet(rxn_dcts)
+    assert len(params_set) == 4
+
+    # Views back to RxnParams
+    params1, params2, params3, params4 = params_set
+    assert params1.arr == ((1e12, 1.5, 50000), (2e11, 0, 100))
+    assert params1.arr_collid == {'AR': 0.7}
+    assert params2.plog == {1.0: ((1e12, 1.5, 50000),),
+                            10.0: ((1e13, 1.0, 40000), (1e11, 0, 0))}
+    assert numpy.array_equal(params3.cheb['alpha'], alpha)
+    assert params3.cheb['tlim'] == (300, 2500)
+    assert params4.get_existing_forms() == ('arr', 'troe')
+    assert params_set[-1].troe is params4.troe
+
+    dups, dup_counts = params_set.check_for_dups()
+    assert list(dups) == [False, False, False, True]
+    assert not any(dup_counts['troe'])
+
+    # Combine duplicates over the whole set
+    params_set.combine_objects(
+        autoreact.params.RxnParamsSet(rxn_dcts[:3]), idxs=[0, 2, 2])
+    params_set.check()
+    assert len(params_set[0].arr) == 4
+    assert params_set[0].arr_collid == {'AR': 0.7}
+    assert params_set[2].get_existing_forms() == ('plog', 'cheb')
+    assert len(params_set[2].cheb_dups) == 1
+    assert params_set[1].plog == params2.plog
+    dups, dup_counts = params_set.check_for_dups()
+    assert list(dups) == [False, False, True, True]
+    assert list(dup_counts['cheb']) == [0, 0, 1, 0]
+
+    # Round trip through RxnParams objects
+    params_set2 = autoreact.params.RxnParamsSet.from_params(params_set)
+    for params, params2 in zip(params_set, params_set2):
+        assert params.arr == params2.arr
+        assert params.plog == params2.plog
+        assert (params.cheb_dups is None) == (params2.cheb_dups is None)
+
+
 if __name__ == '__main__':
     test_arr()
     test_plog()
     test_cheb()
     test_troe()
     test_lind()
+    test_params_set()
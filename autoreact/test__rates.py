@@ -0,0 +1,128 @@
+""" testing autoreact rate constant evaluation
+"""
+
+import numpy
+import autoreact
+
+TEMPS = numpy.array([500., 1000., 1500., 2000.])
+PRESSURES = numpy.array([0.1, 1., 3., 10., 100.])
+RC = autoreact.rates.RC_DCT['cal/mole']
+
+ARR_DCT = {'arr_tuples': [[1e12, 1.5, 50000], [2e11, 0.5, 20000]]}
+PLOG_DCT = {1.0: [[1e12, 1.5, 50000]],
+            10.0: [[1e13, 1.2, 45000], [1e11, 0., 30000]]}
+CHEB_DCT = {
+    'alpha': numpy.array(
+        [[1.86421309e+00, 4.20602838e-01, -5.74358452e-02, -5.45222311e-05],
+         [7.61423648e+00, 7.51012552e-01, -9.23375204e-02, -8.25427040e-03],
+         [-4.89211391e-01, 5.10360005e-01, -2.71105409e-02, -1.04075446e-02],
+         [-3.93397030e-01, 2.67821927e-01, 1.58876205e-02, -6.32223880e-03],
+         [-2.15290577e-01, 7.79192168e-02, 4.05605101e-02, 3.99721924e-03],
+         [-8.40067735e-02, -2.24969601e-03, 2.50720909e-02, 5.36853083e-03]]),
+    'tlim': (300, 2500),
+    'plim': (0.01, 100)}
+TROE_DCT = {'highp_arr': [[1e14, 0., 40000]],
+            'lowp_arr': [[1e20, -1., 35000]],
+            'troe_params': [0.5, 100, 2000, 5000],
+            'collid': {'AR': 0.7, 'H2O': 6.0}}
+
+
+def _arrhenius(arr_tuples, temp):
+    return sum(a_val * temp ** n_val * numpy.exp(-ea_val / (RC * temp))
+               for a_val, n_val, ea_val in arr_tuples)
+
+
+def test_arr():
+    """ Tests Arrhenius rate constants
+    """
+    params = autoreact.params.RxnParams(arr_dct=ARR_DCT)
+    ktps = autoreact.rates.rxn_rates(params, TEMPS, PRESSURES)
+    assert ktps.shape == (len(TEMPS), len(PRESSURES))
+    for temp, ktp_row in zip(TEMPS, ktps):
+        assert numpy.allclose(ktp_row, _arrhenius(ARR_DCT['arr_tuples'], temp))
+
+
+def test_plog():
+    """ Tests PLOG rate constants
+    """
+    params = autoreact.params.RxnParams(plog_dct=PLOG_DCT)
+    ktps = autoreact.rates.rxn_rates(params, TEMPS, PRESSURES)
+    for temp, ktp_row in zip(TEMPS, ktps):
+        ktp1 = _arrhenius(PLOG_DCT[1.0], temp)
+        ktp10 = _arrhenius(PLOG_DCT[10.0], temp)
+        ktp3 = numpy.exp(numpy.log(ktp1) + numpy.log(3.) / numpy.log(10.) *
+                         (numpy.log(ktp10) - numpy.log(ktp1)))
+        assert numpy.allclose(ktp_row, [ktp1, ktp1, ktp3, ktp10, ktp10])
+
+    # Duplicates add together
+    params.combine_objects(params)
+    assert numpy.allclose(
+        autoreact.rates.rxn_rates(params, TEMPS, PRESSURES), 2 * ktps)
+
+
+def test_cheb():
+    """ Tests Chebyshev rate constants
+    """
+    params = autoreact.params.RxnParams(cheb_dct=dict(CHEB_DCT))
+    ktps = autoreact.rates.rxn_rates(params, TEMPS, PRESSURES)
+    alpha = CHEB_DCT['alpha']
+    for temp, ktp_row in zip(TEMPS, ktps):
+        for pressure, ktp in zip(PRESSURES, ktp_row):
+            red_temp = ((2. / temp - 1. / 300 - 1. / 2500) /
+                        (1. / 2500 - 1. / 300))
+            red_pr = ((2. * numpy.log10(pressure) + 2. - 2.) / 4.)
+            log_ktp = sum(
+                alpha[i, j] * numpy.cos(i * numpy.arccos(red_temp)) *
+                numpy.cos(j * numpy.arccos(red_pr))
+                for i in range(alpha.shape[0]) for j in range(alpha.shape[1]))
+            assert numpy.isclose(ktp, 10 ** log_ktp)
+
+
+def test_troe():
+    """ Tests Troe rate constants, with collider efficiencies
+    """
+    params = autoreact.params.RxnParams(troe_dct=TROE_DCT)
+    mix_dct = {'AR': 0.5, 'H2O': 0.1, 'N2': 0.4}
+    ktps = autoreact.rates.rxn_rates(params, TEMPS, PRESSURES,
+                                     mix_dct=mix_dct)
+    eff = 0.5 * 0.7 + 0.1 * 6.0 + 0.4
+    for temp, ktp_row in zip(TEMPS, ktps):
+        for pressure, ktp in zip(PRESSURES, ktp_row):
+            conc = eff * pressure / (82.0573661 * temp)
+            k_inf = _arrhenius(TROE_DCT['highp_arr'], temp)
+            red_pr = _arrhenius(TROE_DCT['lowp_arr'], temp) * conc / k_inf
+            f_cent = (0.5 * numpy.exp(-temp / 100) +
+                      0.5 * numpy.exp(-temp / 2000) +
+                      numpy.exp(-5000 / temp))
+            c_val = -0.4 - 0.67 * numpy.log10(f_cent)
+            n_val = 0.75 - 1.27 * numpy.log10(f_cent)
+            f1_val = ((numpy.log10(red_pr) + c_val) /
+                      (n_val - 0.14 * (numpy.log10(red_pr) + c_val)))
+            f_val = 10 ** (numpy.log10(f_cent) / (1 + f1_val ** 2))
+            assert numpy.isclose(ktp, k_inf * red_pr / (1 + red_pr) * f_val)
+
+
+def test_mech_rates():
+    """ Tests the batch evaluation of a mechanism
+    """
+    params_lst = [
+        autoreact.params.RxnParams(arr_dct=ARR_DCT),
+        autoreact.params.RxnParams(cheb_dct=dict(CHEB_DCT)),
+        autoreact.params.RxnParams(plog_dct=PLOG_DCT),
+        autoreact.params.RxnParams(arr_dct={'arr_tuples': [[1e10, 0., 0.]]}),
+        autoreact.params.RxnParams(cheb_dct=dict(CHEB_DCT)),
+        autoreact.params.RxnParams(troe_dct=TROE_DCT),
+    ]
+    ktps_arr = autoreact.rates.mech_rates(params_lst, TEMPS, PRESSURES)
+    assert ktps_arr.shape == (len(params_lst), len(TEMPS), len(PRESSURES))
+    for params, ktps in zip(params_lst, ktps_arr):
+        assert numpy.allclose(
+            ktps, autoreact.rates.rxn_rates(params, TEMPS, PRESSURES))
+
+
+if __name__ == '__main__':
+    test_arr()
+    test_plog()
+    test_cheb()
+    test_troe()
+    test_mech_rates()